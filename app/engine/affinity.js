@@ -0,0 +1,72 @@
+/**
+ * FERIXDI Studio — Affinity Index
+ * Чтение data/index/affinity.json (scripts/databuild/affinity.py):
+ * группа → шутки, локация → шутки, тег/категория → локации.
+ * Постинги уже отсортированы при сборке — каждый подбор это одно обращение
+ * к словарю и срез, без проходов по jokes.json / locations.json.
+ */
+
+const VERSION = 1;
+
+export class AffinityIndex {
+  constructor(index, jokes = []) {
+    if (index.version !== VERSION) throw new Error(`affinity index: version ${index.version}`);
+    this.ix = index;
+    this.jokeIds = index.jokes;
+    this.locationIds = index.locations;
+    this.viral = index.viral;
+    this._jokes = new Map(jokes.map(j => [j.id, j]));
+  }
+
+  static async load(url, jokes = []) {
+    const resp = await fetch(url);
+    if (!resp.ok) throw new Error(`affinity index: HTTP ${resp.status}`);
+    return new AffinityIndex(await resp.json(), jokes);
+  }
+
+  /** Запись шутки из jokes.json, переданного в конструктор */
+  joke(id) {
+    return this._jokes.get(id) || null;
+  }
+
+  _jokeList(table, key, limit) {
+    return (this.ix[table][key] || []).slice(0, limit).map(i => this.jokeIds[i]);
+  }
+
+  jokesForGroup(group, limit) {
+    return this._jokeList('group_jokes', group, limit);
+  }
+
+  jokesForTheme(theme, limit) {
+    return this._jokeList('theme_jokes', theme, limit);
+  }
+
+  jokesForLocation(locationId, limit) {
+    return this._jokeList('location_jokes', locationId, limit);
+  }
+
+  locationsForTag(tag, limit) {
+    return (this.ix.tag_locations[tag] || []).slice(0, limit).map(i => this.locationIds[i]);
+  }
+
+  locationsForCategory(category, limit) {
+    return (this.ix.category_locations[category] || []).slice(0, limit).map(i => this.locationIds[i]);
+  }
+
+  /** Шутки под любую из двух групп, лучший viral_score первым (слияние двух постингов) */
+  jokesForPair(groupA, groupB, limit = Infinity) {
+    const a = this.ix.group_jokes[groupA] || [];
+    const b = groupB === groupA ? [] : this.ix.group_jokes[groupB] || [];
+    const before = (x, y) => this.viral[x] > this.viral[y] || (this.viral[x] === this.viral[y] && x < y);
+    const out = [], seen = new Set();
+    let i = 0, j = 0;
+    while ((i < a.length || j < b.length) && out.length < limit) {
+      const next = j >= b.length || (i < a.length && before(a[i], b[j])) ? a[i++] : b[j++];
+      if (!seen.has(next)) {
+        seen.add(next);
+        out.push(this.jokeIds[next]);
+      }
+    }
+    return out;
+  }
+}
@@ -6,7 +6,7 @@
  */
 
 import { estimateDialogue } from './estimator.js';
-import { runAllValidations, scanBannedWords } from './validators.js';
+import { isPreCleared, runAllValidations, scanBannedWords } from './validators.js';
 import { autoTrim } from './auto_trim.js';
 import { historyCache } from './history_cache.js';
 
@@ -1837,7 +1837,8 @@ export function generate(input) {
     options = {}, seed = Date.now().toString(),
     characters = [],
     locations = [],
-    selected_location_id = null
+    selected_location_id = null,
+    affinity = null
   } = input;
 
   // ── VALIDATION ──
@@ -2016,9 +2017,11 @@ export function generate(input) {
     locationObj = locCatalog.find(l => l.id === selected_location_id);
     location = locationObj?.scene_en || FALLBACK_LOCATIONS[0];
   } else if (locCatalog) {
-    // Auto-pick from catalog: category-aware + avoid repeats
-    const catLocIds = LOCATION_CATEGORY_MAP[cat.ru] || [];
-    const catLocs = catLocIds.map(id => locCatalog.find(l => l.id === id)).filter(Boolean);
+    // Auto-pick from catalog: category-aware + avoid repeats.
+    // With data/index/affinity.json the category's locations are one lookup (category_hints)
+    const catLocIds = affinity ? affinity.locationsForCategory(cat.ru) : (LOCATION_CATEGORY_MAP[cat.ru] || []);
+    const locById = new Map(locCatalog.map(l => [l.id, l]));
+    const catLocs = catLocIds.map(id => locById.get(id)).filter(Boolean);
     const preferred = catLocs.filter(l => !historyCache.hasLocation(l.scene_en));
     if (preferred.length > 0) {
       locationObj = preferred[Math.floor(rng() * preferred.length)];
@@ -2041,6 +2044,13 @@ export function generate(input) {
     }
   }
 
+  // ── Reference jokes (affinity.json group_jokes, best viral_score first) ──
+  // Idea and suggested modes only — script, video and edited dialogue bring their own lines
+  const referenceJokes = affinity && !dialogue_override && (input_mode === 'idea' || input_mode === 'suggested')
+    ? affinity.jokesForPair(rawA.group, rawB.group, 3).map(id => affinity.joke(id)).filter(Boolean)
+      .map(j => ({ A: j.line_a, B: j.line_b }))
+    : [];
+
   // ── Lighting (location-coherent selection) ──
   // Indoor locations get indoor-compatible lighting; outdoor get outdoor-compatible
   // Check explicit indoor keywords FIRST to prevent false-positive from outdoor regex
@@ -2882,7 +2892,14 @@ ${engage.firstComment}
 
   // ── Validate ──
   const output = { photo_prompt_en_json, video_prompt_en_json, ru_package, blueprint_json };
-  const validation = runAllValidations(output, historyCache);
+  // Characters and location cleared at build time (safety stamp): only the text that did not
+  // come from them is scanned. Video/script mode keeps the full scan — its dialogue is not rewritten above
+  const recordsCleared = !isPreserveMode && isPreCleared(charA) && isPreCleared(charB)
+    && (!locationObj || isPreCleared(locationObj));
+  const validation = runAllValidations(output, historyCache, recordsCleared ? {
+    freeText: [topicRu, sceneHint, dialogueA, dialogueB, killerWord, product_info?.description_en,
+      reference_style?.description_en],
+  } : {});
 
   // ── Update history ──
   historyCache.addGeneration({
@@ -2938,6 +2955,8 @@ ${engage.firstComment}
       aesthetic, script_ru, cinematography, thread_memory,
       dialogue_override: dialogue_override || null,
       selected_location_id,
+      // Top jokes.json entries for both characters' groups (affinity.json group_jokes) — tone reference for the AI
+      reference_jokes: referenceJokes,
       // Fallback dialogue for mergeAIResult when AI doesn't return dialogue
       dialogueA, dialogueB, killerWord,
       // Remake instruction — when video reference is provided, AI must replicate it
@@ -0,0 +1,99 @@
+/**
+ * FERIXDI Studio — Binary Roster Reader
+ * Чтение data/chars/roster.bin (scripts/databuild/binroster.py):
+ * таблица уникальных строк + по строке uint32-ссылок на персонажа.
+ * Значения декодируются только при обращении — весь ростер не парсится.
+ */
+
+const MAGIC = 'FXRB';
+const VERSION = 1;
+const NONE = 0xFFFFFFFF;
+const KIND_JSON = 1;
+
+const LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] === 1;
+
+function u32View(buffer, offset, count) {
+  if (LITTLE_ENDIAN) return new Uint32Array(buffer, offset, count);
+  const dv = new DataView(buffer, offset, count * 4);
+  const out = new Uint32Array(count);
+  for (let i = 0; i < count; i++) out[i] = dv.getUint32(i * 4, true);
+  return out;
+}
+
+export class BinRoster {
+  constructor(buffer) {
+    const bytes = new Uint8Array(buffer);
+    const magic = String.fromCharCode(...bytes.subarray(0, 4));
+    if (magic !== MAGIC) throw new Error('roster.bin: bad magic');
+    const headerLen = new DataView(buffer, 4, 4).getUint32(0, true);
+    this._decoder = new TextDecoder('utf-8');
+    this.header = JSON.parse(this._decoder.decode(bytes.subarray(8, 8 + headerLen)));
+    if (this.header.version !== VERSION) throw new Error(`roster.bin: version ${this.header.version}, expected ${VERSION}`);
+
+    const { layout, records, columns, values } = this.header;
+    this.length = records;
+    this.columns = columns;
+    this._colIndex = new Map(columns.map((p, i) => [p, i]));
+    this._paths = columns.map((p) => p.split('.'));
+    this._cells = u32View(buffer, layout.cells, records * columns.length);
+    this._offsets = u32View(buffer, layout.offsets, values + 1);
+    this._kinds = bytes.subarray(layout.kinds, layout.kinds + values);
+    this._blob = bytes.subarray(layout.blob);
+    this._strings = new Map(); // pool strings repeat — decode each once
+    this._ids = null;
+  }
+
+  value(ix) {
+    if (ix === NONE) return undefined;
+    const cached = this._strings.get(ix);
+    if (cached !== undefined) return cached;
+    const raw = this._decoder.decode(this._blob.subarray(this._offsets[ix], this._offsets[ix + 1]));
+    if (this._kinds[ix] === KIND_JSON) return JSON.parse(raw);
+    this._strings.set(ix, raw);
+    return raw;
+  }
+
+  /** One leaf of record i by dotted path, e.g. 'identity_anchors.wardrobe_anchor' */
+  field(i, path) {
+    const col = this._colIndex.get(path);
+    if (col === undefined) return undefined;
+    return this.value(this._cells[i * this.columns.length + col]);
+  }
+
+  /** Record i as a plain object (same shape as characters.json) */
+  record(i) {
+    const out = {};
+    const base = i * this.columns.length;
+    this._paths.forEach((parts, col) => {
+      const ix = this._cells[base + col];
+      if (ix === NONE) return;
+      let node = out;
+      for (let k = 0; k < parts.length - 1; k++) node = node[parts[k]] ??= {};
+      node[parts[parts.length - 1]] = this.value(ix);
+    });
+    return out;
+  }
+
+  byId(id) {
+    if (!this._ids) {
+      this._ids = new Map();
+      for (let i = 0; i < this.length; i++) this._ids.set(this.field(i, 'id'), i);
+    }
+    const i = this._ids.get(id);
+    return i === undefined ? null : this.record(i);
+  }
+
+  toArray() {
+    return Array.from({ length: this.length }, (_, i) => this.record(i));
+  }
+}
+
+export function parseRoster(buffer) {
+  return new BinRoster(buffer);
+}
+
+export async function loadRoster(url) {
+  const resp = await fetch(url);
+  if (!resp.ok) throw new Error(`roster.bin: HTTP ${resp.status}`);
+  return parseRoster(await resp.arrayBuffer());
+}
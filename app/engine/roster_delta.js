@@ -0,0 +1,69 @@
+/**
+ * FERIXDI Studio — Roster Delta
+ * Обновление кэша персонажей патчами из data/chars/delta/ (scripts/databuild/delta.py):
+ * клиент со старой версией ростера качает только изменённых персонажей и поля,
+ * а не весь characters.json. Нет патча для версии — полная загрузка.
+ */
+
+const FORMAT = 1;
+
+/** JSON Merge Patch (RFC 7386): null = поле удалено */
+export function mergeApply(target, patch) {
+  if (patch === null || typeof patch !== 'object' || Array.isArray(patch)) return patch;
+  const out = (target && typeof target === 'object' && !Array.isArray(target)) ? { ...target } : {};
+  for (const [k, v] of Object.entries(patch)) {
+    if (v === null) delete out[k];
+    else out[k] = mergeApply(out[k], v);
+  }
+  return out;
+}
+
+/** Ростер версии patch.from → ростер версии patch.to */
+export function applyPatch(chars, patch) {
+  if (patch.version !== FORMAT) throw new Error(`roster patch: format ${patch.version}, expected ${FORMAT}`);
+  const removed = new Set(patch.remove);
+  let out = chars
+    .filter(c => !removed.has(c.id))
+    .map(c => (c.id in patch.patch ? mergeApply(c, patch.patch[c.id]) : c));
+  out.push(...patch.add);
+  if (patch.order) {
+    const byId = new Map(out.map(c => [c.id, c]));
+    out = patch.order.map(id => byId.get(id));
+  }
+  if (out.length !== patch.count || out.some(c => !c)) {
+    throw new Error(`roster patch ${patch.from}→${patch.to}: ${out.length} records, expected ${patch.count}`);
+  }
+  return out;
+}
+
+async function fetchJson(url) {
+  const resp = await fetch(url);
+  if (!resp.ok) throw new Error(`${url}: HTTP ${resp.status}`);
+  return resp.json();
+}
+
+/**
+ * Свести кэш к текущей версии.
+ * cached — ростер из кэша (или null), version — его версия.
+ * → { chars, version, mode: 'current' | 'patch' | 'full' }
+ * Ошибка чтения манифеста пробрасывается — вызывающий качает characters.json как раньше.
+ */
+export async function syncRoster(manifestUrl, cached, version) {
+  const manifest = await fetchJson(manifestUrl);
+  if (manifest.version !== FORMAT) throw new Error(`roster manifest: format ${manifest.version}`);
+  const current = manifest.current;
+  if (Array.isArray(cached) && version) {
+    if (version === current && cached.length === manifest.count) return { chars: cached, version, mode: 'current' };
+    const entry = manifest.patches[version];
+    if (entry) {
+      try {
+        const patch = await fetchJson(new URL(entry.file, manifestUrl));
+        return { chars: applyPatch(cached, patch), version: current, mode: 'patch' };
+      } catch (e) {
+        console.warn('Roster patch failed, full download:', e.message);
+      }
+    }
+  }
+  const chars = await fetchJson(new URL(manifest.full.file, manifestUrl));
+  return { chars, version: current, mode: 'full' };
+}
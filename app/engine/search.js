@@ -0,0 +1,133 @@
+/**
+ * FERIXDI Studio — Search
+ * Поиск по индексу data/index/search/ (scripts/databuild/search.py):
+ * персонажи, шутки, локации и разделы курса. Нормализация как при сборке —
+ * нижний регистр, ё → е, стоп-слова, стемминг Snowball для русского.
+ * Загружаются только шарды, в которые попали слова запроса.
+ */
+
+const WEIGHT_BITS = 4;
+const WEIGHT_MASK = (1 << WEIGHT_BITS) - 1;
+
+const STOPWORDS = new Set(
+  ('а без бы в во вот все всё да для до же за и из или к как ли мы на над не нет ни но о об '
+    + 'от по под при с со та то тот ты у уже что это я').replace(/ё/g, 'е').split(' ')
+);
+
+// Snowball Russian stemmer (те же регулярки, что в search.py)
+const RV_RE = /^(.*?[аеиоуыэюя])(.*)$/;
+const PERFECTIVE_GERUND = /((ив|ивши|ившись|ыв|ывши|ывшись)|((?<=[ая])(в|вши|вшись)))$/;
+const REFLEXIVE = /(с[яь])$/;
+const ADJECTIVE = /(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|ую|юю|ая|яя|ою|ею)$/;
+const PARTICIPLE = /((ивш|ывш|ующ)|((?<=[ая])(ем|нн|вш|ющ|щ)))$/;
+const VERB = /((ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю)|((?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)))$/;
+const NOUN = /(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$/;
+const DERIVATIONAL = /.*[^аеиоуыэюя]+[аеиоуыэюя].*ость?$/;
+const DER = /ость?$/;
+const SUPERLATIVE = /(ейше|ейш)$/;
+
+export function stem(word) {
+  const m = RV_RE.exec(word);
+  if (!m) return word;
+  const pre = m[1];
+  let rv = m[2];
+  let temp = rv.replace(PERFECTIVE_GERUND, '');
+  if (temp === rv) {
+    rv = rv.replace(REFLEXIVE, '');
+    temp = rv.replace(ADJECTIVE, '');
+    if (temp !== rv) {
+      rv = temp.replace(PARTICIPLE, '');
+    } else {
+      temp = rv.replace(VERB, '');
+      rv = temp === rv ? rv.replace(NOUN, '') : temp;
+    }
+  } else {
+    rv = temp;
+  }
+  rv = rv.replace(/и$/, '');
+  if (DERIVATIONAL.test(rv)) rv = rv.replace(DER, '');
+  temp = rv.replace(/ь$/, '');
+  rv = temp === rv ? rv.replace(SUPERLATIVE, '').replace(/нн$/, 'н') : temp;
+  return pre + rv;
+}
+
+/** Нормализованные термы текста (как terms() в search.py) */
+export function terms(text) {
+  const out = [];
+  for (const tok of text.toLowerCase().replace(/ё/g, 'е').match(/[0-9a-zа-я]+/g) || []) {
+    if (STOPWORDS.has(tok)) continue;
+    out.push(/[а-я]/.test(tok) ? stem(tok) : tok);
+  }
+  return out;
+}
+
+const encoder = new TextEncoder();
+
+export function fnv1a(s) {
+  let h = 0x811C9DC5;
+  for (const b of encoder.encode(s)) h = Math.imul(h ^ b, 0x01000193) >>> 0;
+  return h;
+}
+
+export class SearchIndex {
+  constructor(meta, baseUrl) {
+    this.meta = meta;
+    this.baseUrl = baseUrl;
+    this._shards = new Map(); // k → Promise<shard>
+  }
+
+  static async load(baseUrl) {
+    const resp = await fetch(new URL('meta.json', baseUrl));
+    if (!resp.ok) throw new Error(`search index: HTTP ${resp.status}`);
+    return new SearchIndex(await resp.json(), baseUrl);
+  }
+
+  _shard(k) {
+    if (!this._shards.has(k)) {
+      this._shards.set(k, fetch(new URL(`shard-${k}.json`, this.baseUrl)).then(r => {
+        if (!r.ok) throw new Error(`search shard ${k}: HTTP ${r.status}`);
+        return r.json();
+      }));
+    }
+    return this._shards.get(k);
+  }
+
+  async postings(term) {
+    const shard = await this._shard(fnv1a(term) % this.meta.shards);
+    return shard[term] || [];
+  }
+
+  /** [{ kind, id, label, score }], лучшие первыми; совпасть должны все слова запроса */
+  async search(query, { kind = null, limit = 20 } = {}) {
+    const qterms = [...new Set(terms(query))];
+    if (!qterms.length) return [];
+    const lists = (await Promise.all(qterms.map(t => this.postings(t))))
+      .map(unpack)
+      .sort((a, b) => a.length - b.length);
+    let scores = new Map(lists[0]);
+    for (const list of lists.slice(1)) {
+      if (!scores.size) break;
+      const next = new Map();
+      for (const [d, w] of list) if (scores.has(d)) next.set(d, scores.get(d) + w);
+      scores = next;
+    }
+    const { kinds, doc_kind, doc_id, doc_label } = this.meta;
+    const k = kind === null ? -1 : kinds.indexOf(kind);
+    return [...scores]
+      .filter(([d]) => k < 0 || doc_kind[d] === k)
+      .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+      .slice(0, limit)
+      .map(([d, score]) => ({ kind: kinds[doc_kind[d]], id: doc_id[d], label: doc_label[d], score }));
+  }
+}
+
+/** Дельта-кодированный постинг → [[doc, weight]] */
+export function unpack(packed) {
+  const out = new Array(packed.length);
+  let d = 0;
+  for (let i = 0; i < packed.length; i++) {
+    d += packed[i] >>> WEIGHT_BITS;
+    out[i] = [d, packed[i] & WEIGHT_MASK];
+  }
+  return out;
+}
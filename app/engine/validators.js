@@ -3,6 +3,8 @@
  * Проверка промптов и структуры по Golden Standard 2026 v2
  */
 
+import { fnv1a } from './search.js';
+
 const BANNED_WORDS = ['sexy', 'horny', 'erotic', 'nude', 'naked', 'porn', 'nsfw'];
 const REPLACEMENTS = {
   sexy: 'magnetic', horny: 'restless', erotic: 'sensual tension',
@@ -12,6 +14,17 @@ const REPLACEMENTS = {
 const BANNED_OVERLAY_WORDS = ['text overlay', 'subtitle', 'caption text', 'watermark', 'logo'];
 const DEVICE_WORDS = ['phone in hand', 'holding phone', 'camera visible', 'selfie stick', 'recording device'];
 
+// Списки — копия golden_standard.yaml hard_constraints.safety. Тег = fnv1a того же JSON
+// с сортированными ключами, что и в scripts/databuild/safety.py: запись с этим тегом
+// (или id из data/index/safety.json) уже проверена при сборке. Списки разошлись со
+// спекой — теги не совпадут и записи просто проверятся здесь.
+export const SAFETY_SPEC = fnv1a(JSON.stringify({
+  banned_words: BANNED_WORDS,
+  device_words: DEVICE_WORDS,
+  overlay_words: BANNED_OVERLAY_WORDS,
+  replacements: Object.fromEntries(Object.entries(REPLACEMENTS).sort(([a], [b]) => (a < b ? -1 : 1))),
+})).toString(16).padStart(8, '0');
+
 // v2 grid boundaries — MUST match generator.js GRID_V2
 const GRID_V2 = {
   hook:    { start: 0.0, end: 0.7 },
@@ -157,6 +170,35 @@ export function validateDeviceInvisible(prompt) {
   return { valid: warnings.length === 0, warnings };
 }
 
+export function isPreCleared(record, clearedIds = null) {
+  return !!record && (record.safety === SAFETY_SPEC || !!clearedIds?.has(record.id));
+}
+
+/**
+ * Стоп-слова во всех строках записи (персонаж, локация) + оверлеи/девайсы.
+ * Проверенные при сборке записи возвращаются как есть, без сканирования.
+ * → { record, warnings, fixes, skipped }
+ */
+export function clearRecord(record, clearedIds = null) {
+  if (isPreCleared(record, clearedIds)) return { record, warnings: [], fixes: [], skipped: true };
+  const warnings = [];
+  const fixes = [];
+  const walk = (v) => {
+    if (typeof v === 'string') {
+      const bw = scanBannedWords(v);
+      warnings.push(...bw.warnings);
+      fixes.push(...bw.fixes);
+      return bw.text;
+    }
+    if (Array.isArray(v)) return v.map(walk);
+    if (v && typeof v === 'object') return Object.fromEntries(Object.entries(v).map(([k, x]) => [k, walk(x)]));
+    return v;
+  };
+  const cleaned = walk(record);
+  warnings.push(...validateNoOverlays(record).warnings, ...validateDeviceInvisible(record).warnings);
+  return { record: fixes.length ? cleaned : record, warnings, fixes, skipped: false };
+}
+
 export function validateLocationRepeat(location, historyCache) {
   const warnings = [];
   if (historyCache && historyCache.hasLocation(location)) {
@@ -183,12 +225,23 @@ export function validateIdentityAnchors(blueprint) {
   return { valid: warnings.length === 0, warnings };
 }
 
-export function runAllValidations(output, historyCache = null) {
+/**
+ * freeText — когда персонажи и локация проверены при сборке (isPreCleared), промпты
+ * состоят из них, шаблонов и этих строк (тема, диалог, ввод пользователя): на стоп-слова
+ * сканируются только они, а не весь JSON промптов.
+ */
+export function runAllValidations(output, historyCache = null, { freeText = null } = {}) {
   const allWarnings = [];
   const allFixes = [];
 
+  if (freeText) {
+    const bw = scanBannedWords(freeText.filter(Boolean).join('\n'));
+    allWarnings.push(...bw.warnings);
+    allFixes.push(...bw.fixes);
+  }
+
   // Banned words in video prompt
-  if (output.video_prompt_en_json) {
+  if (output.video_prompt_en_json && !freeText) {
     const vText = JSON.stringify(output.video_prompt_en_json);
     const bw = scanBannedWords(vText);
     allWarnings.push(...bw.warnings);
@@ -196,7 +249,7 @@ export function runAllValidations(output, historyCache = null) {
   }
 
   // Banned words in photo prompt
-  if (output.photo_prompt_en_json) {
+  if (output.photo_prompt_en_json && !freeText) {
     const pText = JSON.stringify(output.photo_prompt_en_json);
     const bw = scanBannedWords(pText);
     allWarnings.push(...bw.warnings);
@@ -8,8 +8,15 @@ import { generate, getRandomCategory, mergeAIResult } from './engine/generator.j
 import { estimateDialogue, estimateLineDuration } from './engine/estimator.js';
 import { autoTrim } from './engine/auto_trim.js';
 import { historyCache } from './engine/history_cache.js';
+import { syncRoster } from './engine/roster_delta.js';
+import { AffinityIndex } from './engine/affinity.js';
+import { SAFETY_SPEC } from './engine/validators.js';
 import { sfx } from './engine/sounds.js';
 
+// Build outputs of scripts/build_chars.py / build_index.py (data/chars/, data/index/) are
+// fetched by path next to index.html, never bundled: vite.config.js copies them into dist
+const buildDataUrl = path => new URL(`data/${path}`, document.baseURI);
+
 // --- STATE -----------------------------------
 const state = {
   characters: [],
@@ -432,6 +439,40 @@ function initMobileMenu() {
   });
 }
 
+// --- SAFETY ----------------------------------
+// Записи, проверенные при сборке (поле safety в data/chars/characters.json, id в
+// data/index/safety.json — scripts/databuild/safety.py): generate() не сканирует их
+// на стоп-слова. Записи без отметки проверяются при генерации, не при загрузке
+let _safetyCleared = null;
+function loadSafetyCleared() {
+  if (!_safetyCleared) {
+    _safetyCleared = fetch(buildDataUrl('index/safety.json'))
+      .then(r => (r.ok ? r.json() : null))
+      .then(index => (index?.spec === SAFETY_SPEC ? index.cleared : {}))
+      .catch(() => ({}));
+  }
+  return _safetyCleared;
+}
+
+function markCleared(records, clearedIds) {
+  const ids = new Set(clearedIds || []);
+  return records.map(r => (ids.has(r.id) && r.safety !== SAFETY_SPEC ? { ...r, safety: SAFETY_SPEC } : r));
+}
+
+// --- AFFINITY --------------------------------
+// data/index/affinity.json (scripts/databuild/affinity.py) + jokes.json: generate() берёт
+// локации категории и референс-шутки пары одним обращением; без индекса — LOCATION_CATEGORY_MAP
+let _affinity = null;
+function loadAffinity() {
+  if (!_affinity) {
+    _affinity = fetch(new URL('./data/jokes.json', import.meta.url))
+      .then(r => r.json())
+      .then(jokes => AffinityIndex.load(buildDataUrl('index/affinity.json'), jokes))
+      .catch(() => null);
+  }
+  return _affinity;
+}
+
 // --- LOCATIONS -------------------------------
 async function loadLocations() {
   try {
@@ -440,6 +481,8 @@ async function loadLocations() {
     log('OK', 'ДАННЫЕ', `Загружено ${state.locations.length} локаций`);
     // Merge custom locations from server (permanent) before rendering
     await loadServerCustomLocations();
+    const cleared = await loadSafetyCleared();
+    state.locations = markCleared(state.locations, cleared.location);
     populateLocationFilters();
     renderLocations();
   } catch (e) {
@@ -686,28 +729,74 @@ async function loadCharacters() {
     }
   }
   
+  // Cold start: paint the picker from the index, the full roster follows
+  try {
+    if (await loadCharacterIndex()) {
+      refreshCharacters();
+      return;
+    }
+  } catch (e) {
+    console.warn('Character index unavailable, fetching full roster');
+  }
+
   // Fetch fresh data
   await refreshCharacters();
 }
 
+// data/chars/index.json (scripts/databuild/charindex.py): only the fields a card shows,
+// refreshCharacters() swaps in the full records
+async function loadCharacterIndex() {
+  const resp = await fetch(buildDataUrl('chars/index.json'));
+  if (!resp.ok) return false;
+  const index = await resp.json();
+  if (index.version !== 2) return false;
+  const rows = index.characters.map(row => Object.fromEntries(index.fields.map((k, i) => [k, row[i]])));
+  state.characters = rows;
+  log('OK', 'ДАННЫЕ', `Индекс: ${state.characters.length} персонажей, загружаем полные записи`);
+  populateFilters();
+  renderCharacters();
+  return true;
+}
+
 async function refreshCharacters() {
   try {
-    const resp = await fetch(new URL('./data/characters.json', import.meta.url));
-    state.characters = await resp.json();
+    const cacheKey = 'characters_v1';
+    // Delta update: cached roster + patch from data/chars/delta/ instead of the whole file
+    let synced = null;
+    try {
+      let cached = null;
+      try { cached = JSON.parse(localStorage.getItem(cacheKey) || 'null'); } catch { /* broken cache — full download */ }
+      synced = await syncRoster(buildDataUrl('chars/delta/manifest.json'),
+        cached, localStorage.getItem(`${cacheKey}_version`));
+    } catch { /* no delta manifest deployed — plain full download */ }
+    if (synced) {
+      state.characters = synced.chars;
+    } else {
+      // data/chars/characters.json — the roster stamped at build time; the curated file when it is not built
+      let resp = await fetch(buildDataUrl('chars/characters.json')).catch(() => null);
+      if (!resp?.ok) resp = await fetch(new URL('./data/characters.json', import.meta.url));
+      state.characters = await resp.json();
+    }
     
     // Update cache
-    const cacheKey = 'characters_v1';
-    localStorage.setItem(cacheKey, JSON.stringify(state.characters));
+    if (synced?.mode !== 'current') localStorage.setItem(cacheKey, JSON.stringify(state.characters));
+    if (synced) localStorage.setItem(`${cacheKey}_version`, synced.version);
+    else localStorage.removeItem(`${cacheKey}_version`);
     localStorage.setItem(`${cacheKey}_time`, Date.now().toString());
     
-    log('OK', 'ДАННЫЕ', `Загружено ${state.characters.length} персонажей`);
+    const how = synced ? { current: ', версия не изменилась', patch: ', обновлено патчем', full: '' }[synced.mode] : '';
+    log('OK', 'ДАННЫЕ', `Загружено ${state.characters.length} персонажей${how}`);
     populateFilters();
 
     // Merge custom characters: server API (permanent) + localStorage (offline fallback)
     await loadServerCustomCharacters();
     loadCustomCharacters();
+    // A pick made on an index row keeps pointing at it — swap in the full record
+    const full = id => state.characters.find(c => c.id === id);
+    if (state.selectedA) state.selectedA = full(state.selectedA.id) || state.selectedA;
+    if (state.selectedB) state.selectedB = full(state.selectedB.id) || state.selectedB;
 
-    renderCharacters();
+    renderCharacters(getCurrentFilters());
     populateSeriesSelects();
   } catch (e) {
     log('ERR', 'ДАННЫЕ', `Ошибка загрузки персонажей: ${e.message}`);
@@ -754,7 +843,8 @@ async function loadServerCustomCharacters() {
 function populateFilters() {
   const groups = [...new Set(state.characters.map(c => c.group))].sort();
   const sel = document.getElementById('char-group-filter');
-  groups.forEach(g => {
+  const have = new Set([...sel.options].map(o => o.value));
+  groups.filter(g => !have.has(g)).forEach(g => {
     const opt = document.createElement('option');
     opt.value = g; opt.textContent = g;
     sel.appendChild(opt);
@@ -1394,6 +1484,13 @@ function getCurrentFilters() {
 function autoSelectRandomPair() {
   const chars = state.characters;
   if (!chars || chars.length < 2) return false;
+  const pair = pickIndexedPair(chars);
+  if (pair) {
+    [state.selectedA, state.selectedB] = pair;
+    updateCharDisplay();
+    log('INFO', 'АВТОПОДБОР', `Пара из индекса: ${pair[0].name_ru} ? ${pair[1].name_ru}`);
+    return true;
+  }
   const idxA = Math.floor(Math.random() * chars.length);
   let idxB = Math.floor(Math.random() * (chars.length - 1));
   if (idxB >= idxA) idxB++;
@@ -1405,10 +1502,45 @@ function autoSelectRandomPair() {
 }
 
 // --- RANDOM PAIR -----------------------------
+// data/chars/pairs.json (scripts/databuild/pairing.py): top-K B partners per A character,
+// ranked by the same chemistry as calcPairChemistry(); without it pairs stay fully random
+let _pairIndex = null;
+function loadPairIndex() {
+  return fetch(buildDataUrl('chars/pairs.json'))
+    .then(r => (r.ok ? r.json() : null))
+    .then(index => { if (index?.version === 1) _pairIndex = index; })
+    .catch(() => {});
+}
+
+// Random A character, B from its precomputed partners — null until the index is loaded
+function pickIndexedPair(chars) {
+  if (!_pairIndex) return null;
+  const { k, ids, rows, partners } = _pairIndex;
+  const byId = new Map(chars.map(c => [c.id, c]));
+  const options = [];
+  ids.forEach((id, i) => {
+    const a = byId.get(id);
+    if (!a || rows[i] < 0) return;
+    const bs = partners.slice(rows[i] * k, rows[i] * k + k).filter(j => j >= 0).map(j => byId.get(ids[j])).filter(Boolean);
+    if (bs.length) options.push([a, bs]);
+  });
+  if (!options.length) return null;
+  const [a, bs] = options[Math.floor(Math.random() * options.length)];
+  return [a, bs[Math.floor(Math.random() * bs.length)]];
+}
+
 function initRandomPair() {
+  loadPairIndex();
   document.getElementById('btn-random-pair')?.addEventListener('click', () => {
     const chars = state.characters;
     if (!chars || chars.length < 2) return;
+    const pair = pickIndexedPair(chars);
+    if (pair) {
+      selectChar('A', pair[0].id);
+      selectChar('B', pair[1].id);
+      log('INFO', 'ПЕРСОНАЖИ', `🎲 Случайная пара: ${pair[0].name_ru} ? ${pair[1].name_ru}`);
+      return;
+    }
     // Pick two different random characters
     const idxA = Math.floor(Math.random() * chars.length);
     let idxB = Math.floor(Math.random() * (chars.length - 1));
@@ -3894,6 +4026,7 @@ function initGenerate() {
       characters: state.characters,
       locations: state.locations,
       selected_location_id: state.selectedLocation,
+      affinity: await loadAffinity(),
       enableLaughter: document.getElementById('laugh-toggle')?.checked !== false,
     };
     // Clear override after reading — only applies to this single regeneration
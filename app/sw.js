@@ -31,6 +31,19 @@ self.addEventListener('fetch', (e) => {
   // Skip non-GET and API requests — always network
   if (request.method !== 'GET' || url.pathname.startsWith('/api/')) return;
 
+  // Roster patches (data/chars/delta/<from>.<to>.json) are named by content — cache-first
+  if (/\/data\/chars\/delta\/[0-9a-f]{12}\.[0-9a-f]{12}\.json$/.test(url.pathname)) {
+    e.respondWith(
+      caches.open(CACHE_NAME).then(cache =>
+        cache.match(request).then(cached => cached || fetch(request).then(res => {
+          if (res.ok) cache.put(request, res.clone());
+          return res;
+        }))
+      )
+    );
+    return;
+  }
+
   // Network-first for HTML AND JS/JSON (prevent stale code from breaking buttons)
   if (request.headers.get('accept')?.includes('text/html') || url.pathname.endsWith('.js') || url.pathname.endsWith('.json')) {
     e.respondWith(
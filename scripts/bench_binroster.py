@@ -0,0 +1,84 @@
+"""
+FERIXDI Studio — binary roster benchmark
+Size and load time of roster.bin (databuild/binroster.py) against
+characters.json as it is on disk (synthetic casts: indent=1) and compact
+JSON, raw and gzipped, in Python and — when node is on PATH — through
+app/engine/roster_bin.js.
+
+  python scripts/bench_binroster.py                  # app roster + 10k synthetic
+  python scripts/bench_binroster.py --synthetic 50000
+"""
+import argparse, gzip, json, os, shutil, subprocess, tempfile, time
+
+from databuild import CHARACTERS_PATH, ROOT, binroster, load_json, stream
+
+NODE_SRC = """
+import { readFileSync } from 'node:fs';
+import { parseRoster } from './app/engine/roster_bin.js';
+const [jsonPath, binPath] = process.argv.slice(1);
+const best = (fn) => { let b = Infinity; for (let k = 0; k < 5; k++) { const t = performance.now(); fn(); b = Math.min(b, performance.now() - t); } return b; };
+const text = readFileSync(jsonPath, 'utf8');
+const buf = readFileSync(binPath);
+const ab = buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.byteLength);
+const out = {
+  json_parse: best(() => JSON.parse(text)),
+  bin_open: best(() => parseRoster(ab)),
+  bin_field: best(() => parseRoster(ab).field(0, 'name_ru')),
+  bin_all: best(() => parseRoster(ab).toArray()),
+};
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def best(fn, repeat=5):
+    t = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        t = min(t, time.perf_counter() - t0)
+    return t * 1e3
+
+
+def bench(label, chars, tmp, json_path=None):
+    if json_path is None:
+        json_path = os.path.join(tmp, "characters.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(chars, f, ensure_ascii=False, indent=1)
+    compact = json.dumps(chars, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    bin_path, _ = binroster.write(chars, tmp)
+    with open(json_path, "rb") as f:
+        indented = f.read()
+    with open(bin_path, "rb") as f:
+        data = f.read()
+
+    print(f"\n{label}: {len(chars)} characters")
+    print(f"  {'':<16}{'bytes':>11}{'gzip':>11}")
+    for name, blob in (("roster JSON", indented), ("compact JSON", compact), ("roster.bin", data)):
+        print(f"  {name:<16}{len(blob):>11}{len(gzip.compress(blob, 9, mtime=0)):>11}")
+
+    def mm():
+        return binroster.BinRoster.open(bin_path)
+
+    print(f"  python  json.load {best(lambda: load_json(json_path)):8.2f} ms | "
+          f"bin open {best(mm):.2f} ms, one field {best(lambda: mm().field(0, 'name_ru')):.2f} ms, "
+          f"all records {best(lambda: list(mm())):.2f} ms")
+    if shutil.which("node"):
+        out = subprocess.run(["node", "--input-type=module", "-e", NODE_SRC, json_path, bin_path], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        js = json.loads(out)
+        print(f"  node    JSON.parse {js['json_parse']:7.2f} ms | bin open {js['bin_open']:.2f} ms, "
+              f"one field {js['bin_field']:.2f} ms, all records {js['bin_all']:.2f} ms")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--synthetic", type=int, default=10000, help="synthetic cast size (0 = skip)")
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        bench("app roster", load_json(CHARACTERS_PATH), tmp, CHARACTERS_PATH)
+        if args.synthetic:
+            bench("synthetic cast", list(stream.records(stream.synthetic_rows(args.synthetic))), tmp)
+
+
+if __name__ == "__main__":
+    main()
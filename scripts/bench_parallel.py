@@ -0,0 +1,45 @@
+"""
+FERIXDI Studio — parallel enrichment benchmark
+Times the enrich + deep-fix transforms over a large synthetic roster for
+several process-pool sizes and checks every run against the serial bytes.
+Pool start-up is included; speedup is relative to the first --workers entry.
+
+  python scripts/bench_parallel.py                        # 100k records, 1/2/4/8 workers
+  python scripts/bench_parallel.py --size 20000 --workers 1 2
+"""
+import argparse, hashlib, json, os, time
+
+from databuild import deep_fix, enrich, generate, parallel, stream
+
+
+def transform(c):
+    return deep_fix.apply(enrich.apply(c))
+
+
+def run(base, workers):
+    t0 = time.perf_counter()
+    digest = hashlib.sha256()
+    with parallel.executor(workers) as ex:
+        for c in parallel.map_ordered(transform, base, ex):
+            digest.update(json.dumps(c, ensure_ascii=False).encode("utf-8"))
+    return time.perf_counter() - t0, digest.hexdigest()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--size", type=int, default=100000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args()
+
+    base = [generate.build(*row) for _, row in stream.synthetic_rows(args.size)]
+    print(f"{args.size} records, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'secs':>7} {'rec/s':>8} {'speedup':>8}  identical")
+    serial = None
+    for w in args.workers:
+        secs, digest = run(base, w)
+        serial = serial or (secs, digest)
+        print(f"{w:>7} {secs:>7.2f} {args.size / secs:>8.0f} {serial[0] / secs:>7.2f}x  {digest == serial[1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+FERIXDI Studio — episode planner benchmark
+Plans schedules of growing length with databuild/schedule.py, greedy (beam 1,
+horizon 1 — one pick at a time, like the browser) against the default beam
+search: episodes/s, mean episode score and viral_score, cast coverage and the
+shortest character rest. Every plan is replayed through the history-cache
+rules (exit 1 on any violation).
+
+  python scripts/bench_schedule.py
+  python scripts/bench_schedule.py --lengths 1000 10000 --beam 16 --horizon 24
+"""
+import argparse, sys, time
+
+from databuild import CHARACTERS_PATH, load_json, schedule
+from databuild.affinity import JOKES_PATH, LOCATIONS_PATH
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lengths", type=int, nargs="+", default=[500, 2000, 8000])
+    ap.add_argument("--beam", type=int, default=schedule.BEAM)
+    ap.add_argument("--horizon", type=int, default=schedule.HORIZON)
+    args = ap.parse_args()
+    chars, jokes, locations = load_json(CHARACTERS_PATH), load_json(JOKES_PATH), load_json(LOCATIONS_PATH)
+    print(f"{len(chars)} characters, {len(jokes)} jokes, {len(locations)} locations")
+    print(f"{'mode':<14} {'episodes':>8} {'secs':>7} {'ep/s':>7} {'score':>7} {'viral':>6} {'cast':>5} "
+          f"{'rest':>5}  violations")
+    bad = 0
+    for n in args.lengths:
+        for label, beam, horizon in (("greedy", 1, 1), (f"beam {args.beam}x{args.horizon}", args.beam, args.horizon)):
+            planner = schedule.Planner(chars, jokes, locations, beam=beam, horizon=horizon)
+            t0 = time.perf_counter()
+            plan = list(planner.plan(n))
+            secs = time.perf_counter() - t0
+            s = schedule.summary(plan, chars)
+            errors = schedule.violations(plan, chars, locations, planner.loc_window, planner.joke_window,
+                                         char_window=planner.char_window)
+            bad += len(errors)
+            print(f"{label:<14} {n:>8} {secs:>7.2f} {n / secs:>7.0f} {s['score']:>7.2f} {s['viral']:>6.2f} "
+                  f"{s['cast']:>5} {s['min_rest']:>5}  {len(errors)}")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+FERIXDI Studio — search index benchmark
+Builds the full-text index (databuild/search.py) over the app corpus copied
+×1, ×10 and ×100 and runs the same queries against it: index size, shards a
+query touches, cold (shards read from disk) and warm latency, against a
+linear scan of the normalized texts — what the client does today. Copies keep
+the vocabulary and multiply every posting list, the expensive direction.
+
+With node on PATH the corpus ×1 is also run through app/engine/search.js:
+every field's terms() and every query's results must match (exit 1 if not).
+
+  python scripts/bench_search.py
+  python scripts/bench_search.py --scales 1 10 --queries 500
+"""
+import argparse, gzip, json, os, random, shutil, statistics, subprocess, sys, tempfile, time
+
+from databuild import CHARACTERS_PATH, ROOT, load_json, search
+from databuild.affinity import JOKES_PATH, LOCATIONS_PATH
+
+NODE_SRC = """
+import { readFileSync } from 'node:fs';
+import { SearchIndex, terms } from './app/engine/search.js';
+const [dir] = process.argv.slice(1);
+globalThis.fetch = async (url) => {
+  const body = readFileSync(new URL(url));
+  return { ok: true, status: 200, json: async () => JSON.parse(body) };
+};
+const { texts, queries } = JSON.parse(readFileSync(0, 'utf8'));
+const ix = await SearchIndex.load(new URL(`file://${dir}/`));
+const results = [];
+for (const q of queries) results.push((await ix.search(q, { limit: 10 })).map(r => [r.kind, r.id, r.label, r.score]));
+process.stdout.write(JSON.stringify({ terms: texts.map(terms), results }));
+"""
+
+
+def corpus():
+    return list(search.documents(*(load_json(p) for p in (CHARACTERS_PATH, JOKES_PATH, LOCATIONS_PATH,
+                                                           search.COURSE_PATH))))
+
+
+def scaled(docs, k):
+    for c in range(k):
+        for kind, doc_id, label, fields in docs:
+            yield kind, doc_id if c == 0 else f"{doc_id}~{c}", label, fields
+
+
+def make_queries(docs, n, seed=7):
+    rng = random.Random(seed)
+    out = []
+    while len(out) < n:
+        words = " ".join(t for t, _ in rng.choice(docs)[3]).split()
+        words = [w for w in words if search.terms(w)]
+        if words:
+            out.append(" ".join(rng.sample(words, min(len(words), rng.choice((1, 1, 2, 2, 3))))))
+    return out
+
+
+def pct(times, p):
+    return sorted(times)[min(len(times) - 1, int(len(times) * p))] * 1e3
+
+
+def bench(docs, k, queries, tmp):
+    t0 = time.perf_counter()
+    meta, shards = search.build(scaled(docs, k))
+    build_s = time.perf_counter() - t0
+    out_dir = search.dump(meta, shards, os.path.join(tmp, f"x{k}"))
+    size = gz = 0
+    for fname in os.listdir(out_dir):
+        with open(os.path.join(out_dir, fname), "rb") as f:
+            data = f.read()
+        size += len(data)
+        gz += len(gzip.compress(data, 6, mtime=0))
+
+    cold, warm, touched = [], [], []
+    for q in queries:
+        ix = search.SearchIndex(meta, out_dir)
+        t = time.perf_counter()
+        ix.search(q)
+        cold.append(time.perf_counter() - t)
+        touched.append(len(ix._shards))
+        t = time.perf_counter()
+        ix.search(q)
+        warm.append(time.perf_counter() - t)
+
+    texts = [" ".join(t for t, _ in fields).lower().replace("ё", "е") for _, _, _, fields in scaled(docs, k)]
+    scan = []
+    for q in queries[:50]:
+        words = q.lower().replace("ё", "е").split()
+        t = time.perf_counter()
+        [i for i, text in enumerate(texts) if all(w in text for w in words)]
+        scan.append(time.perf_counter() - t)
+
+    print(f"x{k:<4} {len(meta['doc_id']):>7} docs {meta['terms']:>6} terms {meta['shards']:>4} shards "
+          f"{size / 1024:>8.0f} KB ({gz / 1024:.0f} KB gz)  build {build_s:6.2f} s")
+    print(f"       query cold p50 {pct(cold, .5):7.2f} ms p95 {pct(cold, .95):7.2f} ms | warm p50 "
+          f"{pct(warm, .5):6.3f} ms p95 {pct(warm, .95):6.3f} ms | {statistics.mean(touched):.1f} shards/query | "
+          f"linear scan p50 {pct(scan, .5):7.2f} ms")
+    return out_dir
+
+
+def check_js(docs, queries, out_dir):
+    texts = [t for _, _, _, fields in docs for t, _ in fields]
+    stdin = json.dumps({"texts": texts, "queries": queries}, ensure_ascii=False)
+    out = json.loads(subprocess.run(["node", "--input-type=module", "-e", NODE_SRC, os.path.abspath(out_dir)],
+                                    cwd=ROOT, input=stdin, capture_output=True, text=True, check=True).stdout)
+    ix = search.SearchIndex.load(out_dir)
+    bad = sum(search.terms(t) != js for t, js in zip(texts, out["terms"]))
+    bad += sum([list(r) for r in ix.search(q, limit=10)] != js for q, js in zip(queries, out["results"]))
+    print(f"search.js parity: {len(texts)} texts, {len(queries)} queries, {bad} mismatch(es)")
+    return bad == 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+    docs = corpus()
+    queries = make_queries(docs, args.queries)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in args.scales:
+            out_dir = bench(docs, k, queries, tmp)
+            if k == 1 and shutil.which("node"):
+                ok = check_js(docs, queries, out_dir)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+FERIXDI Studio — near-duplicate detection benchmark
+Exact + MinHash/LSH clustering (databuild/similarity.py) on synthetic casts of
+growing size, against the all-pairs MinHash check where that is still
+affordable (same components expected).
+
+  python scripts/bench_similarity.py                    # 1k, 10k, 100k
+  python scripts/bench_similarity.py --sizes 5000 --brute-max 5000
+"""
+import argparse, time
+
+from databuild import similarity, stream
+
+
+def brute(chars, threshold):
+    signer = similarity.Signer()
+    sigs = [signer.sign(c) for c in chars]
+    comp = similarity._Components(len(chars))
+    for i in range(len(chars)):
+        for j in range(i + 1, len(chars)):
+            if similarity.similarity(sigs[i], sigs[j]) >= threshold:
+                comp.union(i, j)
+    return sorted(sorted(g) for g in comp.groups() if len(g) > 1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--brute-max", type=int, default=2000, help="largest size checked against all pairs")
+    ap.add_argument("--threshold", type=float, default=similarity.THRESHOLD)
+    args = ap.parse_args()
+
+    print(f"{'chars':>8} {'exact':>9} {'near':>9} {'clusters':>9} {'largest':>8}  all-pairs")
+    for n in args.sizes:
+        chars = list(stream.records(stream.synthetic_rows(n)))
+        t0 = time.perf_counter()
+        similarity.exact_clusters(chars)
+        t1 = time.perf_counter()
+        near = similarity.near_clusters(chars, args.threshold)
+        t2 = time.perf_counter()
+        check = ""
+        if n <= args.brute_max:
+            t3 = time.perf_counter()
+            same = brute(chars, args.threshold) == near
+            check = f"{'same' if same else 'DIFFERENT'} ({time.perf_counter() - t3:.1f} s)"
+        print(f"{n:>8} {(t1 - t0) * 1e3:>7.0f}ms {(t2 - t1) * 1e3:>7.0f}ms {len(near):>9} "
+              f"{max(map(len, near), default=0):>8}  {check}")
+
+
+if __name__ == "__main__":
+    main()
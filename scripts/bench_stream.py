@@ -0,0 +1,60 @@
+"""
+FERIXDI Studio — streaming build benchmark
+Records/sec and peak RSS of the streamed synthetic build vs. the old
+"build the whole list, then json.dump" approach. Each measurement runs in a
+fresh process because ru_maxrss only ever grows.
+
+  python scripts/bench_stream.py                      # 1k, 10k, 100k
+  python scripts/bench_stream.py --sizes 1000 5000
+"""
+import argparse, json, os, resource, subprocess, sys, tempfile, time
+
+from databuild import stream
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def child(mode, n, path):
+    t0 = time.perf_counter()
+    recs = stream.records(stream.synthetic_rows(n))
+    if mode == "list":
+        chars = list(recs)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(chars, f, ensure_ascii=False, indent=1)
+    else:
+        stream.WRITERS[mode](recs, path)
+    dt = time.perf_counter() - t0
+    print(json.dumps({"secs": dt, "rss_mb": peak_rss_mb(), "bytes": os.path.getsize(path)}))
+
+
+def measure(mode, n, tmp):
+    path = os.path.join(tmp, f"{mode}-{n}.out")
+    out = subprocess.run([sys.executable, __file__, "--child", mode, str(n), path],
+                         check=True, capture_output=True, text=True).stdout
+    os.remove(path)
+    return json.loads(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        mode, n, path = args.child
+        return child(mode, int(n), path)
+
+    print(f"{'records':>8} {'mode':<6} {'rec/s':>9} {'peak RSS':>10} {'output':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            for mode in ("jsonl", "json", "list"):
+                r = measure(mode, n, tmp)
+                print(f"{n:>8} {mode:<6} {n / r['secs']:>9.0f} {r['rss_mb']:>8.1f}MB {r['bytes'] / 1e6:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
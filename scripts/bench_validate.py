@@ -0,0 +1,86 @@
+"""
+FERIXDI Studio — schema validator benchmark
+Compiled checker (databuild/validate.py) vs. a naive recursive validator that
+re-reads the schema dict for every value, on the app roster repeated to --size.
+
+  python scripts/bench_validate.py              # 10k records
+  python scripts/bench_validate.py --size 50000
+"""
+import argparse, re, time
+
+from databuild import CHARACTERS_PATH, load_json, validate
+
+TYPES = validate._TYPES
+
+
+def naive(schema, v, path, errors):
+    t = schema.get("type")
+    if t and (not isinstance(v, TYPES[t]) or (t in ("integer", "number") and isinstance(v, bool))):
+        errors.append((path, f"expected {t}"))
+        return
+    if "enum" in schema and v not in schema["enum"]:
+        errors.append((path, "not in enum"))
+    if "minLength" in schema and len(v) < schema["minLength"]:
+        errors.append((path, "too short"))
+    if "pattern" in schema and not re.search(schema["pattern"], v):
+        errors.append((path, "pattern"))
+    if "minimum" in schema and v < schema["minimum"]:
+        errors.append((path, "below minimum"))
+    if "maximum" in schema and v > schema["maximum"]:
+        errors.append((path, "above maximum"))
+    if "minItems" in schema and len(v) < schema["minItems"]:
+        errors.append((path, "too few items"))
+    if "items" in schema:
+        for i, x in enumerate(v):
+            naive(schema["items"], x, f"{path}[{i}]", errors)
+    for k in schema.get("required", ()):
+        if k not in v:
+            errors.append((path, f"missing {k}"))
+    for k, sub in schema.get("properties", {}).items():
+        if k in v:
+            naive(sub, v[k], f"{path}.{k}", errors)
+
+
+def timed(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--size", type=int, default=10000)
+    args = ap.parse_args()
+
+    base = load_json(CHARACTERS_PATH)
+    chars = [base[i % len(base)] for i in range(args.size)]
+    schema = load_json(validate.SCHEMA_PATH)
+
+    t_compile, check = timed(lambda: validate.compile_schema(schema), repeat=1)
+    t_fast, fast = timed(lambda: [e for i, c in enumerate(chars) for e in _run(check, c, i)])
+    t_naive, slow = timed(lambda: [e for i, c in enumerate(chars) for e in _naive(schema, c, i)])
+
+    print(f"{args.size} records, compile {t_compile * 1e3:.2f} ms")
+    print(f"  compiled  {t_fast * 1e3:8.1f} ms  {args.size / t_fast:>9.0f} rec/s  {len(fast)} errors")
+    print(f"  naive     {t_naive * 1e3:8.1f} ms  {args.size / t_naive:>9.0f} rec/s  {len(slow)} errors")
+    print(f"  speedup   {t_naive / t_fast:.1f}x")
+
+
+def _run(check, c, i):
+    errors = []
+    check(c, i, errors)
+    return errors
+
+
+def _naive(schema, c, i):
+    errors = []
+    naive(schema, c, f"$[{i}]", errors)
+    return errors
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+FERIXDI Studio — Batch Blueprint Builder
+Assembles output packages headlessly (databuild/blueprints.py): app/engine/generator.js
+generate() on a pool of node workers, one package per planned episode, each
+checked against app/spec/prompt_schema.json and streamed out as JSON Lines.
+Reports blueprints/s and per-stage latency (exit 1 on any invalid or failed package).
+
+  python scripts/build_blueprints.py --episodes 2000 --workers 8
+  python scripts/build_blueprints.py --plan .cache/databuild/plan.jsonl   # episodes from plan_episodes.py
+"""
+import argparse, json, os, shutil, statistics, sys, time
+
+from databuild import CACHE_DIR, CHARACTERS_PATH, blueprints, load_json, schedule
+from databuild.affinity import JOKES_PATH, LOCATIONS_PATH
+
+
+def read_plan(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--episodes", type=int, default=1000, help="episodes to plan (ignored with --plan)")
+    ap.add_argument("--plan", help="plan_episodes.py JSONL to build instead of planning here")
+    ap.add_argument("--out", default=os.path.join(CACHE_DIR, "blueprints.jsonl"))
+    ap.add_argument("--chars", default=CHARACTERS_PATH)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--depth", type=int, default=blueprints.DEPTH, help="jobs in flight per worker")
+    ap.add_argument("--seed", default="batch", help="generate() seed prefix (seed-<episode n>)")
+    args = ap.parse_args(argv)
+    if not shutil.which("node"):
+        sys.exit("node is required: the packages are built by app/engine/generator.js")
+
+    chars, jokes, locations = load_json(args.chars), load_json(JOKES_PATH), load_json(LOCATIONS_PATH)
+    try:
+        if args.plan:
+            episodes = read_plan(args.plan)
+        else:
+            planner = schedule.Planner(chars, jokes, locations)
+            for dim, asked, used, why in planner.relaxed:
+                print(f"  ! {dim} window {asked} -> {used} episodes ({why})")
+            episodes = planner.plan(args.episodes)
+        stats = blueprints.build(episodes, chars, locations, jokes, args.out, args.workers, args.seed,
+                                 depth=args.depth)
+    except schedule.Infeasible as e:
+        sys.exit(f"Plan infeasible: {e}")
+
+    n, secs = stats["count"], stats["secs"]
+    print(f"Blueprints -> {args.out}: {n} in {secs:.2f} s ({n / secs:.0f} blueprints/s), "
+          f"{args.workers} worker(s) x depth {args.depth}, {os.path.getsize(args.out) / 2 ** 20:.1f} MB")
+    print(f"  {'stage':<9} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    for name, ms in stats["stages"].items():
+        if ms:
+            print(f"  {name:<9} {blueprints.pct(ms, .5):>8.3f} {blueprints.pct(ms, .95):>8.3f} "
+                  f"{statistics.mean(ms):>8.3f}")
+    for ep_n, path, msg in stats["errors"][:10]:
+        print(f"  ✗ episode {ep_n} {path}: {msg}")
+    print(f"Schema check: {stats['invalid']} invalid, {stats['failed']} failed")
+    sys.exit(1 if stats["invalid"] or stats["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
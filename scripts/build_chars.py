@@ -0,0 +1,290 @@
+"""
+FERIXDI Studio — Character Build
+One entry point for the roster: generate → add → enrich → deep-fix → safety.
+Only characters whose stage inputs changed are recomputed (cache: .cache/databuild/).
+The pipeline roster goes to .cache/databuild/characters.json: app/data/characters.json
+is curated by hand and is replaced only when --out names it. The shipped roster
+(--roster, app/data/characters.json) is emitted into app/data/chars/ as the
+safety-stamped characters.json the client loads, its picker index, the
+string-interned roster.bin, patches from the previous builds (delta/) and the A/B
+pairing index; both rosters are validated against app/spec/character_schema.json.
+Every step is timed and the payload broken down by field and group
+(.cache/databuild/build_report.json); schema errors or a payload over budget
+(databuild/metrics.BUDGETS) exit non-zero.
+
+  python scripts/build_chars.py                  # incremental full build
+  python scripts/build_chars.py --until enrich   # stop after a stage
+  python scripts/build_chars.py --force          # ignore the cache, rebuild everything
+  python scripts/build_chars.py --emit-only      # re-emit app/data/chars/ from the shipped roster
+  python scripts/build_chars.py --allow-removals # publish a roster that drops characters
+  python scripts/build_chars.py --workers 8      # transform stages on a process pool
+  python scripts/build_chars.py --profile        # + peak memory per step (tracemalloc)
+  python scripts/build_chars.py --watch          # stay up, rebuild what an edit affects (databuild/watch.py)
+  python scripts/build_chars.py --synthetic 100000 --format jsonl --out cast.jsonl
+                                                 # streamed synthetic cast, flat memory
+"""
+import argparse, os, sys, time, traceback
+
+from databuild import (CHARACTERS_PATH, CHARS_DIR, PIPELINE_PATH, RESEED_PATH, SALTS, affinity, binroster,
+                       charindex, delta, dump_roster, durations, load_json, metrics, pairing, parallel, pipeline,
+                       safety, search, similarity, stream, trim, validate)
+from databuild import watch as live
+from databuild.pipeline import STAGE_NAMES, run
+
+
+def emit(chars, args, timings, files):
+    """Client artifacts from the shipped roster; False when the delta was refused."""
+    if args.no_emit:
+        return True
+    with timings.step("stamp"):
+        chars = safety.stamp(chars)
+        roster_path, size = safety.write_roster(chars, args.chars_dir)
+    files["characters.json"] = size
+    print(f"Stamped roster -> {roster_path}: {sum(c.get('safety') == safety.SCANNER.tag for c in chars)}"
+          f"/{len(chars)} pre-cleared, {size} B")
+    with timings.step("index"):
+        path, size = charindex.write(chars, args.chars_dir)
+    files["index.json"] = size
+    print(f"Index -> {path}: {len(chars)} chars in {size} B")
+    with timings.step("binroster"):
+        path, size = binroster.write(chars, args.chars_dir)
+    files["roster.bin"] = size
+    print(f"Binary roster -> {path}: {size} B")
+    ok = True
+    try:
+        with timings.step("delta"):
+            manifest = delta.write(chars, os.path.join(args.chars_dir, "delta"), keep=args.delta_keep,
+                                   full_path=roster_path, allow_removals=args.allow_removals)
+        sizes = sorted(p["gz_bytes"] for p in manifest["patches"].values())
+        print(f"Delta -> version {manifest['current']}, {len(sizes)} patch(es) from older builds"
+              + (f", {sizes[0]}–{sizes[-1]} B gzip" if sizes else ""))
+    except delta.RemovalError as e:
+        print(f"  ✗ delta refused, previous patches kept: {e} — --allow-removals to publish")
+        ok = False
+    with timings.step("pairs"):
+        path, index = pairing.write(chars, args.chars_dir, args.pairs_k)
+    print(f"Pairs -> {path}: top-{index['k']} B partners for "
+          f"{sum(r >= 0 for r in index['rows'])} A characters")
+    return ok
+
+
+def check(chars, args, timings, errors=None, label=None):
+    """Schema-check the roster. Returns False on errors."""
+    if args.no_validate:
+        return True
+    if errors is None:
+        with timings.step(f"validate {label}" if label else "validate"):
+            errors = validate.validate_roster(chars)
+    where = f" ({label})" if label else ""
+    if validate.report(errors):
+        print(f"Schema OK{where}")
+        return True
+    print(f"Schema{where}: {len(errors)} error(s) in {validate.SCHEMA_PATH}")
+    return False
+
+
+def same_path(a, b):
+    return os.path.abspath(a) == os.path.abspath(b)
+
+
+def rosters(chars, shipped, args):
+    """{label: roster} to validate — one entry when --out replaces the shipped roster."""
+    if chars is None or same_path(args.out, args.roster):
+        return {"shipped": shipped}
+    return {"pipeline": chars, "shipped": shipped}
+
+
+def report(args, timings, payload, files):
+    """Print the step timings and the payload breakdown, write the JSON report,
+    check the budget. Returns False when the payload is over budget."""
+    for s in timings.steps:
+        line = f"  {s['name']:<16} {s['secs'] * 1e3:>8.1f} ms"
+        if "ms_per_char" in s:
+            line += f"  {s['ms_per_char']:>6.3f} ms/char"
+        if "peak_mb" in s:
+            line += f"  peak {s['peak_mb']:.1f} MB"
+        print(line)
+    summary = payload.summary()
+    top = list(summary["by_field"].items())[:5]
+    print(f"Payload: {summary['compact_bytes']} B compact JSON; "
+          + ", ".join(f"{k} {v['share']:.0%}" for k, v in top))
+    groups = list(summary["by_group"].items())[:3]
+    print("  largest groups: " + ", ".join(f"{g} {v['bytes']} B ({v['count']} chars)" for g, v in groups))
+    budget = [] if args.no_budget else metrics.check_budget(files)
+    for b in budget:
+        if not b["ok"]:
+            print(f"  ✗ {b['name']}: {b['bytes']} B > budget {b['limit']} B (databuild/metrics.py BUDGETS)")
+    path = metrics.write_report({"version": 1, "characters": payload.count, "steps": timings.steps,
+                                 "payload": summary, "files": files, "budget": budget}, args.report)
+    print(f"Report -> {path}")
+    return all(b["ok"] for b in budget)
+
+
+def rebuild(args, state, todo):
+    """One watch-mode pass over the targets in `todo`; returns what was done.
+
+    The pipeline roster only feeds the schema check; the client artifacts and
+    indexes read the shipped roster (the same list when --out is --roster)."""
+    timings, done = metrics.Timings(), []
+    promoted = same_path(args.out, args.roster)
+    if "roster" in todo:
+        chars, stats = pipeline.run(until=args.until, workers=args.workers, timings=timings, cache=state["cache"])
+        built = ", ".join(f"{name} {n}" for name, n, _ in stats if n)
+        if chars != state["chars"]:
+            n = state["writer"].write(chars)
+            done.append(f"roster ({built or 'all cached'}; {n} records re-serialized)")
+            todo |= set(live.ROSTER_READERS) if promoted else {"validate"}
+        else:
+            done.append(f"roster unchanged ({built or 'all cached'})")
+        state["chars"] = chars
+    if "shipped" in todo:
+        state["shipped"] = None
+        todo |= set(live.ROSTER_READERS)
+    if promoted:
+        shipped = state["chars"]
+    else:
+        if state["shipped"] is None:
+            state["shipped"] = load_json(args.roster)
+        shipped = state["shipped"]
+    if "emit" in todo:
+        done.append("emit" if emit(shipped, args, timings, {}) else "emit (delta refused)")
+    if "validate" in todo and not args.no_validate:
+        if state["check"] is None or state["schema_changed"]:
+            state["check"] = validate.compile_schema()
+        for label, roster in rosters(state["chars"], shipped, args).items():
+            errors = validate.validate_roster(roster, state["check"])
+            validate.report(errors)
+            done.append(f"validate {label} ({len(errors)} errors)")
+    if "affinity" in todo:
+        affinity.write(args.index_dir)
+    if "durations" in todo:
+        durations.write(args.index_dir)
+    if "trim" in todo:
+        trim.write(args.index_dir, chars=shipped)
+    if "search" in todo:
+        search.write(os.path.join(args.index_dir, "search"), chars=shipped)
+    if "safety" in todo:
+        safety.write(os.path.join(args.index_dir, "safety.json"), chars=shipped)
+    done += [t for t in ("affinity", "durations", "trim", "search", "safety") if t in todo]
+    return done
+
+
+def watch(args):
+    """Build once from the cache file, then keep everything warm and rebuild on change (Ctrl+C stops)."""
+    state = {"cache": {} if args.force else pipeline.load_cache(), "chars": None, "shipped": None, "check": None,
+             "schema_changed": False, "writer": live.RosterWriter(args.out)}
+    t0 = time.perf_counter()
+    done = rebuild(args, state, set(live.TARGETS))
+    print(f"Watching {len(live.watched_files(args.out))} files; initial build: {', '.join(done)} "
+          f"in {time.perf_counter() - t0:.2f} s")
+    watcher = live.Watcher(lambda: live.watched_files(args.out))
+    try:
+        while True:
+            changed = watcher.changes()
+            t0 = time.perf_counter()
+            names = ", ".join(os.path.relpath(p, live.ROOT) for p in changed)
+            try:
+                live.reload_modules(changed)
+                todo, unused = live.targets(changed)
+                state["schema_changed"] = "validate" in todo
+                done = rebuild(args, state, todo) if todo else []
+            except Exception:
+                traceback.print_exc()
+                print(f"[{time.strftime('%H:%M:%S')}] {names}: build failed, keeping the previous output")
+                continue
+            note = f" (nothing reads {', '.join(unused)})" if unused else ""
+            print(f"[{time.strftime('%H:%M:%S')}] {names} → {', '.join(done) or 'no rebuild'} "
+                  f"in {time.perf_counter() - t0:.2f} s{note}")
+    except KeyboardInterrupt:
+        pipeline.save_cache(state["cache"])
+        print("Stopped; stage cache saved")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build the character roster and its client artifacts")
+    ap.add_argument("--until", choices=STAGE_NAMES, help="last stage to run (default: all)")
+    ap.add_argument("--force", action="store_true", help="ignore the stage cache")
+    ap.add_argument("--out", default=PIPELINE_PATH,
+                    help="pipeline roster path (name app/data/characters.json only to replace the curated roster)")
+    ap.add_argument("--roster", default=CHARACTERS_PATH,
+                    help="shipped roster the stamped copy, index, roster.bin, delta and pairs are emitted from")
+    ap.add_argument("--emit-only", action="store_true", help="skip the stages, emit from --roster as it is")
+    ap.add_argument("--chars-dir", default=CHARS_DIR, help="client artifact directory")
+    ap.add_argument("--no-emit", action="store_true", help="write only the roster file")
+    ap.add_argument("--delta-keep", type=int, default=delta.KEEP, help="older roster versions patched from")
+    ap.add_argument("--allow-removals", action="store_true",
+                    help=f"publish a delta that drops over {delta.MAX_REMOVED:.0%} of an older version's ids")
+    ap.add_argument("--pairs-k", type=int, default=pairing.DEFAULT_K, help="B partners kept per A character")
+    ap.add_argument("--synthetic", type=int, metavar="N", help="stream N synthetic characters to --out")
+    ap.add_argument("--format", choices=sorted(stream.WRITERS), default="json", help="--synthetic output format")
+    ap.add_argument("--workers", type=int, default=1, help="process-pool size for per-character work")
+    ap.add_argument("--no-validate", action="store_true", help="skip the schema check")
+    ap.add_argument("--profile", action="store_true", help="also trace peak memory per step (slower)")
+    ap.add_argument("--report", default=metrics.REPORT_PATH, help="JSON build report path")
+    ap.add_argument("--no-budget", action="store_true", help="report payload sizes without failing on budget")
+    ap.add_argument("--watch", action="store_true", help="stay running and rebuild on edits (databuild/watch.py)")
+    ap.add_argument("--index-dir", default=affinity.INDEX_DIR, help="--watch: dataset index directory")
+    args = ap.parse_args(argv)
+    if args.pairs_k < 1:
+        ap.error(f"--pairs-k must be at least 1, got {args.pairs_k}")
+    if args.watch:
+        if args.synthetic is not None or args.emit_only:
+            ap.error("--watch works on the stage pipeline, not with --synthetic / --emit-only")
+        watch(args)
+        return
+    timings, payload, files = metrics.Timings(memory=args.profile), metrics.Payload(), {}
+
+    if args.synthetic is not None:
+        if same_path(args.out, PIPELINE_PATH) or same_path(args.out, args.roster):
+            ap.error("--synthetic needs its own --out (it never overwrites a roster)")
+        errors = []
+        with parallel.executor(args.workers) as ex, timings.step("stream") as step:
+            recs = payload.tap(stream.records(stream.synthetic_rows(args.synthetic), ex))
+            if not args.no_validate:
+                recs = validate.checked(recs, errors)
+            n = stream.WRITERS[args.format](recs, args.out)
+            step.update(built=n, total=n)
+        print(f"Streamed {n} synthetic characters -> {args.out}")
+        ok = check(None, args, timings, errors)
+        ok = report(args, timings, payload, files) and ok
+        timings.close()
+        sys.exit(0 if ok else 1)
+
+    chars = None
+    if not args.emit_only:
+        chars, stats = run(until=args.until, use_cache=not args.force, workers=args.workers, timings=timings)
+        for name, built, total in stats:
+            print(f"  {name:<9} {built:>4}/{total} rebuilt")
+        with timings.step("write"):
+            dump_roster(chars, args.out)
+        print(f"Built {len(chars)} characters -> {args.out}")
+        gaps = validate.template_gaps(chars)
+        if gaps:
+            print(f"  ! no GROUP_BIOLOGY/SILHOUETTES for {len(gaps)} group(s), defaults used: "
+                  + ", ".join(f"{g} ({n})" for g, n in gaps.items()))
+        if SALTS:
+            print(f"  ! {len(SALTS)} characters re-seeded by {os.path.relpath(RESEED_PATH)} "
+                  f"(find_duplicates.py --reseed; delete it for the original seeds)")
+        dupes = similarity.collisions(chars)
+        if dupes:
+            print(f"  ! {len(dupes)} clusters of (near-)identical characters, {sum(map(len, dupes))} in total "
+                  f"— scripts/find_duplicates.py --reseed")
+    if chars is not None and same_path(args.out, args.roster):
+        shipped = chars
+    else:
+        shipped = load_json(args.roster)
+        print(f"Loaded {len(shipped)} shipped characters <- {args.roster}")
+    files["characters.json"] = os.path.getsize(args.roster)  # emit() replaces it with the stamped copy
+    ok = emit(shipped, args, timings, files)
+    for label, roster in rosters(chars, shipped, args).items():
+        ok = check(roster, args, timings, label=label) and ok
+    for c in shipped:
+        payload.add(c)
+    ok = report(args, timings, payload, files) and ok
+    timings.close()
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
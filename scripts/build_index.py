@@ -0,0 +1,52 @@
+"""
+FERIXDI Studio — Dataset Index Build
+Precomputed lookup indexes over app/data (written to app/data/index/):
+  affinity.json — group → jokes, location → jokes, tag → locations (databuild/affinity.py)
+  durations.json — per-pace duration + fits/needs-trim/impossible of every joke line (databuild/durations.py)
+  trimmed.json   — autoTrim output per A/B pace pairing + trimmed signature_words_ru (databuild/trim.py)
+  search/        — full-text index over characters, jokes, locations, course.json (databuild/search.py)
+  safety.json    — golden_standard safety scan of characters, jokes, locations: cleared ids + findings (databuild/safety.py)
+
+  python scripts/build_index.py
+"""
+import argparse, collections, os
+
+from databuild import affinity, durations, safety, search, trim
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build app/data/index/")
+    ap.add_argument("--out-dir", default=affinity.INDEX_DIR, help="index output directory")
+    args = ap.parse_args(argv)
+
+    path, index, warnings = affinity.write(args.out_dir)
+    for w in warnings:
+        print(f"  ! {w}")
+    print(f"Affinity -> {path}: {len(index['jokes'])} jokes, {len(index['locations'])} locations, "
+          f"{len(index['group_jokes'])} groups, {len(index['tag_locations'])} location tags")
+
+    path, index = durations.write(args.out_dir)
+    print(f"Durations -> {path}: {len(index['jokes'])} jokes")
+    for pace, counts in durations.summary(index).items():
+        print(f"  {pace:<7}" + "  ".join(f"{flag} {n}" for flag, n in counts.items()))
+
+    path, index, st = trim.write(args.out_dir)
+    print(f"Trimmed -> {path}: {st['dialogues']} joke x pace pairings, {st['high']} high-risk "
+          f"(autoTrim per request)")
+    print(f"  {st['trimmed']} changed ({st['rescued']} brought under the window), "
+          f"{st['high'] - st['trimmed']} untrimmable as is, {st['still_high']} still high after trim")
+    print(f"  signature_words_ru: {st['phrases_trimmed']} of {st['phrases']} phrase x pace variants trimmed; "
+          f"{st['estimates']} line estimates, {st['estimate_hits']} memo hits")
+
+    path, meta = search.write(os.path.join(args.out_dir, "search"))
+    print(f"Search -> {path}: {len(meta['doc_id'])} documents, {meta['terms']} terms in {meta['shards']} shards")
+
+    path, index = safety.write(os.path.join(args.out_dir, "safety.json"))
+    print(f"Safety -> {path}: spec {index['spec']}, " + ", ".join(
+        f"{len(ids)} {kind}s cleared" for kind, ids in index["cleared"].items()))
+    for (kind, lst, word), n in sorted(collections.Counter((f["kind"], f["list"], f["word"]) for f in index["findings"]).items()):
+        print(f"  ! {kind} {lst} \"{word}\" x{n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+FERIXDI Studio — estimator / auto-trim parity check
+Runs databuild/estimator.py + databuild/trim.py and app/engine/estimator.js +
+auto_trim.js (via node) on the same inputs and compares every output: the
+tests/estimator.test.js and tests/auto_trim.test.js fixtures plus every
+jokes.json line at every pace and every joke as an A/B dialogue at every pace
+pairing (estimated and auto-trimmed), once more with every ", " turned into a
+pause marker so the pause steps run too. Exit code 1 on any mismatch.
+
+  python scripts/check_estimator.py
+"""
+import argparse, itertools, json, os, re, subprocess, sys
+
+from databuild import ROOT, load_json
+from databuild.affinity import JOKES_PATH
+from databuild.estimator import PACE_WPS, estimate_dialogue, estimate_line_duration
+from databuild.trim import auto_trim
+
+TEST_PATHS = [os.path.join(ROOT, "tests", name) for name in ("estimator.test.js", "auto_trim.test.js")]
+
+NODE_SRC = """
+import { readFileSync } from 'node:fs';
+import { estimateLineDuration, estimateDialogue } from './app/engine/estimator.js';
+import { autoTrim } from './app/engine/auto_trim.js';
+const { lines, dialogues } = JSON.parse(readFileSync(0, 'utf8'));
+const out = {
+  lines: lines.map(([text, pace]) => {
+    const r = estimateLineDuration(text, pace);
+    return [r.duration, r.wordCount, r.details];
+  }),
+  dialogues: dialogues.map(d => {
+    const r = estimateDialogue(d);
+    return [r.total, r.risk, r.perLine.map(l => [l.duration, l.window, l.overWindow])];
+  }),
+  trims: dialogues.map(d => {
+    const r = autoTrim(d);
+    return [r.lines.map(l => l.text), r.auto_fixes, r.estimate.total, r.estimate.risk, r.trimmed];
+  }),
+};
+process.stdout.write(JSON.stringify(out));
+"""
+
+_LINE_CALL = re.compile(r"estimateLineDuration\('([^']*)'(?:,\s*'(\w+)')?\)")
+_LINES_BLOCK = re.compile(r"const lines = \[(.*?)\];", re.S)
+_LINE_OBJ = re.compile(r"\{\s*speaker:\s*'(\w)',\s*text:\s*'([^']*)',\s*pace:\s*'(\w+)'\s*\}")
+
+
+def fixtures(paths=TEST_PATHS):
+    """(lines, dialogues) pulled out of the vitest files."""
+    lines, dialogues = [], []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            src = f.read()
+        lines += [[text, pace or "normal"] for text, pace in _LINE_CALL.findall(src)]
+        dialogues += [[{"speaker": s, "text": t, "pace": p} for s, t, p in _LINE_OBJ.findall(block)]
+                      for block in _LINES_BLOCK.findall(src)]
+    return lines, dialogues
+
+
+def corpus(jokes):
+    paces = list(PACE_WPS)
+    pairs = [(j["line_a"], j["line_b"]) for j in jokes]
+    pairs += [(a.replace(", ", " | "), b.replace(", ", " | ")) for a, b in pairs]
+    lines = [[text, pace] for pair in pairs for text in pair for pace in paces]
+    dialogues = [[{"speaker": "A", "text": a, "pace": pa}, {"speaker": "B", "text": b, "pace": pb}]
+                 for a, b in pairs for pa, pb in itertools.product(paces, paces)]
+    return lines, dialogues
+
+
+def python_side(lines, dialogues):
+    out_lines = []
+    for text, pace in lines:
+        r = estimate_line_duration(text, pace)
+        out_lines.append([r["duration"], r["word_count"], r["details"]])
+    out_dialogues = []
+    for d in dialogues:
+        r = estimate_dialogue(d)
+        out_dialogues.append([r["total"], r["risk"],
+                              [[e["duration"], e["window"], e["over_window"]] for e in r["per_line"]]])
+    out_trims = []
+    for d in dialogues:
+        r = auto_trim(d)
+        out_trims.append([[l["text"] for l in r["lines"]], r["auto_fixes"],
+                          r["estimate"]["total"], r["estimate"]["risk"], r["trimmed"]])
+    return {"lines": out_lines, "dialogues": out_dialogues, "trims": out_trims}
+
+
+def node_side(lines, dialogues):
+    proc = subprocess.run(["node", "--input-type=module", "-e", NODE_SRC], cwd=ROOT,
+                          input=json.dumps({"lines": lines, "dialogues": dialogues}),
+                          capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(proc.stdout)
+
+
+def compare(kind, inputs, py, js, limit=10):
+    bad = [(x, a, b) for x, a, b in zip(inputs, py, js) if a != b]
+    for x, a, b in bad[:limit]:
+        print(f"  ✗ {kind} {json.dumps(x, ensure_ascii=False)}\n      py {a}\n      js {b}")
+    return len(bad)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Check estimator.py / trim.py against estimator.js / auto_trim.js")
+    ap.add_argument("--jokes", default=JOKES_PATH)
+    args = ap.parse_args(argv)
+
+    fx_lines, fx_dialogues = fixtures()
+    c_lines, c_dialogues = corpus(load_json(args.jokes))
+    lines, dialogues = fx_lines + c_lines, fx_dialogues + c_dialogues
+
+    py, js = python_side(lines, dialogues), node_side(lines, dialogues)
+    bad = compare("line", lines, py["lines"], js["lines"])
+    bad += compare("dialogue", dialogues, py["dialogues"], js["dialogues"])
+    bad += compare("trim", dialogues, py["trims"], js["trims"])
+    print(f"{len(lines)} lines ({len(fx_lines)} fixtures), {len(dialogues)} dialogues "
+          f"({len(fx_dialogues)} fixtures), estimated and auto-trimmed: {bad} mismatches")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
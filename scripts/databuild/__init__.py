@@ -0,0 +1,90 @@
+"""
+FERIXDI Studio — Data Build
+Shared paths and helpers for the character pipeline (see pipeline.STAGES).
+"""
+import hashlib, json, os, tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(ROOT, "app", "data")
+SPEC_DIR = os.path.join(ROOT, "app", "spec")
+CHARACTERS_PATH = os.path.join(DATA_DIR, "characters.json")
+CACHE_DIR = os.path.join(ROOT, ".cache", "databuild")
+# client artifacts of build_chars.py (index, roster patches, roster.bin, pairs)
+CHARS_DIR = os.path.join(DATA_DIR, "chars")
+# the stage pipeline's roster; app/data/characters.json is curated by hand and
+# only ever written when named explicitly (build_chars.py --out)
+PIPELINE_PATH = os.path.join(CACHE_DIR, "characters.json")
+RESEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reseed.json")
+
+
+def h(s):
+    """Stable per-id seed (md5) — the same seed the template picks always used."""
+    return int(hashlib.md5(s.encode()).hexdigest(), 16)
+
+
+def pick(arr, seed):
+    return arr[seed % len(arr)]
+
+
+def content_hash(obj):
+    """Order-independent sha256 of any JSON-serialisable value."""
+    blob = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_atomic(path, data):
+    """Write str/bytes through a temp file in the same directory + os.replace:
+    a reader (Vite, server/index.js, the watch build) sees the old file or the
+    new one, never half of it."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)  # mkstemp creates 0600; match a plain open()
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def dump_roster(chars, path):
+    """Write the roster exactly the way the original scripts did (indent=1, UTF-8)."""
+    write_atomic(path, json.dumps(chars, ensure_ascii=False, indent=1))
+
+
+def load_salts(path=RESEED_PATH):
+    """{id: salt} written by similarity.reseed(); {} when nothing was re-seeded
+    (no reseed.json — the default: the original seeds for every id)."""
+    try:
+        return load_json(path)
+    except OSError:
+        return {}
+
+
+SALTS = load_salts()
+
+
+def seeds(cid, offsets):
+    """Template-pick seeds of one character, one per slot.
+
+    Unsalted: h(id) + offset, exactly what the original scripts used. Once
+    similarity.reseed() salted the id, every slot gets its own h(id#salt#slot)
+    — with seed + offset all slots of equally sized pools move together, so a
+    group could never have more distinct faces than one pool has entries.
+    """
+    salt = SALTS.get(cid)
+    if not salt:
+        base = h(cid)
+        return [base + k for k in offsets]
+    return [h(f"{cid}#{salt}#{slot}") for slot in range(len(offsets))]
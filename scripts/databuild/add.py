@@ -0,0 +1,25 @@
+"""
+Stage 2 — add: extra groups appended after the core roster (formerly add_chars.py).
+Records are built with the same template as stage 1.
+"""
+from .generate import build, deps
+
+EXTRA=[
+("гопники",[("gop_serega","Гопник Серёга","fast",3,"A","chaotic"),("gop_dimon","Гопник Димон","fast",3,"A","chaotic"),("gop_lyoha","Гопник Лёха","normal",2,"B","meme")]),
+("бабушки-модницы",[("mod_klara","Модница Клара","normal",1,"A","meme"),("mod_eleonora","Модница Элеонора","slow",0,"A","meme"),("mod_faina","Модница Фаина","normal",1,"A","meme")]),
+("деды-техники",[("tech_semyon","Техно-дед Семён","normal",1,"B","meme"),("tech_arkady","Техно-дед Аркадий","fast",0,"A","meme"),("tech_boris","Техно-дед Борис","slow",1,"B","balanced")]),
+("тиктокеры",[("tik_arina","Тиктокер Арина","fast",0,"A","chaotic"),("tik_zhenya","Тиктокер Женя","fast",1,"A","chaotic"),("tik_nikita","Тиктокер Никита","fast",1,"A","meme")]),
+("охранники",[("ohr_valery","Охранник Валерий","slow",2,"B","conflict"),("ohr_roma","Охранник Рома","normal",1,"B","balanced")]),
+("дворники",[("dvor_jamshed","Дворник Джамшед","slow",0,"B","calm"),("dvor_petrovich","Дворник Петрович","slow",2,"B","balanced")]),
+("бабки-целительницы",[("cel_agafya","Целительница Агафья","slow",0,"B","meme"),("cel_praskovya","Целительница Прасковья","slow",0,"B","calm")]),
+("курьеры",[("kur_timur","Курьер Тимур","fast",1,"A","chaotic"),("kur_vanya","Курьер Ваня","fast",2,"A","meme")]),
+("домоуправы",[("dom_stepanovna","Домоуправ Степановна","normal",1,"A","conflict"),("dom_palych","Домоуправ Палыч","slow",2,"B","conflict")]),
+("астрологи",[("astr_zhanna","Астролог Жанна","slow",0,"A","meme"),("astr_edgar","Астролог Эдгар","slow",0,"B","calm")]),
+("психологи",[("psy_inna","Психолог Инна","slow",0,"B","calm"),("psy_mark","Психолог Марк","normal",0,"B","balanced")]),
+]
+
+
+def rows():
+    for grp, members in EXTRA:
+        for member in members:
+            yield member[0], (grp, member)
@@ -0,0 +1,142 @@
+"""
+Joke / character-group / location affinity index (jokes.json + locations.json).
+
+Inverted indexes, every posting list pre-sorted so the generator reads the
+best candidates with one lookup instead of scanning the datasets:
+
+  group_jokes     character group → jokes (viral_score desc)
+  theme_jokes     joke theme      → jokes (viral_score desc)
+  location_jokes  location id     → jokes (viral_score desc)
+  tag_locations   location tag    → locations (numeric_id)
+  category_locations  category_hints entry → locations (numeric_id)
+
+Postings are indices into the "jokes" / "locations" id arrays.
+"""
+import collections, heapq, json, os
+
+from . import DATA_DIR, content_hash, load_json, write_atomic
+
+JOKES_PATH = os.path.join(DATA_DIR, "jokes.json")
+LOCATIONS_PATH = os.path.join(DATA_DIR, "locations.json")
+INDEX_DIR = os.path.join(DATA_DIR, "index")
+
+# jokes.json best_groups labels → characters.json groups
+GROUP_ALIASES = {
+    "бабушки": ["бабки"],
+    "дедушки": ["деды"],
+    "дочери и сыновья": ["дочери", "сыновья"],
+}
+
+
+def character_groups(label):
+    return GROUP_ALIASES.get(label, [label])
+
+
+def _add(index, key, i):
+    index.setdefault(key, []).append(i)
+
+
+def build(jokes, locations):
+    """Return (index, warnings)."""
+    warnings, unknown = [], collections.Counter()
+    loc_ids = {loc["id"] for loc in locations}
+
+    group_jokes, theme_jokes, location_jokes = {}, {}, {}
+    for i, j in enumerate(jokes):
+        for label in j.get("best_groups", ()):
+            for grp in character_groups(label):
+                _add(group_jokes, grp, i)
+        if j.get("theme"):
+            _add(theme_jokes, j["theme"], i)
+        loc = j.get("best_location")
+        if loc:
+            _add(location_jokes, loc, i)
+            if loc not in loc_ids:
+                unknown[loc] += 1
+
+    if unknown:
+        warnings.append(f"{sum(unknown.values())} jokes name a best_location missing from locations.json "
+                        f"({len(unknown)} distinct, most common: "
+                        + ", ".join(f"{loc} x{n}" for loc, n in unknown.most_common(3)) + ")")
+
+    rank = {i: (-j.get("viral_score", 0), i) for i, j in enumerate(jokes)}
+    for postings in (group_jokes, theme_jokes, location_jokes):
+        for key in postings:
+            postings[key] = sorted(set(postings[key]), key=rank.__getitem__)
+
+    tag_locations, category_locations = {}, {}
+    for i, loc in enumerate(locations):
+        for tag in loc.get("tags", ()):
+            _add(tag_locations, tag, i)
+        for cat in loc.get("category_hints", ()):
+            _add(category_locations, cat, i)
+    loc_rank = {i: (loc.get("numeric_id", i), i) for i, loc in enumerate(locations)}
+    for postings in (tag_locations, category_locations):
+        for key in postings:
+            postings[key] = sorted(set(postings[key]), key=loc_rank.__getitem__)
+
+    index = {
+        "version": 1,
+        "source": content_hash([jokes, locations])[:16],
+        "jokes": [j["id"] for j in jokes],
+        "viral": [j.get("viral_score", 0) for j in jokes],
+        "locations": [loc["id"] for loc in locations],
+        "group_jokes": dict(sorted(group_jokes.items())),
+        "theme_jokes": dict(sorted(theme_jokes.items())),
+        "location_jokes": dict(sorted(location_jokes.items())),
+        "tag_locations": dict(sorted(tag_locations.items())),
+        "category_locations": dict(sorted(category_locations.items())),
+    }
+    return index, warnings
+
+
+def write(out_dir=INDEX_DIR, jokes_path=JOKES_PATH, locations_path=LOCATIONS_PATH):
+    index, warnings = build(load_json(jokes_path), load_json(locations_path))
+    path = os.path.join(out_dir, "affinity.json")
+    write_atomic(path, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return path, index, warnings
+
+
+class AffinityIndex:
+    """Reader over affinity.json — every lookup is a dict hit plus a slice."""
+
+    def __init__(self, index):
+        self.ix = index
+        self.joke_ids = index["jokes"]
+        self.location_ids = index["locations"]
+        self.viral = index["viral"]
+
+    @classmethod
+    def load(cls, path=os.path.join(INDEX_DIR, "affinity.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _jokes(self, table, key, limit):
+        return [self.joke_ids[i] for i in self.ix[table].get(key, ())[:limit]]
+
+    def jokes_for_group(self, group, limit=None):
+        return self._jokes("group_jokes", group, limit)
+
+    def jokes_for_theme(self, theme, limit=None):
+        return self._jokes("theme_jokes", theme, limit)
+
+    def jokes_for_location(self, location_id, limit=None):
+        return self._jokes("location_jokes", location_id, limit)
+
+    def locations_for_tag(self, tag, limit=None):
+        return [self.location_ids[i] for i in self.ix["tag_locations"].get(tag, ())[:limit]]
+
+    def locations_for_category(self, category, limit=None):
+        return [self.location_ids[i] for i in self.ix["category_locations"].get(category, ())[:limit]]
+
+    def jokes_for_pair(self, group_a, group_b, limit=None):
+        """Jokes that suit either group, best viral_score first (merge of two postings)."""
+        lists = [self.ix["group_jokes"].get(g, ()) for g in {group_a, group_b}]
+        out, seen = [], set()
+        for i in heapq.merge(*lists, key=lambda i: (-self.viral[i], i)):
+            if i not in seen:
+                seen.add(i)
+                out.append(self.joke_ids[i])
+                if limit and len(out) >= limit:
+                    break
+        return out
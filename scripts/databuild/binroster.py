@@ -0,0 +1,194 @@
+"""
+Compact binary roster (app/data/chars/roster.bin): every distinct value is
+stored once in a string table, and each record is one fixed-width row of
+uint32 references into it — the template-pool strings that repeat in every
+record (hooks, silhouettes, wardrobe, the skin-microtexture suffix …) cost
+four bytes per use instead of their full text.
+
+Layout (little-endian, sections 4-byte aligned so JS can view them directly):
+
+  b"FXRB"  u32 header length  header JSON (padded)
+  cells    records × columns u32   — value index, 0xFFFFFFFF = field absent
+  offsets  (values + 1) u32        — value i is blob[offsets[i]:offsets[i+1]]
+  kinds    values u8               — 0 = UTF-8 string, 1 = JSON (numbers, lists, …)
+  blob     UTF-8 bytes
+
+Columns are the dotted leaf paths of the records (identity_anchors.wardrobe_anchor);
+lists and empty objects are JSON leaves; decoded records follow the column
+order (first-seen key order over the roster). The header JSON carries the
+column list and the section offsets. BinRoster memory-maps the file and
+decodes a value only when it is read; app/engine/roster_bin.js is the
+browser reader.
+"""
+import json, mmap, os, struct, sys
+
+from . import CHARS_DIR, write_atomic
+
+MAGIC = b"FXRB"
+VERSION = 1
+NONE = 0xFFFFFFFF
+STR, JSON = 0, 1
+
+
+def _leaves(obj, prefix=""):
+    for k, v in obj.items():
+        path = f"{prefix}{k}"
+        if isinstance(v, dict) and v:
+            yield from _leaves(v, path + ".")
+        else:
+            yield path, v
+
+
+def _pad(n):
+    return -n % 4
+
+
+def encode(chars):
+    """Roster → bytes."""
+    columns, col_ix = [], {}
+    values, val_ix = [], {}
+    rows = []
+    for c in chars:
+        row = {}
+        for path, v in _leaves(c):
+            if path not in col_ix:
+                col_ix[path] = len(columns)
+                columns.append(path)
+            key = (STR, v) if isinstance(v, str) else (JSON, json.dumps(v, ensure_ascii=False, separators=(",", ":")))
+            ix = val_ix.get(key)
+            if ix is None:
+                ix = val_ix[key] = len(values)
+                values.append(key)
+            row[col_ix[path]] = ix
+        rows.append(row)
+
+    ncol = len(columns)
+    cells = [NONE] * (len(rows) * ncol)
+    for r, row in enumerate(rows):
+        base = r * ncol
+        for col, ix in row.items():
+            cells[base + col] = ix
+
+    blobs = [text.encode("utf-8") for _, text in values]
+    offsets, pos = [0], 0
+    for b in blobs:
+        pos += len(b)
+        offsets.append(pos)
+
+    sections = [
+        ("cells", struct.pack(f"<{len(cells)}I", *cells)),
+        ("offsets", struct.pack(f"<{len(offsets)}I", *offsets)),
+        ("kinds", bytes(kind for kind, _ in values)),
+        ("blob", b"".join(blobs)),
+    ]
+    header = {"version": VERSION, "records": len(rows), "columns": columns, "values": len(values)}
+    # offsets depend on the header length, which depends on the offsets — fix point in ≤2 rounds
+    while True:
+        head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        head += b" " * _pad(len(head))
+        pos = 8 + len(head)
+        layout = {}
+        for name, data in sections:
+            layout[name] = pos
+            pos += len(data) + _pad(len(data))
+        if header.get("layout") == layout:
+            break
+        header["layout"] = layout
+
+    out = [MAGIC, struct.pack("<I", len(head)), head]
+    for _, data in sections:
+        out += [data, b"\0" * _pad(len(data))]
+    return b"".join(out)
+
+
+def write(chars, out_dir=CHARS_DIR):
+    data = encode(chars)
+    path = os.path.join(out_dir, "roster.bin")
+    write_atomic(path, data)
+    return path, len(data)
+
+
+class BinRoster:
+    """Memory-mapped reader. Nothing is decoded up front; a field read touches
+    one cell, two offsets and the bytes of that one value."""
+
+    def __init__(self, buf):
+        if bytes(buf[:4]) != MAGIC:
+            raise ValueError("not a roster.bin file")
+        (hlen,) = struct.unpack_from("<I", buf, 4)
+        self.header = json.loads(bytes(buf[8:8 + hlen]))
+        if self.header["version"] != VERSION:
+            raise ValueError(f"roster.bin version {self.header['version']}, expected {VERSION}")
+        self.columns = self.header["columns"]
+        self.col_ix = {p: i for i, p in enumerate(self.columns)}
+        self._paths = [p.split(".") for p in self.columns]
+        self.n = self.header["records"]
+        lay, ncol, nval = self.header["layout"], len(self.columns), self.header["values"]
+        mv = memoryview(buf)
+        self.cells = self._u32(mv[lay["cells"]:lay["cells"] + 4 * self.n * ncol])
+        self.offsets = self._u32(mv[lay["offsets"]:lay["offsets"] + 4 * (nval + 1)])
+        self.kinds = mv[lay["kinds"]:lay["kinds"] + nval]
+        self.blob = mv[lay["blob"]:]
+        self._strings = {}  # pool strings repeat — decode each once
+        self._ids = None
+
+    @staticmethod
+    def _u32(mv):
+        if sys.byteorder == "little":
+            return mv.cast("I")
+        return struct.unpack(f"<{len(mv) // 4}I", mv)
+
+    @classmethod
+    def open(cls, path=os.path.join(CHARS_DIR, "roster.bin")):
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm)
+
+    def __len__(self):
+        return self.n
+
+    def value(self, ix):
+        if ix == NONE:
+            return None
+        s = self._strings.get(ix)
+        if s is not None:
+            return s
+        raw = str(self.blob[self.offsets[ix]:self.offsets[ix + 1]], "utf-8")
+        if self.kinds[ix] != STR:
+            return json.loads(raw)
+        self._strings[ix] = raw
+        return raw
+
+    def field(self, i, path, default=None):
+        """One leaf (dotted path) of record i."""
+        col = self.col_ix.get(path)
+        if col is None:
+            return default
+        ix = self.cells[i * len(self.columns) + col]
+        return default if ix == NONE else self.value(ix)
+
+    def record(self, i):
+        """Record i as a plain dict."""
+        out = {}
+        base = i * len(self.columns)
+        for col, (*parents, leaf) in enumerate(self._paths):
+            ix = self.cells[base + col]
+            if ix == NONE:
+                continue
+            node = out
+            for p in parents:
+                node = node.setdefault(p, {})
+            node[leaf] = self.value(ix)
+        return out
+
+    def index_of(self, cid):
+        if self._ids is None:
+            self._ids = {self.field(i, "id"): i for i in range(self.n)}
+        return self._ids.get(cid)
+
+    def by_id(self, cid):
+        i = self.index_of(cid)
+        return None if i is None else self.record(i)
+
+    def __iter__(self):
+        return (self.record(i) for i in range(self.n))
@@ -0,0 +1,197 @@
+"""
+Headless batch assembly of output packages (app/spec/prompt_schema.json):
+the generate() the UI runs (app/engine/generator.js), on a pool of node
+worker processes that each load the roster and locations once.
+
+An episode (schedule.Planner, or a plan_episodes.py JSONL) becomes a generate()
+input in 'idea' mode: the pair with roles locked, the location selected, the
+joke's lines as dialogue_override and the theme's HUMOR_CATEGORIES entry.
+Every package is checked against prompt_schema.json (validate.compile_schema)
+and streamed out as one JSON line {"n", "episode", "package"}, in episode order.
+
+Worker protocol, JSON Lines over stdin/stdout: one {"characters", "locations"}
+line, then {"n", "input"} per job → {"n", "ms"} TAB package, or {"n", "error"}.
+The package is passed through as the worker's text, so it is parsed once (for
+the schema check) and never re-serialized. The history cache is cleared before
+each generate(), so a package does not depend on which worker built it or on
+what that worker built before; qc_gate (seeded from the clock — with its
+"QC Gate" warning) and log.timestamp are the only fields that differ between
+runs or worker counts. _apiContext —
+the full records for the server's refine step — is dropped.
+"""
+import json, os, queue, subprocess, threading, time
+
+from . import ROOT, SPEC_DIR, load_json, validate
+from .schedule import THEME_CATEGORIES
+
+PROMPT_SCHEMA_PATH = os.path.join(SPEC_DIR, "prompt_schema.json")
+DEPTH = 4  # jobs in flight per worker
+DEFAULT_CATEGORY = "Бытовой абсурд"
+
+# generator.js HUMOR_CATEGORIES
+CATEGORY_EN = {
+    "Бытовой абсурд": "Domestic absurdity", "AI и технологии": "AI and technology",
+    "Цены и инфляция": "Prices and inflation", "Отношения": "Relationships",
+    "Разрыв поколений": "Generation gap", "ЖКХ и коммуналка": "Housing utilities drama",
+    "Здоровье и поликлиника": "Health and polyclinic", "Соцсети и тренды": "Social media trends",
+    "Дача и огород": "Dacha and gardening", "Транспорт и пробки": "Transport and traffic",
+}
+
+NODE_WORKER = """
+import { createInterface } from 'node:readline';
+import { generate } from './app/engine/generator.js';
+import { historyCache } from './app/engine/history_cache.js';
+let data = null;
+for await (const line of createInterface({ input: process.stdin, crlfDelay: Infinity })) {
+  if (!data) { data = JSON.parse(line); continue; }
+  const { n, input } = JSON.parse(line);
+  let reply;
+  try {
+    historyCache.clear();
+    const t0 = performance.now();
+    const out = generate({ ...input, characters: data.characters, locations: data.locations });
+    const ms = performance.now() - t0;
+    if (out.error) throw new Error(out.error);
+    delete out._apiContext;
+    reply = JSON.stringify({ n, ms }) + '\\t' + JSON.stringify(out);
+  } catch (e) {
+    reply = JSON.stringify({ n, error: String(e && e.message || e) });
+  }
+  process.stdout.write(reply + '\\n');
+}
+"""
+
+
+def job_input(ep, jokes, seed):
+    """Planned episode → generate() input (characters/locations are the worker's)."""
+    joke = jokes[ep["joke"]]
+    ru = THEME_CATEGORIES.get(ep.get("theme") or joke.get("theme"), DEFAULT_CATEGORY)
+    return {"input_mode": "idea", "character1_id": ep["a"], "character2_id": ep["b"], "roles_locked": True,
+            "category": {"ru": ru, "en": CATEGORY_EN[ru]}, "selected_location_id": ep["location"],
+            "dialogue_override": {"A": joke["line_a"], "B": joke["line_b"]},
+            "seed": f"{seed}-{ep['n']}", "options": {"enforce8s": True}}
+
+
+class NodePool:
+    """Long-lived node workers; imap() keeps `depth` jobs in flight on each and
+    yields the replies in job order."""
+
+    def __init__(self, workers, characters, locations, depth=DEPTH):
+        self.depth = depth
+        self.replies = queue.Queue()
+        init = json.dumps({"characters": characters, "locations": locations}, ensure_ascii=False) + "\n"
+        self.procs = []
+        for w in range(max(1, workers)):
+            proc = subprocess.Popen(["node", "--input-type=module", "-e", NODE_WORKER], cwd=ROOT,
+                                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding="utf-8")
+            proc.stdin.write(init)
+            proc.stdin.flush()
+            threading.Thread(target=self._read, args=(w, proc), daemon=True).start()
+            self.procs.append(proc)
+
+    def _read(self, w, proc):
+        for line in proc.stdout:
+            head, _, body = line.rstrip("\n").partition("\t")
+            self.replies.put((w, json.loads(head), body, time.perf_counter()))
+        self.replies.put((w, None, None, None))
+
+    def imap(self, jobs):
+        """jobs: (key, input) pairs → (key, reply, package text, round trip secs)."""
+        jobs = iter(jobs)
+        busy = [0] * len(self.procs)
+        sent, done = {}, {}
+        k = nxt = 0
+        more = True
+        while True:
+            while more and min(busy) < self.depth:
+                job = next(jobs, None)
+                if job is None:
+                    more = False
+                    break
+                w = busy.index(min(busy))
+                sent[k] = job[0], time.perf_counter()
+                proc = self.procs[w]
+                proc.stdin.write(json.dumps({"n": k, "input": job[1]}, ensure_ascii=False) + "\n")
+                proc.stdin.flush()
+                busy[w] += 1
+                k += 1
+            if nxt == k:
+                return
+            w, reply, body, t1 = self.replies.get()
+            if reply is None:
+                raise RuntimeError(f"node worker {w} exited ({self.procs[w].wait()})")
+            busy[w] -= 1
+            done[reply["n"]] = reply, body, t1
+            while nxt in done:
+                reply, body, t1 = done.pop(nxt)
+                key, t0 = sent.pop(nxt)
+                yield key, reply, body, t1 - t0
+                nxt += 1
+
+    def close(self):
+        for proc in self.procs:
+            proc.stdin.close()
+        for proc in self.procs:
+            proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _timed(it, out):
+    """Pass items through, appending the ms each one took to produce."""
+    it = iter(it)
+    while True:
+        t0 = time.perf_counter()
+        item = next(it, None)
+        if item is None:
+            return
+        out.append((time.perf_counter() - t0) * 1e3)
+        yield item
+
+
+def build(episodes, characters, locations, jokes, path, workers=1, seed="batch", check=None, depth=DEPTH):
+    """Generate, validate and stream every episode's package to `path`.
+
+    Returns {"count", "secs", "invalid", "failed", "errors": [(n, path, message)],
+    "stages": {stage: [ms per blueprint]}}; "ipc" is the round trip minus the
+    worker's own generate() time (queueing, pipes, JSON parse).
+    """
+    check = check or validate.compile_schema(load_json(PROMPT_SCHEMA_PATH), "prompt_schema")
+    jokes = {j["id"]: j for j in jokes}
+    stages = {name: [] for name in ("plan", "generate", "ipc", "validate", "write")}
+    stats = {"count": 0, "invalid": 0, "failed": 0, "errors": [], "stages": stages}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    t_start = time.perf_counter()
+    jobs = ((ep, job_input(ep, jokes, seed)) for ep in _timed(episodes, stages["plan"]))
+    with NodePool(workers, characters, locations, depth) as pool, open(path, "w", encoding="utf-8") as f:
+        for ep, reply, body, rtt in pool.imap(jobs):
+            if "error" in reply:
+                stats["failed"] += 1
+                stats["errors"].append((ep["n"], "$", reply["error"]))
+                continue
+            stages["generate"].append(reply["ms"])
+            stages["ipc"].append(rtt * 1e3 - reply["ms"])
+            t0 = time.perf_counter()
+            errors = []
+            check(json.loads(body), ep["n"], errors)
+            t1 = time.perf_counter()
+            if errors:
+                stats["invalid"] += 1
+                stats["errors"] += [(ep["n"], p, msg) for p, msg in errors]
+            f.write(f'{{"n":{ep["n"]},"episode":{json.dumps(ep, ensure_ascii=False, separators=(",", ":"))},'
+                    f'"package":{body}}}\n')
+            t2 = time.perf_counter()
+            stages["validate"].append((t1 - t0) * 1e3)
+            stages["write"].append((t2 - t1) * 1e3)
+            stats["count"] += 1
+    stats["secs"] = time.perf_counter() - t_start
+    return stats
+
+
+def pct(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))] if xs else 0.0
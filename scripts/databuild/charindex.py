@@ -0,0 +1,48 @@
+"""
+Character index for fast client startup.
+
+  app/data/chars/index.json   {"version": 2, "fields": INDEX_FIELDS, "characters": [[...], ...]}
+
+One row per character with only the fields a picker card shows (compact JSON,
+byte-for-byte deterministic). app/main.js paints the picker from it on a cold
+start; the full records follow as a delta patch or the whole roster
+(delta.py), which the rest of the app reads.
+"""
+import json, os, re
+
+from . import CHARS_DIR, write_atomic
+
+INDEX_FIELDS = ["id", "numeric_id", "name_ru", "group", "role_default", "tags", "compatibility",
+                "tagline_ru", "speech_pace", "swear_level"]
+# per-group shard files (and their .gz/.br copies) older builds wrote next to the index
+STALE_RE = re.compile(r"^[a-z0-9_-]+\.[0-9a-f]{12}\.json(\.gz|\.br)?$")
+
+
+def compact(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build(chars):
+    return compact({
+        "version": 2,
+        "fields": INDEX_FIELDS,
+        "characters": [[c.get(k) for k in INDEX_FIELDS] for c in chars],
+    })
+
+
+def write(chars, out_dir=CHARS_DIR):
+    """Write index.json (only when it changed). Returns (path, size)."""
+    data = build(chars)
+    path = os.path.join(out_dir, "index.json")
+    os.makedirs(out_dir, exist_ok=True)
+    try:
+        with open(path, "rb") as f:
+            same = f.read() == data
+    except OSError:
+        same = False
+    if not same:
+        write_atomic(path, data)
+    for fname in os.listdir(out_dir):
+        if STALE_RE.match(fname):
+            os.remove(os.path.join(out_dir, fname))
+    return path, len(data)
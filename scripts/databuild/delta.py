@@ -0,0 +1,187 @@
+"""
+Roster deltas for the client cache: instead of re-downloading the whole
+characters.json after every build, a client holding an older version fetches
+one patch that carries only the characters and fields that changed.
+
+Every emitted roster is snapshotted under .cache/databuild/versions/ (the
+last KEEP versions); each build writes, into app/data/chars/delta/,
+
+  manifest.json              {"version": 1, "current": V, "count": N,
+                              "full": {"file", "bytes"},
+                              "patches": {from: {"file", "bytes", "gz_bytes"}}}
+  <from>.<to>.json           one patch per kept older version, straight to V
+                             (gz_bytes: its size gzipped, as the server sends it)
+
+Versions are content hashes of the roster (12 hex chars). A patch is
+
+  {"version": 1, "from": F, "to": V, "count": N,
+   "remove": [id, ...], "add": [record, ...],
+   "patch": {id: JSON merge patch (RFC 7386) of that record, ...},
+   "order": [id, ...]}       # only when old order − removed + added ≠ new order
+
+Records never hold null, so a null in a merge patch always means "field
+removed". A patch that would not be smaller than the compact roster is not
+written — the client falls back to the full file. A build that drops more than
+MAX_REMOVED of the ids a kept version had is refused (RemovalError) unless
+allow_removals is given; then those versions are retired, so their clients
+take the full file and later builds are not refused again. Paths in the manifest are
+relative to the manifest; app/engine/roster_delta.js applies patches.
+"""
+import gzip, json, os
+
+from . import CACHE_DIR, CHARACTERS_PATH, CHARS_DIR, content_hash, write_atomic
+from .charindex import compact
+
+FORMAT = 1
+KEEP = 8
+DELTA_DIR = os.path.join(CHARS_DIR, "delta")
+VERSIONS_DIR = os.path.join(CACHE_DIR, "versions")
+MAX_REMOVED = 0.05  # share of an older version's ids a patch may remove
+
+
+class RemovalError(ValueError):
+    """The roster lost more ids than MAX_REMOVED since a kept version."""
+
+
+def version_of(chars):
+    return content_hash(chars)[:12]
+
+
+def merge_diff(old, new):
+    """RFC 7386 merge patch turning dict `old` into dict `new`."""
+    out = {k: None for k in old if k not in new}
+    for k, v in new.items():
+        if k not in old:
+            out[k] = v
+        elif old[k] != v:
+            out[k] = merge_diff(old[k], v) if isinstance(v, dict) and isinstance(old[k], dict) else v
+    return out
+
+
+def merge_apply(target, patch):
+    if not isinstance(patch, dict):
+        return patch
+    out = dict(target) if isinstance(target, dict) else {}
+    for k, v in patch.items():
+        if v is None:
+            out.pop(k, None)
+        else:
+            out[k] = merge_apply(out.get(k), v)
+    return out
+
+
+def diff(old, new):
+    """Patch from roster `old` to roster `new` (both lists of records with unique ids)."""
+    old_by = {c["id"]: c for c in old}
+    new_ids = [c["id"] for c in new]
+    if len(old_by) != len(old) or len(set(new_ids)) != len(new):
+        raise ValueError("roster ids are not unique — no delta")
+    new_set = set(new_ids)
+    patch = {
+        "version": FORMAT, "from": version_of(old), "to": version_of(new), "count": len(new),
+        "remove": [c["id"] for c in old if c["id"] not in new_set],
+        "add": [c for c in new if c["id"] not in old_by],
+        "patch": {c["id"]: merge_diff(old_by[c["id"]], c)
+                  for c in new if c["id"] in old_by and old_by[c["id"]] != c},
+    }
+    applied = [c["id"] for c in old if c["id"] in new_set] + [c["id"] for c in patch["add"]]
+    if applied != new_ids:
+        patch["order"] = new_ids
+    return patch
+
+
+def apply(chars, patch):
+    """Roster `chars` (version patch["from"]) → the roster of version patch["to"]."""
+    removed = set(patch["remove"])
+    out = [merge_apply(c, patch["patch"][c["id"]]) if c["id"] in patch["patch"] else c
+           for c in chars if c["id"] not in removed]
+    out += patch["add"]
+    if "order" in patch:
+        by_id = {c["id"]: c for c in out}
+        out = [by_id[i] for i in patch["order"]]
+    if len(out) != patch["count"]:
+        raise ValueError(f"patch {patch['from']}→{patch['to']}: {len(out)} records, expected {patch['count']}")
+    return out
+
+
+def removed_share(old, new):
+    """Share of the ids in roster `old` that roster `new` no longer has."""
+    new_ids = {c["id"] for c in new}
+    return sum(c["id"] not in new_ids for c in old) / len(old) if old else 0.0
+
+
+def _snapshot(versions_dir, version):
+    return os.path.join(versions_dir, f"{version}.json")
+
+
+def _load(versions_dir, version):
+    with open(_snapshot(versions_dir, version), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _history(versions_dir):
+    try:
+        with open(os.path.join(versions_dir, "history.json"), encoding="utf-8") as f:
+            history = json.load(f)
+    except OSError:
+        return []
+    return [v for v in history if os.path.exists(_snapshot(versions_dir, v))]
+
+
+def remember(chars, versions_dir=VERSIONS_DIR, keep=KEEP):
+    """Snapshot this roster and return the version history, oldest first (≤ keep)."""
+    os.makedirs(versions_dir, exist_ok=True)
+    version = version_of(chars)
+    path = _snapshot(versions_dir, version)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(compact(chars))
+    history = [v for v in _history(versions_dir) if v != version]
+    history.append(version)
+    for v in history[:-keep]:
+        os.remove(_snapshot(versions_dir, v))
+    history = history[-keep:]
+    with open(os.path.join(versions_dir, "history.json"), "w", encoding="utf-8") as f:
+        json.dump(history, f)
+    return history
+
+
+def write(chars, out_dir=DELTA_DIR, versions_dir=VERSIONS_DIR, keep=KEEP, full_path=CHARACTERS_PATH,
+          allow_removals=False):
+    """Snapshot, emit patches from every kept older version and the manifest
+    (full_path: the roster file clients fall back to). Returns the manifest.
+
+    Raises RemovalError, before anything is written, when `chars` dropped more
+    than MAX_REMOVED of a kept version's ids and allow_removals is not set.
+    """
+    current = version_of(chars)
+    olds = {v: _load(versions_dir, v) for v in _history(versions_dir)[-keep:] if v != current}
+    shares = {v: removed_share(old, chars) for v, old in olds.items()}
+    retired = {v: share for v, share in shares.items() if share > MAX_REMOVED}
+    if retired and not allow_removals:
+        raise RemovalError("roster dropped " + ", ".join(f"{share:.0%} of version {v}'s ids"
+                                                         for v, share in retired.items())
+                           + f" (max {MAX_REMOVED:.0%} without allow_removals)")
+    for v in retired:
+        os.remove(_snapshot(versions_dir, v))
+    history = remember(chars, versions_dir, keep)
+    full_bytes = len(compact(chars))
+    os.makedirs(out_dir, exist_ok=True)
+    patches, files = {}, {"manifest.json"}
+    for old_version in history[:-1]:
+        data = compact(diff(olds[old_version], chars))
+        if len(data) >= full_bytes:
+            continue
+        fname = f"{old_version}.{current}.json"
+        write_atomic(os.path.join(out_dir, fname), data)
+        files.add(fname)
+        patches[old_version] = {"file": fname, "bytes": len(data),
+                                "gz_bytes": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    full = {"file": os.path.relpath(full_path, out_dir).replace(os.sep, "/"),
+            "bytes": os.path.getsize(full_path) if os.path.exists(full_path) else full_bytes}
+    manifest = {"version": FORMAT, "current": current, "count": len(chars), "full": full, "patches": patches}
+    write_atomic(os.path.join(out_dir, "manifest.json"), compact(manifest))
+    for fname in os.listdir(out_dir):
+        if fname not in files:
+            os.remove(os.path.join(out_dir, fname))
+    return manifest
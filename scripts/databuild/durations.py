@@ -0,0 +1,118 @@
+"""
+Precomputed spoken durations of every jokes.json line (estimator.py model).
+
+Each line_a (speaker A, 2.8s window) and line_b (speaker B, 3.5s window) is
+estimated at every pace and flagged:
+
+  fits        duration ≤ window + tolerance — estimateDialogue accepts it as is
+  needs-trim  over, but the auto_trim pipeline can still get it in
+  impossible  over even at the trim floor: no pauses, no fillers, no long-word
+              penalty and the aggressive WORD_LIMITS cut — trimming is wasted
+
+The floor is a lower bound on what autoTrim can reach, so "impossible" never
+rejects a line the trimmer could rescue.
+
+File (columnar, joke order):
+  {"version": 1, "source": ..., "paces": [...], "flags": [...], "jokes": [ids],
+   "line_a": {pace: {"duration": [...], "flag": [index into flags]}}, "line_b": ...}
+"""
+import json, os
+
+from . import content_hash, load_json, write_atomic
+from .affinity import INDEX_DIR, JOKES_PATH
+from .estimator import (PACE_WPS, SHORT_PUNCH_BONUS, WINDOW_TOLERANCE, estimate_line_duration,
+                        is_filler, speaker_window)
+from .trim import DEFAULT_WORD_LIMIT, WORD_LIMITS
+
+FLAGS = ("fits", "needs-trim", "impossible")
+FITS, NEEDS_TRIM, IMPOSSIBLE = range(3)
+LINES = (("line_a", "A"), ("line_b", "B"))
+
+
+def trim_floor(text, speaker, pace):
+    """Lower bound on the duration autoTrim can bring this line down to."""
+    words = [w for w in text.replace("|", " ").split() if not is_filler(w)]
+    n = len(words)
+    limit = WORD_LIMITS.get(speaker, DEFAULT_WORD_LIMIT)
+    if n > limit:  # truncate_to_fit never goes below limit - 1 words
+        n = limit - 1
+    bonus = SHORT_PUNCH_BONUS if n <= 3 else 0
+    return max(0.2, n / PACE_WPS[pace] + bonus)
+
+
+def classify(text, speaker, pace):
+    """(duration, flag) for one line at one pace."""
+    duration = estimate_line_duration(text, pace)["duration"]
+    limit = speaker_window(speaker) + WINDOW_TOLERANCE
+    if duration <= limit:
+        return duration, FITS
+    if trim_floor(text, speaker, pace) > limit:
+        return duration, IMPOSSIBLE
+    return duration, NEEDS_TRIM
+
+
+def build(jokes):
+    index = {
+        "version": 1,
+        "source": content_hash(jokes)[:16],
+        "paces": list(PACE_WPS),
+        "flags": list(FLAGS),
+        "jokes": [j["id"] for j in jokes],
+    }
+    for field, speaker in LINES:
+        cols = {}
+        for pace in PACE_WPS:
+            pairs = [classify(j.get(field) or "", speaker, pace) for j in jokes]
+            cols[pace] = {"duration": [d for d, _ in pairs], "flag": [f for _, f in pairs]}
+        index[field] = cols
+    return index
+
+
+def write(out_dir=INDEX_DIR, jokes_path=JOKES_PATH):
+    index = build(load_json(jokes_path))
+    path = os.path.join(out_dir, "durations.json")
+    write_atomic(path, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return path, index
+
+
+def summary(index):
+    """{pace: {flag: jokes}} — a joke counts under its worse line."""
+    out = {}
+    for pace in index["paces"]:
+        a, b = index["line_a"][pace]["flag"], index["line_b"][pace]["flag"]
+        counts = dict.fromkeys(index["flags"], 0)
+        for fa, fb in zip(a, b):
+            counts[index["flags"][max(fa, fb)]] += 1
+        out[pace] = counts
+    return out
+
+
+class DurationIndex:
+    """Reader over durations.json — pre-filter jokes by pace without estimating."""
+
+    def __init__(self, index):
+        self.ix = index
+        self.flags = index["flags"]
+        self.pos = {jid: i for i, jid in enumerate(index["jokes"])}
+
+    @classmethod
+    def load(cls, path=os.path.join(INDEX_DIR, "durations.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def line(self, joke_id, field, pace):
+        """(duration, flag) of line_a / line_b at this pace."""
+        col, i = self.ix[field][pace], self.pos[joke_id]
+        return col["duration"][i], self.flags[col["flag"][i]]
+
+    def flag(self, joke_id, pace):
+        """The worse flag of the two lines."""
+        i = self.pos[joke_id]
+        return self.flags[max(self.ix[f][pace]["flag"][i] for f, _ in LINES)]
+
+    def candidates(self, pace_a, pace_b=None, allow_trim=False):
+        """Joke ids playable with A at pace_a and B at pace_b (default: the same):
+        both lines fit, or may need trimming when allow_trim."""
+        worst = NEEDS_TRIM if allow_trim else FITS
+        a, b = self.ix["line_a"][pace_a]["flag"], self.ix["line_b"][pace_b or pace_a]["flag"]
+        return [jid for jid, fa, fb in zip(self.ix["jokes"], a, b) if max(fa, fb) <= worst]
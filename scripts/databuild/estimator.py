@@ -0,0 +1,122 @@
+"""
+Python side of app/engine/estimator.js — keep the constants in sync with it.
+Per-speaker window limits: A=2.8s, B=3.5s (with 0.5s tolerance).
+
+estimate_line_duration / estimate_dialogue reproduce the JS numbers exactly
+(checked by scripts/check_estimator.py against node); the Russian notes and
+trimming suggestions of estimateDialogue are UI text and are not ported.
+"""
+import math, re
+
+PACE_WPS = {"slow": 2.0, "normal": 2.5, "fast": 3.0}
+LONG_WORD_THRESHOLD = 8
+LONG_WORD_PENALTY = 0.08
+FILLER_WORDS = frozenset(["ну", "вот", "это", "типа", "короче", "значит", "так", "ладно", "кстати",
+                          "вообще", "просто", "даже", "тоже", "ещё", "уже"])
+FILLER_PENALTY = 0.06
+SHORT_PUNCH_BONUS = -0.1
+PAUSE_MARKER_DURATION = 0.2
+# v2 speaker window limits — MUST match estimator.js / generator.js GRID_V2
+SPEAKER_WINDOW = {"A": 2.8, "B": 3.5}
+WINDOW_TOLERANCE = 0.5
+TOTAL_SPEECH_BUDGET = SPEAKER_WINDOW["A"] + SPEAKER_WINDOW["B"]
+SOLO_WINDOW_A = 6.3
+SOLO_SPEECH_BUDGET = 6.3
+DEFAULT_WINDOW = 3.0
+# golden_standard.yaml timing_grid_8s: act_A "6-9 words", act_B "6-11 words"
+WORD_TARGET = {"A": (6, 9), "B": (6, 11)}
+
+_SPACE = re.compile(r"\s+")
+_NOT_WORD = re.compile(r"[^а-яёa-z]", re.I)
+_NOT_CYR = re.compile(r"[^а-яё]")
+
+
+def js_round2(x):
+    """Math.round(x * 100) / 100 — half up, unlike round()."""
+    return math.floor(x * 100 + 0.5) / 100
+
+
+def is_long(word):
+    return len(_NOT_WORD.sub("", word)) > LONG_WORD_THRESHOLD
+
+
+def is_filler(word):
+    return _NOT_CYR.sub("", word.lower()) in FILLER_WORDS
+
+
+def estimate_line_duration(text, pace="normal"):
+    """{"duration", "word_count", "details"} — same numbers as estimateLineDuration."""
+    if not text or not text.strip():
+        return {"duration": 0, "word_count": 0, "details": []}
+
+    base_wps = PACE_WPS.get(pace) or PACE_WPS["normal"]
+    words = _SPACE.split(text.strip())
+    word_count = len(words)
+    base_duration = word_count / base_wps
+
+    details = []
+    penalty = 0
+
+    n_long = sum(1 for w in words if is_long(w))
+    if n_long:
+        p = n_long * LONG_WORD_PENALTY
+        penalty += p
+        details.append(f"+{p:.2f}s за {n_long} длинных слов")
+
+    n_fill = sum(1 for w in words if is_filler(w))
+    if n_fill:
+        p = n_fill * FILLER_PENALTY
+        penalty += p
+        details.append(f"+{p:.2f}s за {n_fill} вводных слов")
+
+    pauses = text.count("|")
+    if pauses:
+        p = pauses * PAUSE_MARKER_DURATION
+        penalty += p
+        details.append(f"+{p:.2f}s за {pauses} пауз")
+
+    if word_count <= 3 and text.strip().endswith("!"):
+        penalty += SHORT_PUNCH_BONUS
+        details.append(f"{SHORT_PUNCH_BONUS}s бонус за ударную фразу")
+
+    duration = max(0.2, base_duration + penalty)
+    return {"duration": js_round2(duration), "word_count": word_count, "details": details}
+
+
+def speaker_window(speaker, solo=False):
+    if solo and speaker == "A":
+        return SOLO_WINDOW_A
+    return SPEAKER_WINDOW.get(speaker, DEFAULT_WINDOW)
+
+
+def estimate_dialogue(lines, estimate=estimate_line_duration):
+    """{"total", "per_line", "risk"} — estimateDialogue without the UI notes.
+    `estimate` lets batch callers pass a memoised estimate_line_duration."""
+    solo = len(lines) == 1 and lines[0].get("speaker") == "A"
+    per_line, total = [], 0
+    for line in lines:
+        est = estimate(line.get("text"), line.get("pace") or "normal")
+        speaker = line.get("speaker") or "?"
+        window = speaker_window(speaker, solo)
+        per_line.append({
+            "speaker": speaker, "text": line.get("text"),
+            "duration": est["duration"], "word_count": est["word_count"],
+            "window": window, "over_window": est["duration"] > window + WINDOW_TOLERANCE,
+        })
+        total += est["duration"]
+    total = js_round2(total)
+
+    budget = SOLO_SPEECH_BUDGET if solo else TOTAL_SPEECH_BUDGET
+    risk = "low"
+    if total > budget or any(e["over_window"] for e in per_line):
+        risk = "high"
+    elif total > budget - 0.5:
+        risk = "medium"
+    return {"total": total, "per_line": per_line, "risk": risk}
+
+
+def window_fit(pace, speaker):
+    """0..1 — how much of the golden word range fits the speaker window at this pace."""
+    lo, hi = WORD_TARGET[speaker]
+    capacity = PACE_WPS.get(pace, PACE_WPS["normal"]) * SPEAKER_WINDOW[speaker]
+    return max(0.0, min(1.0, (capacity - lo) / (hi - lo)))
@@ -0,0 +1,109 @@
+"""
+Build instrumentation: wall time and peak memory per step, payload size by
+field and by group, and the payload budget.
+
+Payload bytes are compact UTF-8 JSON — what the client downloads — counted
+per top-level field ("key":value plus the comma) and per group. Peak memory is
+tracemalloc's peak of the step in this process (worker processes of
+--workers are not traced); tracing slows the build, so it is opt-in.
+
+The report is one JSON document (.cache/databuild/build_report.json by default):
+  {"version": 1, "characters": N, "steps": [{"name", "secs", "built", "total",
+   "ms_per_char", "peak_mb"}], "payload": {"compact_bytes", "by_field", "by_group"},
+   "files": {name: bytes}, "budget": [{"name", "bytes", "limit", "ok"}]}
+"""
+import contextlib, json, os, time, tracemalloc
+
+from . import CACHE_DIR
+
+REPORT_PATH = os.path.join(CACHE_DIR, "build_report.json")
+# bytes; raise deliberately when a new field is worth its weight
+BUDGETS = {
+    "characters.json": 2_400_000,
+    "index.json": 64_000,
+}
+
+
+class Timings:
+    """Collects one entry per build step; `memory` turns on tracemalloc peaks."""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.steps = []
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def step(self, name, **info):
+        if self.memory:
+            tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        entry = {"name": name, **info}
+        yield entry
+        entry["secs"] = time.perf_counter() - t0
+        if entry.get("built"):
+            entry["ms_per_char"] = entry["secs"] * 1e3 / entry["built"]
+        if self.memory:
+            entry["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        self.steps.append(entry)
+
+    def close(self):
+        if self.memory:
+            tracemalloc.stop()
+
+
+def _size(obj):
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+class Payload:
+    """Streaming byte accounting — add() one record at a time, nothing is kept."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 2  # [ ]
+        self.by_field = {}
+        self.by_group = {}
+
+    def add(self, c):
+        # {"k":v,"k":v} = braces + every "k":v, minus the last comma
+        size = max(2, 1 + sum(self._field(k, v) for k, v in c.items()))
+        self.total += size + (1 if self.count else 0)
+        g = self.by_group.setdefault(c.get("group", "?"), {"count": 0, "bytes": 0})
+        g["count"] += 1
+        g["bytes"] += size
+        self.count += 1
+
+    def _field(self, key, value):
+        n = _size(key) + 1 + _size(value) + 1  # "key":value,
+        self.by_field[key] = self.by_field.get(key, 0) + n
+        return n
+
+    def tap(self, recs):
+        for c in recs:
+            self.add(c)
+            yield c
+
+    def summary(self):
+        total = self.total or 1
+        fields = sorted(self.by_field.items(), key=lambda kv: -kv[1])
+        groups = sorted(self.by_group.items(), key=lambda kv: -kv[1]["bytes"])
+        return {
+            "compact_bytes": self.total,
+            "by_field": {k: {"bytes": n, "share": round(n / total, 4)} for k, n in fields},
+            "by_group": {g: {"count": v["count"], "bytes": v["bytes"],
+                             "per_char": v["bytes"] // v["count"]} for g, v in groups},
+        }
+
+
+def check_budget(files, budgets=BUDGETS):
+    """[{"name", "bytes", "limit", "ok"}] for every budgeted file that was measured."""
+    return [{"name": name, "bytes": files[name], "limit": limit, "ok": files[name] <= limit}
+            for name, limit in budgets.items() if name in files]
+
+
+def write_report(report, path=REPORT_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    return path
@@ -0,0 +1,157 @@
+"""
+Precomputed A/B pairing index for the Q→A→Release format.
+
+For every A-capable character (role_default A/any) the top-K B partners
+(role_default B/any) are ranked by the same chemistry the client uses in
+calcPairChemistry (main.js): compatibility combo, pace contrast, different
+groups — plus how well both speech paces fit the A=2.8s / B=3.5s windows.
+
+The score only depends on each side's (compatibility, pace) profile plus
+whether the groups differ, so B characters are bucketed by profile (≤15
+buckets) and each A walks the bucket × same/other-group options best-first:
+O(A × (buckets + K)) instead of scoring all O(N²) pairs. Ties inside a bucket
+and between equal-score options are broken by h(a.id …) so A characters with
+the same profile get different partners, deterministically.
+
+File (array-backed, O(1) lookup):
+  {"version": 1, "k": K, "ids": [...],           # roster order
+   "rows": [row or -1 per id],                   # -1 = not an A character
+   "partners": [row*K .. row*K+K-1 → index into ids, -1 = none],
+   "scores": [same layout, calcPairChemistry points + window-fit bonus]}
+"""
+import json, os
+
+from . import h, write_atomic
+from .estimator import window_fit
+
+DEFAULT_K = 8
+
+# calcPairChemistry combo tables (main.js), keyed by the sorted pair
+GREAT_COMBOS = {"calm+chaotic": 30, "chaotic+meme": 20, "conflict+meme": 20, "calm+conflict": 25,
+                "balanced+chaotic": 15, "balanced+meme": 15}
+OK_COMBOS = {"balanced+balanced": 10, "balanced+calm": 5, "balanced+conflict": 10, "calm+meme": 10}
+WEAK_COMBOS = {"calm+calm": -10, "conflict+conflict": 5}
+OTHER_COMBO = 10
+WINDOW_FIT_WEIGHT = 10
+GROUP_CONTRAST = 10
+
+A_ROLES = ("A", "any")
+B_ROLES = ("B", "any")
+
+
+def combo_score(ca, cb):
+    key = "+".join(sorted((ca, cb)))
+    for table in (GREAT_COMBOS, OK_COMBOS, WEAK_COMBOS):
+        if key in table:
+            return table[key]
+    return OTHER_COMBO
+
+
+def profile_score(a, b):
+    """Chemistry of an A/B pair without the group term (depends on profiles only)."""
+    s = 50 + combo_score(a["compatibility"], b["compatibility"])
+    if a["speech_pace"] != b["speech_pace"]:
+        s += 10
+    elif a["speech_pace"] == "slow":
+        s -= 5
+    fit = (window_fit(a["speech_pace"], "A") + window_fit(b["speech_pace"], "B")) / 2
+    return s + WINDOW_FIT_WEIGHT * fit
+
+
+def _points(base, same_group):
+    # no upper clamp (unlike the UI badge) — it would flatten the top of the ranking
+    return int(round(max(0, base + (0 if same_group else GROUP_CONTRAST))))
+
+
+def pair_score(a, b):
+    return _points(profile_score(a, b), a["group"] == b["group"])
+
+
+def _buckets(chars):
+    """B candidates by (compatibility, pace), plus the same split per group."""
+    buckets, by_group = {}, {}
+    for i, c in enumerate(chars):
+        if c.get("role_default") in B_ROLES:
+            key = (c["compatibility"], c["speech_pace"])
+            buckets.setdefault(key, []).append(i)
+            by_group.setdefault((key, c["group"]), []).append(i)
+    return buckets, by_group
+
+
+def _rotated(members, seed):
+    """Lazily walk members starting at seed % len — no copies of big buckets."""
+    n = len(members)
+    start = seed % n if n else 0
+    return (members[(start + t) % n] for t in range(n))
+
+
+def build(chars, k=DEFAULT_K):
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    buckets, by_group = _buckets(chars)
+    rows, partners, scores = [], [], []
+    for i, a in enumerate(chars):
+        if a.get("role_default") not in A_ROLES:
+            rows.append(-1)
+            continue
+        rows.append(len(partners) // k)
+        aid, grp = a["id"], a["group"]
+        options = []
+        for key, members in buckets.items():
+            base = profile_score(a, chars[members[0]])
+            for same in (False, True):
+                tie = h(f"{aid}|{key[0]}|{key[1]}|{same}")
+                options.append((-_points(base, same), tie, key, same))
+        options.sort()
+
+        picked, got, seed = [], [], h(aid)
+        for neg, _, key, same in options:
+            if same:
+                pool = _rotated(by_group.get((key, grp), []), seed)
+            else:
+                pool = (j for j in _rotated(buckets[key], seed) if chars[j]["group"] != grp)
+            for j in pool:
+                if j != i:
+                    picked.append(j)
+                    got.append(-neg)
+                    if len(picked) == k:
+                        break
+            if len(picked) == k:
+                break
+        partners += picked + [-1] * (k - len(picked))
+        scores += got + [0] * (k - len(got))
+    return {"version": 1, "k": k, "ids": [c["id"] for c in chars],
+            "rows": rows, "partners": partners, "scores": scores}
+
+
+def write(chars, out_dir, k=DEFAULT_K):
+    index = build(chars, k)
+    path = os.path.join(out_dir, "pairs.json")
+    write_atomic(path, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return path, index
+
+
+class PairIndex:
+    """Reader: top B partners for an A id in O(1)."""
+
+    def __init__(self, index):
+        self.k = index["k"]
+        self.ids = index["ids"]
+        self.rows = index["rows"]
+        self.partners = index["partners"]
+        self.scores = index["scores"]
+        self.pos = {cid: i for i, cid in enumerate(self.ids)}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def top(self, a_id):
+        """[(b_id, score), ...] best first; [] when a_id is not an A character."""
+        row = self.rows[self.pos[a_id]] if a_id in self.pos else -1
+        if row < 0:
+            return []
+        lo = row * self.k
+        return [(self.ids[j], s) for j, s in zip(self.partners[lo:lo + self.k], self.scores[lo:lo + self.k])
+                if j >= 0]
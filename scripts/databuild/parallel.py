@@ -0,0 +1,39 @@
+"""
+Process-pool execution for the per-character stages.
+
+Every transform is a pure function of the record (seeded by h(id)), so the
+roster can be split across workers. Results come back in input order, which
+keeps the output byte-identical to the serial path.
+"""
+import contextlib, itertools
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK = 64
+WINDOW = CHUNK * 64  # records in flight at once
+
+
+@contextlib.contextmanager
+def executor(workers):
+    """Yield a process pool for workers > 1, None for the serial path."""
+    if not workers or workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield ex
+
+
+def map_ordered(fn, items, ex, chunksize=CHUNK):
+    """Lazily yield fn(x) for every item, in order.
+
+    Items are fed in windows of WINDOW so a streamed input never gets pulled
+    into memory all at once.
+    """
+    if ex is None:
+        yield from map(fn, items)
+        return
+    it = iter(items)
+    while True:
+        batch = list(itertools.islice(it, WINDOW))
+        if not batch:
+            return
+        yield from ex.map(fn, batch, chunksize=chunksize)
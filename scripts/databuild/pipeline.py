@@ -0,0 +1,136 @@
+"""
+Declared character stages and the incremental runner.
+
+Every stage exposes deps(...) — the template slices one character reads — next to
+the function that builds/applies it. A stage's per-character key is the hash of
+its code, the previous stage's key for that character and those deps, so a
+tweak to one group's GROUP_BIOLOGY / SIGNATURE_WORDS only rebuilds that group.
+"Its code" is every function and class of the stage module, of the package
+(pick, seeds, …) and of the databuild modules it imports names from — code
+only, never the template tables: whatever data apply()/build() reads has to
+come through deps().
+"""
+import copy, inspect, json, os, sys
+
+from . import CACHE_DIR, content_hash
+from . import add, deep_fix, enrich, generate, metrics, parallel, safety
+
+CACHE_PATH = os.path.join(CACHE_DIR, "characters.cache.json")
+CACHE_VERSION = 1
+
+
+class Stage:
+    """A source stage yields new records (rows/build), a transform rewrites them (apply)."""
+
+    def __init__(self, name, module, source=False):
+        self.name = name
+        self.module = module
+        self.source = source
+        self.fn = module.build if source else module.apply
+        self.code = source_key(module)
+
+
+def source_key(module):
+    """Hash of the functions and classes of the stage module, the package
+    __init__ and every databuild module the stage imports a name from."""
+    pkg = sys.modules[__package__]
+    mods = {module, pkg}
+    for value in vars(module).values():
+        owner = inspect.getmodule(value)
+        if owner is not None and owner.__name__.startswith(pkg.__name__ + "."):
+            mods.add(owner)
+    return content_hash(sorted(inspect.getsource(v) for m in mods for v in vars(m).values()
+                               if (inspect.isfunction(v) or inspect.isclass(v)) and v.__module__ == m.__name__))
+
+
+STAGES = [
+    Stage("generate", generate, source=True),
+    Stage("add", add, source=True),
+    Stage("enrich", enrich),
+    Stage("deep-fix", deep_fix),
+    Stage("safety", safety),
+]
+STAGE_NAMES = [s.name for s in STAGES]
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("stages", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def save_cache(stages, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "stages": stages}, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def _run_source(stage, old, entries):
+    out, built = [], 0
+    for cid, args in stage.module.rows():
+        key = content_hash([stage.code, stage.module.deps(*args)])
+        hit = old.get(cid)
+        if hit and hit[0] == key:
+            rec = hit[1]
+        else:
+            rec = stage.fn(*args)
+            built += 1
+        entries[cid] = [key, rec]
+        out.append((key, rec))
+    return out, built
+
+
+def _run_transform(stage, keyed, old, entries, ex=None):
+    out, todo = [], []
+    for prev_key, c in keyed:
+        key = content_hash([stage.code, prev_key, stage.module.deps(c)])
+        hit = old.get(c["id"])
+        if hit and hit[0] == key:
+            out.append((key, hit[1]))
+        else:
+            todo.append(len(out))
+            out.append((key, c))
+    # worker processes get pickled copies; the serial path copies explicitly
+    inputs = (out[i][1] for i in todo) if ex else (copy.deepcopy(out[i][1]) for i in todo)
+    for i, rec in zip(todo, parallel.map_ordered(stage.fn, inputs, ex)):
+        out[i] = (out[i][0], rec)
+    for key, rec in out:
+        entries[rec["id"]] = [key, rec]
+    return out, len(todo)
+
+
+def run(until=None, use_cache=True, cache_path=CACHE_PATH, workers=1, timings=None, cache=None):
+    """Run stages in order up to `until` (inclusive).
+
+    workers > 1 spreads the transform stages over a process pool; the output
+    is identical to the serial run. Returns (chars, stats) where stats is
+    [(stage, rebuilt, total), ...]; a metrics.Timings gets one step per stage.
+    Records get numeric_id = their 1-based roster position, as in the curated
+    roster (the picker's #N search); cached records are left untouched.
+    A `cache` dict (watch mode keeps it warm) is used and updated in place
+    instead of reading and rewriting the cache file.
+    """
+    timings = timings or metrics.Timings()
+    last = STAGE_NAMES.index(until) if until else len(STAGES) - 1
+    warm = cache is not None
+    if not warm:
+        cache = load_cache(cache_path) if use_cache else {}
+    keyed, stats = [], []
+    with parallel.executor(workers) as ex:
+        for stage in STAGES[:last + 1]:
+            old, entries = cache.get(stage.name, {}), {}
+            with timings.step(stage.name) as step:
+                if stage.source:
+                    produced, built = _run_source(stage, old, entries)
+                    keyed = keyed + produced
+                else:
+                    keyed, built = _run_transform(stage, keyed, old, entries, ex)
+                step.update(built=built, total=len(entries))
+            cache[stage.name] = entries
+            stats.append((stage.name, built, len(entries)))
+    if not warm:
+        save_cache(cache, cache_path)
+    return [dict(rec, numeric_id=n) for n, (_, rec) in enumerate(keyed, 1)], stats
@@ -0,0 +1,227 @@
+"""
+Stage 5 — safety: one Aho–Corasick automaton over every pattern list of
+golden_standard.yaml hard_constraints.safety, run over all string leaves of a
+record (prompt_tokens, identity_anchors, negative_hint_tokens …).
+
+  banned_words   whole words (the \\b rule of validators.js), ASCII case-insensitive,
+                 rewritten with `replacements` ("[REMOVED]" when none is given)
+  overlay_words  substrings — reported, never rewritten (validateNoOverlays)
+  device_words   substrings — reported, never rewritten (validateDeviceInvisible)
+
+A roster record with no overlay/device hit left is stamped `"safety": SPEC_TAG`
+— fnv1a over the pattern lists, which validators.js computes over its own copy
+as SAFETY_SPEC. The shipped roster is hand-curated and never rewritten, so
+stamp() runs it through the same stage and write_roster() emits the result as
+app/data/chars/characters.json — the roster the client loads. generate() skips
+the record-level banned-word scan when its characters and location carry the
+tag; a spec edit the client has not caught up with only costs that scan.
+jokes.json and locations.json are hand-edited and are not rewritten: write()
+scans them with the roster in one pass and lists the clean ids in
+app/data/index/safety.json.
+"""
+import collections, json, os, string
+
+from . import CHARACTERS_PATH, CHARS_DIR, SPEC_DIR, content_hash, load_json, write_atomic
+from .affinity import INDEX_DIR, JOKES_PATH, LOCATIONS_PATH
+from .charindex import compact
+from .search import fnv1a
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional — the safety block is read by _safety_block
+    yaml = None
+
+SPEC_PATH = os.path.join(SPEC_DIR, "golden_standard.yaml")
+SAFETY_PATH = os.path.join(INDEX_DIR, "safety.json")
+LISTS = ("banned_words", "overlay_words", "device_words")
+REMOVED = "[REMOVED]"
+
+# JS regexes without the u flag: only A-Z fold, \b is [A-Za-z0-9_]
+FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+
+def _scalar(text):
+    text = text.strip()
+    return json.loads(text) if text[:1] in '["' else text
+
+
+def _safety_block(text):
+    """hard_constraints.safety without PyYAML: flow lists, quoted scalars and
+    one nested mapping level are all that block uses."""
+    lines = text.splitlines()
+    start = next(i for i, line in enumerate(lines) if line.strip() == "safety:")
+    indent = len(lines[start]) - len(lines[start].lstrip())
+    block, child, sub = {}, None, None
+    for line in lines[start + 1:]:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        depth = len(line) - len(line.lstrip())
+        if depth <= indent:
+            break
+        key, _, value = line.strip().partition(":")
+        child = child or depth
+        if depth > child:
+            sub[key] = _scalar(value)
+        elif value.strip():
+            block[key] = _scalar(value)
+        else:
+            sub = block[key] = {}
+    return block
+
+
+def load_spec(path=SPEC_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if yaml is not None:
+        block = yaml.safe_load(text)["golden_standard_2026"]["hard_constraints"]["safety"]
+    else:
+        block = _safety_block(text)
+    spec = {kind: list(block.get(kind) or []) for kind in LISTS}
+    spec["replacements"] = dict(block.get("replacements") or {})
+    return spec
+
+
+def spec_tag(spec):
+    """8 hex digits; validators.js SAFETY_SPEC hashes the same canonical JSON."""
+    return f"{fnv1a(json.dumps(spec, ensure_ascii=False, sort_keys=True, separators=(',', ':'))):08x}"
+
+
+class Automaton:
+    """Aho–Corasick over (pattern, kind) pairs, compiled to a full DFA: one dict
+    lookup per input character, and a character outside the pattern alphabet
+    falls straight back to the root."""
+
+    def __init__(self, patterns):
+        delta, out = [{}], [()]
+        for word, kind in patterns:
+            s = 0
+            for ch in word:
+                if ch not in delta[s]:
+                    delta[s][ch] = len(delta)
+                    delta.append({})
+                    out.append(())
+                s = delta[s][ch]
+            out[s] += ((word, kind),)
+        alphabet = {ch for word, _ in patterns for ch in word}
+        fail = [0] * len(delta)
+        queue = collections.deque(delta[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, t in delta[s].items():
+                fail[t] = delta[fail[s]].get(ch, 0)
+                out[t] += out[fail[t]]
+                queue.append(t)
+            # fail[s] is shallower, so its row is already complete
+            for ch in alphabet - delta[s].keys():
+                nxt = delta[fail[s]].get(ch, 0)
+                if nxt:
+                    delta[s][ch] = nxt
+        self.delta, self.out = delta, out
+
+    def scan(self, text):
+        """[(start, end, word, kind)] for every occurrence, ASCII case folded."""
+        delta, out = self.delta, self.out
+        s, hits = 0, []
+        for i, ch in enumerate(text.translate(FOLD)):
+            s = delta[s].get(ch, 0)
+            if out[s]:
+                hits.extend((i + 1 - len(word), i + 1, word, kind) for word, kind in out[s])
+        return hits
+
+
+class Scanner:
+    def __init__(self, spec):
+        self.spec = spec
+        self.tag = spec_tag(spec)
+        self.replacements = {w.lower(): r for w, r in spec["replacements"].items()}
+        self.automaton = Automaton([(w.lower(), kind) for kind in LISTS for w in spec[kind]])
+
+    def text(self, text):
+        """(text with banned words rewritten, [(kind, word)] found)."""
+        hits = self.automaton.scan(text)
+        if not hits:
+            return text, []
+        found, banned = [], []
+        for start, end, word, kind in hits:
+            if kind == "banned_words":
+                if (start and text[start - 1] in WORD_CHARS) or (end < len(text) and text[end] in WORD_CHARS):
+                    continue
+                banned.append((start, end, word))
+            found.append((kind, word))
+        parts, pos = [], 0
+        for start, end, word in sorted(banned, key=lambda b: (b[0], -b[1])):
+            if start >= pos:
+                parts += [text[pos:start], self.replacements.get(word, REMOVED)]
+                pos = end
+        return "".join(parts) + text[pos:] if parts else text, found
+
+    def value(self, value, path, found):
+        if isinstance(value, str):
+            value, hits = self.text(value)
+            found.extend((path, kind, word) for kind, word in hits)
+        elif isinstance(value, list):
+            value = [self.value(v, f"{path}[{i}]", found) for i, v in enumerate(value)]
+        elif isinstance(value, dict):
+            value = {k: self.value(v, f"{path}.{k}" if path else k, found) for k, v in value.items()}
+        return value
+
+    def record(self, rec):
+        """(record with banned words rewritten, [(path, kind, word)])."""
+        found = []
+        rec = self.value(rec, "", found)
+        return rec, found
+
+
+SPEC = load_spec()
+SCANNER = Scanner(SPEC)
+
+
+def deps(c):
+    return SPEC
+
+
+def apply(c):
+    c, found = SCANNER.record({k: v for k, v in c.items() if k != "safety"})
+    if all(kind == "banned_words" for _, kind, _ in found):
+        c["safety"] = SCANNER.tag
+    return c
+
+
+def stamp(chars):
+    """The roster as the client gets it: records stamped with the current spec
+    are kept, the rest go through apply()."""
+    return [c if c.get("safety") == SCANNER.tag else apply(c) for c in chars]
+
+
+def write_roster(chars, out_dir=CHARS_DIR):
+    """Write the stamped roster (compact JSON) the client loads; returns (path, size)."""
+    data = compact(chars)
+    path = os.path.join(out_dir, "characters.json")
+    write_atomic(path, data)
+    return path, len(data)
+
+
+def scan(datasets, scanner=SCANNER):
+    """{kind: records} → index: ids clean as they are, and every finding."""
+    index = {"version": 1, "spec": scanner.tag, "cleared": {}, "findings": []}
+    for kind, records in datasets.items():
+        cleared = index["cleared"][kind] = []
+        for r in records:
+            _, found = scanner.record(r)
+            if not found:
+                cleared.append(r["id"])
+            index["findings"] += [{"kind": kind, "id": r["id"], "path": path, "list": lst, "word": word}
+                                  for path, lst, word in found]
+    return index
+
+
+def write(out_path=SAFETY_PATH, chars_path=CHARACTERS_PATH, jokes_path=JOKES_PATH, locations_path=LOCATIONS_PATH,
+          chars=None):
+    """chars: the roster already in memory (watch mode) instead of chars_path."""
+    datasets = {"character": load_json(chars_path) if chars is None else chars,
+                "joke": load_json(jokes_path), "location": load_json(locations_path)}
+    index = scan(datasets)
+    index["source"] = content_hash(list(datasets.values()))[:16]
+    write_atomic(out_path, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return out_path, index
@@ -0,0 +1,353 @@
+"""
+Episode schedule planner for content queues: an A/B pair, a location and a
+joke per episode, planned hundreds to thousands of episodes ahead.
+
+Hard rules — the windows of app/engine/history_cache.js (MAX_HISTORY entries
+per list) plus one for jokes:
+  locations  one entry per episode   → no location twice within WINDOW episodes
+  wardrobes  two entries per episode → no character twice within WINDOW / 2
+                                       episodes (characters sharing a wardrobe_anchor
+                                       share the window)
+  jokes      no joke twice within joke_window episodes (half the joke pool)
+The joke theme is the episode category; history_cache only records those, so
+a repeat within THEME_GAP episodes costs score instead of being forbidden.
+
+Score of an episode: the joke's viral_score, the pair's chemistry
+(pairing.pair_score), how long both characters have rested (cast rotation,
+full bonus after half a roster's worth of episodes), whether the location is the
+joke's best_location or of its theme's category, and a penalty for a joke
+that does not suit either group.
+
+Search: receding-horizon beam search. A block of HORIZON episodes is planned
+by BEAM partial schedules, each slot expanded from a few candidates — the
+longest-resting A characters, their PairIndex partners, the pair's best
+jokes (AffinityIndex), the best-fitting free location — and the best block is
+committed before the next one starts from its end. Candidate lists are
+filtered once per block against the committed history, so an episode costs
+O(BEAM × candidates) and the plan is linear in its length. BEAM = HORIZON = 1
+is the greedy one-at-a-time pick the browser makes.
+
+A window the data cannot fill (a roster with 8 A wardrobes cannot go 10
+episodes without repeating one) is shrunk to the largest feasible one and
+listed in Planner.relaxed; a plan that still runs out of candidates raises
+Infeasible, naming what ran out.
+"""
+import heapq, itertools, json, os
+
+from . import h
+from .affinity import AffinityIndex, build as build_affinity
+from .pairing import A_ROLES, B_ROLES, PairIndex, build as build_pairs, pair_score
+
+WINDOW = 20  # history_cache.js MAX_HISTORY
+BEAM = 8
+HORIZON = 12
+A_CANDIDATES, B_CANDIDATES, JOKE_CANDIDATES = 3, 2, 2
+PAIR_K = 8
+THEME_GAP = 2
+
+CHEMISTRY_WEIGHT = 0.1
+ROTATION_WEIGHT = 10
+BEST_LOCATION, CATEGORY_LOCATION = 5, 2
+THEME_REPEAT = -5
+OFF_GROUP = -10
+NEVER = -10 ** 9
+
+# jokes.json theme → locations.json category_hints
+THEME_CATEGORIES = {
+    "ЖКХ": "ЖКХ и коммуналка", "дача": "Дача и огород", "деньги": "Цены и инфляция",
+    "здоровье": "Здоровье и поликлиника", "отношения": "Отношения", "поколения": "Разрыв поколений",
+    "семья": "Отношения", "технологии": "AI и технологии", "транспорт": "Транспорт и пробки",
+}
+
+
+class Infeasible(ValueError):
+    """No pair/joke/location fits the windows."""
+
+
+def _norm(s):
+    return (s or "").lower().strip()  # HistoryCache._normalize
+
+
+def _tail(xs, n):
+    """The last n items (none for n = 0, unlike xs[-0:])."""
+    return xs[max(0, len(xs) - n):] if n > 0 else xs[:0]
+
+
+def wardrobe(c):
+    return _norm((c.get("identity_anchors") or {}).get("wardrobe_anchor")) or c["id"]
+
+
+class Planner:
+    def __init__(self, chars, jokes, locations, window=WINDOW, joke_window=None, beam=BEAM, horizon=HORIZON):
+        self.chars, self.jokes, self.locations = chars, jokes, locations
+        self.loc_window = window
+        self.char_window = window // 2
+        self.joke_window = len(jokes) // 2 if joke_window is None else joke_window
+        self.beam, self.horizon = beam, horizon
+        self.rest = max(1, len(chars) // 2)
+
+        pos = {c["id"]: i for i, c in enumerate(chars)}
+        self.pairs = PairIndex(build_pairs(chars, PAIR_K))
+        self.partners = {i: [(pos[b], s) for b, s in self.pairs.top(c["id"])] for i, c in enumerate(chars)}
+        self.a_pool = [i for i, c in enumerate(chars) if c.get("role_default") in A_ROLES]
+        self.b_pool = [i for i, c in enumerate(chars) if c.get("role_default") in B_ROLES]
+        wardrobes = {}
+        self.wid = [wardrobes.setdefault(wardrobe(c), len(wardrobes)) for c in chars]
+        self.wardrobe_ids = wardrobes
+
+        self.relaxed = self._fit_windows()
+
+        self.affinity = AffinityIndex(build_affinity(jokes, locations)[0])
+        self.joke_pos = {j["id"]: i for i, j in enumerate(jokes)}
+        self.by_viral = sorted(range(len(jokes)), key=lambda i: (-jokes[i].get("viral_score", 0), i))
+        loc_pos = {loc["id"]: i for i, loc in enumerate(locations)}
+        self.joke_locations = []
+        for j in jokes:
+            fit = {}
+            category = THEME_CATEGORIES.get(j.get("theme"))
+            for loc in self.affinity.locations_for_category(category) if category else ():
+                fit[loc_pos[loc]] = CATEGORY_LOCATION
+            if j.get("best_location") in loc_pos:
+                fit[loc_pos[j["best_location"]]] = BEST_LOCATION
+            self.joke_locations.append(sorted(fit.items(), key=lambda lf: (-lf[1], lf[0])))
+        self._pair_jokes = {}
+        self.reset()
+
+    def _fit_windows(self):
+        """Shrink every window to what the data can fill; [(dimension, asked, used, why)].
+
+        Each episode takes one A and one other B wardrobe, so char_window + 1
+        episodes in a row need that many distinct wardrobes on each side and
+        twice that in total."""
+        a = {self.wid[i] for i in self.a_pool}
+        b = {self.wid[i] for i in self.b_pool}
+        limits = [("wardrobes", "char_window", min(len(a), len(b), len(a | b) // 2) - 1,
+                   f"{len(a)} A / {len(b)} B wardrobes"),
+                  ("locations", "loc_window", len(self.locations) - 1, f"{len(self.locations)} locations"),
+                  ("jokes", "joke_window", len(self.jokes) - 1, f"{len(self.jokes)} jokes")]
+        relaxed = []
+        for dim, attr, cap, why in limits:
+            if cap < 0:
+                raise Infeasible(f"no episode fits: {why}")
+            asked = getattr(self, attr)
+            if asked > cap:
+                setattr(self, attr, cap)
+                relaxed.append((dim, asked, cap, why))
+        return relaxed
+
+    def reset(self):
+        """Forget the committed history (last use per character / location / joke)."""
+        self.t = 0
+        self.last = {"wardrobe": {}, "loc": {}, "joke": {}}
+        self.themes = []
+
+    def seed_history(self, history):
+        """Continue from a browser history cache ({"locations": [scene_en…],
+        "wardrobes": […], "categories": […]} as stored under ferixdi_history_cache)."""
+        scenes = {_norm(loc.get("scene_en")): i for i, loc in enumerate(self.locations)}
+        for k, scene in enumerate(reversed(_tail(history.get("locations", ()), self.loc_window))):
+            if _norm(scene) in scenes:
+                self.last["loc"].setdefault(scenes[_norm(scene)], self.t - 1 - k)
+        for k, w in enumerate(reversed(_tail(history.get("wardrobes", ()), 2 * self.char_window))):
+            if _norm(w) in self.wardrobe_ids:
+                self.last["wardrobe"].setdefault(self.wardrobe_ids[_norm(w)], self.t - 1 - k // 2)
+
+    def pair_jokes(self, a, b):
+        key = (self.chars[a]["group"], self.chars[b]["group"])
+        if key not in self._pair_jokes:
+            self._pair_jokes[key] = [self.joke_pos[j] for j in self.affinity.jokes_for_pair(*key)]
+        return self._pair_jokes[key]
+
+    # ── one block ──
+
+    def _free(self, last, window, items, end, key=None):
+        """(item, free_at) for items usable before `end` under the committed history, order kept."""
+        out = []
+        for i in items:
+            free_at = last.get(i if key is None else key[i], NEVER) + window + 1
+            if free_at < end:
+                out.append((i, free_at))
+        return out
+
+    def _rested(self, pool, end):
+        last, wid = self.last["wardrobe"], self.wid
+        order = sorted(pool, key=lambda i: (last.get(wid[i], NEVER), h(self.chars[i]["id"])))
+        return self._free(last, self.char_window, order, end, wid)
+
+    def _views(self, end):
+        """Candidate lists for the block ending before `end`, filtered once against the committed history."""
+        last = self.last
+        locs = sorted(range(len(self.locations)), key=lambda i: (last["loc"].get(i, NEVER), i))
+        views = {"end": end, "pair": {},
+                 "a": self._rested(self.a_pool, end), "b": self._rested(self.b_pool, end),
+                 "jokes": self._free(last["joke"], self.joke_window, self.by_viral, end),
+                 "locs": self._free(last["loc"], self.loc_window, locs, end)}
+        for kind, window in (("wardrobe", self.char_window), ("joke", self.joke_window), ("loc", self.loc_window)):
+            views[kind] = {i: t + window + 1 for i, t in last[kind].items()}
+        return views
+
+    def _expand(self, t, tail, views):
+        """Scored (episode, score) continuations of a partial block at episode t."""
+        wid = self.wid
+        used = {}  # (kind, i) → last use inside the block
+        for k, (a, b, loc, joke) in enumerate(tail):
+            tt = t - len(tail) + k
+            used["wardrobe", wid[a]] = used["wardrobe", wid[b]] = tt
+            used["loc", loc] = tt
+            used["joke", joke] = tt
+        themes = (self.themes + [self.jokes[ep[3]].get("theme") for ep in tail])[-THEME_GAP:]
+
+        def ok(kind, i, free_at, window):
+            return free_at <= t and used.get((kind, i), NEVER) + window < t
+
+        def char_ok(i, free_at=None):
+            w = wid[i]
+            return ok("wardrobe", w, views["wardrobe"].get(w, NEVER) if free_at is None else free_at, self.char_window)
+
+        def rested(i):
+            last = used.get(("wardrobe", wid[i]), self.last["wardrobe"].get(wid[i], NEVER))
+            return ROTATION_WEIGHT * min(t - last, self.rest) / self.rest
+
+        out = []
+        take = itertools.islice
+        for a in take((a for a, free_at in views["a"] if char_ok(a, free_at)), A_CANDIDATES):
+            # best-chemistry partners + the longest-resting B, so the whole B side rotates
+            bs = list(take(((b, s) for b, s in self.partners[a] if wid[b] != wid[a] and char_ok(b)), B_CANDIDATES))
+            seen = {b for b, _ in bs}
+            bs += [(b, pair_score(self.chars[a], self.chars[b])) for b in take(
+                (b for b, free_at in views["b"] if b not in seen and wid[b] != wid[a] and char_ok(b, free_at)), 1)]
+            for b, chem in bs:
+                base = CHEMISTRY_WEIGHT * chem + rested(a) + rested(b)
+                jokes = self._pair_view(a, b, views)
+                picks = list(take(((j, 0) for j in jokes
+                                   if ok("joke", j, views["joke"].get(j, NEVER), self.joke_window)), JOKE_CANDIDATES))
+                if len(picks) < JOKE_CANDIDATES:
+                    picks += take(((j, OFF_GROUP) for j, free_at in views["jokes"]
+                                   if ok("joke", j, free_at, self.joke_window) and j not in jokes),
+                                  JOKE_CANDIDATES - len(picks))
+                for j, off in picks:
+                    joke = self.jokes[j]
+                    loc, fit = self._location(t, j, used, views)
+                    if loc is None:
+                        continue
+                    s = base + joke.get("viral_score", 0) + off + fit
+                    if joke.get("theme") in themes:
+                        s += THEME_REPEAT
+                    out.append(((a, b, loc, j), s))
+        return out
+
+    def _pair_view(self, a, b, views):
+        key = (self.chars[a]["group"], self.chars[b]["group"])
+        if key not in views["pair"]:
+            free = views["joke"]
+            views["pair"][key] = [j for j in self.pair_jokes(a, b) if free.get(j, NEVER) < views["end"]]
+        return views["pair"][key]
+
+    def _location(self, t, j, used, views):
+        loc_free = views["loc"]
+        for loc, fit in self.joke_locations[j]:
+            if loc_free.get(loc, NEVER) <= t and used.get(("loc", loc), NEVER) + self.loc_window < t:
+                return loc, fit
+        for loc, free_at in views["locs"]:
+            if free_at <= t and used.get(("loc", loc), NEVER) + self.loc_window < t:
+                return loc, 0
+        return None, 0
+
+    def _block(self, n):
+        t0 = self.t
+        views = self._views(t0 + n)
+        beams = [(0.0, (), ())]  # (score, episodes, episode scores)
+        for t in range(t0, t0 + n):
+            cand = []
+            for score, tail, scores in beams:
+                for ep, s in self._expand(t, tail, views):
+                    cand.append((score + s, tail + (ep,), scores + (s,)))
+            if not cand:
+                free = {kind: sum(free_at <= t for _, free_at in views[kind]) for kind in ("a", "b", "jokes", "locs")}
+                raise Infeasible(f"episode {t + 1}: no pair/joke/location fits the windows (free before the "
+                                 f"block: {free['a']} A, {free['b']} B characters, {free['jokes']} jokes, "
+                                 f"{free['locs']} locations)")
+            beams = heapq.nlargest(self.beam, cand, key=lambda c: c[0])
+        _, episodes, scores = beams[0]
+        return episodes, scores
+
+    def _commit(self, episodes):
+        for a, b, loc, j in episodes:
+            self.last["wardrobe"][self.wid[a]] = self.last["wardrobe"][self.wid[b]] = self.t
+            self.last["loc"][loc] = self.t
+            self.last["joke"][j] = self.t
+            self.themes = (self.themes + [self.jokes[j].get("theme")])[-THEME_GAP:]
+            self.t += 1
+
+    def plan(self, n):
+        """Yield n episode dicts in order; blocks are committed as they are planned."""
+        while n > 0:
+            episodes, scores = self._block(min(self.horizon, n))
+            first = self.t
+            self._commit(episodes)
+            for k, ((a, b, loc, j), s) in enumerate(zip(episodes, scores)):
+                joke = self.jokes[j]
+                yield {"n": first + k + 1, "a": self.chars[a]["id"], "b": self.chars[b]["id"],
+                       "location": self.locations[loc]["id"], "joke": joke["id"], "theme": joke.get("theme"),
+                       "viral_score": joke.get("viral_score", 0), "score": round(s, 2)}
+            n -= len(episodes)
+
+
+def violations(plan, chars, locations, window=WINDOW, joke_window=None, jokes_total=0, char_window=None,
+               history=None):
+    """Replays the plan through HistoryCache's own lists (scene_en / wardrobe_anchor
+    strings: the last `window` locations, the last 2 × char_window wardrobes),
+    starting from the `history` the planner was seeded with, and returns every
+    broken rule."""
+    by_id = {c["id"]: c for c in chars}
+    scenes = {loc["id"]: _norm(loc.get("scene_en")) for loc in locations}
+    joke_window = jokes_total // 2 if joke_window is None else joke_window
+    char_window = window // 2 if char_window is None else char_window
+    history = history or {}
+    recent_locs = [_norm(s) for s in history.get("locations", ())]
+    recent_wardrobes = [_norm(w) for w in history.get("wardrobes", ())]
+    joke_last, out = {}, []
+    for ep in plan:
+        scene = scenes[ep["location"]]
+        if scene in _tail(recent_locs, window):
+            out.append(f"episode {ep['n']}: location {ep['location']} within {window}")
+        for role in ("a", "b"):
+            w = wardrobe(by_id[ep[role]])
+            if w in _tail(recent_wardrobes, 2 * char_window):
+                out.append(f"episode {ep['n']}: {ep[role]} wardrobe within {char_window}")
+        if ep["a"] == ep["b"]:
+            out.append(f"episode {ep['n']}: {ep['a']} paired with itself")
+        if ep["n"] - joke_last.get(ep["joke"], NEVER) <= joke_window:
+            out.append(f"episode {ep['n']}: joke {ep['joke']} within {joke_window}")
+        recent_locs.append(scene)
+        recent_wardrobes += [wardrobe(by_id[ep["a"]]), wardrobe(by_id[ep["b"]])]
+        joke_last[ep["joke"]] = ep["n"]
+    return out
+
+
+def summary(plan, chars):
+    """Mean viral_score / score, cast coverage and the shortest rest between appearances."""
+    last, gaps, roles = {}, [], {"a": set(), "b": set()}
+    for ep in plan:
+        for role in ("a", "b"):
+            cid = ep[role]
+            roles[role].add(cid)
+            if cid in last:
+                gaps.append(ep["n"] - last[cid])
+            last[cid] = ep["n"]
+    n = len(plan) or 1
+    return {"episodes": len(plan), "viral": sum(ep["viral_score"] for ep in plan) / n,
+            "score": sum(ep["score"] for ep in plan) / n,
+            "cast": len(roles["a"] | roles["b"]), "roster": len(chars),
+            "jokes": len({ep["joke"] for ep in plan}), "locations": len({ep["location"] for ep in plan}),
+            "min_rest": min(gaps) if gaps else None, "mean_rest": sum(gaps) / len(gaps) if gaps else None}
+
+
+def write_jsonl(episodes, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for ep in episodes:
+            f.write(json.dumps(ep, ensure_ascii=False, separators=(",", ":")) + "\n")
+            n += 1
+    return n
@@ -0,0 +1,273 @@
+"""
+Full-text search index over characters, jokes, locations and course.json.
+
+Text is normalized the same way on both sides (app/engine/search.js is the
+client port): lowercase, ё → е, split on anything that is not [0-9a-zа-я],
+drop STOPWORDS, and Cyrillic words are cut to their stem with the Snowball
+Russian stemmer ("бухгалтера", "бухгалтером" → "бухгалтер").
+
+Every document is scored per term as Σ field boost × occurrences (capped at
+MAX_WEIGHT); a query ANDs its terms and ranks by the summed weight.
+
+Files (app/data/index/search/):
+  meta.json       {"version": 1, "source", "shards": S, "kinds": [...],
+                   "doc_kind": [...], "doc_id": [...], "doc_label": [...], "terms": T}
+  shard-<k>.json  {term: postings} for every term with fnv1a(term) % S == k
+
+Postings are delta-encoded: doc indices ascending, each entry packed as
+(gap << 4) | weight, so a frequent term is a list of small integers. The
+shard count is the smallest power of two that keeps shards around
+SHARD_BYTES, so a client loads only the few shards its query terms hash to.
+"""
+import functools, json, os, re
+
+from . import CHARACTERS_PATH, DATA_DIR, content_hash, load_json, write_atomic
+from .affinity import INDEX_DIR, JOKES_PATH, LOCATIONS_PATH
+
+COURSE_PATH = os.path.join(DATA_DIR, "course.json")
+SEARCH_DIR = os.path.join(INDEX_DIR, "search")
+KINDS = ("character", "joke", "location", "course")
+MAX_WEIGHT = 15
+SHARD_BYTES = 32 * 1024
+LABEL_CHARS = 80
+
+# kind → [(field, boost)]; course sections are flattened generically (course_docs)
+FIELDS = {
+    "character": [("name_ru", 3), ("group", 2), ("tags", 2), ("tagline_ru", 1), ("behavior_ru", 1),
+                  ("speech_style_ru", 1), ("signature_words_ru", 1)],
+    "joke": [("theme", 3), ("tags", 2), ("text", 1)],
+    "location": [("name_ru", 3), ("group", 2), ("tags", 2), ("category_hints", 2), ("tagline_ru", 1)],
+}
+
+STOPWORDS = frozenset(
+    "а без бы в во вот все всё да для до же за и из или к как ли мы на над не нет ни но о об "
+    "от по под при с со та то тот ты у уже что это я".replace("ё", "е").split()
+)
+
+TOKEN_RE = re.compile(r"[0-9a-zа-я]+")
+CYRILLIC_RE = re.compile(r"[а-я]")
+
+# Snowball Russian stemmer (same regexes in search.js)
+RV_RE = re.compile(r"^(.*?[аеиоуыэюя])(.*)$")
+PERFECTIVE_GERUND = re.compile(r"((ив|ивши|ившись|ыв|ывши|ывшись)|((?<=[ая])(в|вши|вшись)))$")
+REFLEXIVE = re.compile(r"(с[яь])$")
+ADJECTIVE = re.compile(r"(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|ую|юю|ая|яя|ою|ею)$")
+PARTICIPLE = re.compile(r"((ивш|ывш|ующ)|((?<=[ая])(ем|нн|вш|ющ|щ)))$")
+VERB = re.compile(r"((ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено|ят|ует|уют|ит|ыт|ены|ить"
+                  r"|ыть|ишь|ую|ю)|((?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)))$")
+NOUN = re.compile(r"(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|ам|ом|о|у|ах|иях|ях|ы|ь|ию"
+                  r"|ью|ю|ия|ья|я)$")
+DERIVATIONAL = re.compile(r".*[^аеиоуыэюя]+[аеиоуыэюя].*ость?$")
+DER = re.compile(r"ость?$")
+SUPERLATIVE = re.compile(r"(ейше|ейш)$")
+I_END, SOFT_SIGN, DOUBLE_N = re.compile("и$"), re.compile("ь$"), re.compile("нн$")
+
+
+def _cut(pattern, s):
+    return pattern.sub("", s, count=1)
+
+
+@functools.lru_cache(maxsize=None)
+def stem(word):
+    m = RV_RE.match(word)
+    if not m:
+        return word
+    pre, rv = m.groups()
+    temp = _cut(PERFECTIVE_GERUND, rv)
+    if temp == rv:
+        rv = _cut(REFLEXIVE, rv)
+        temp = _cut(ADJECTIVE, rv)
+        if temp != rv:
+            rv = _cut(PARTICIPLE, temp)
+        else:
+            temp = _cut(VERB, rv)
+            rv = _cut(NOUN, rv) if temp == rv else temp
+    else:
+        rv = temp
+    rv = _cut(I_END, rv)
+    if DERIVATIONAL.match(rv):
+        rv = _cut(DER, rv)
+    temp = _cut(SOFT_SIGN, rv)
+    if temp == rv:
+        rv = DOUBLE_N.sub("н", _cut(SUPERLATIVE, rv))
+    else:
+        rv = temp
+    return pre + rv
+
+
+def terms(text):
+    """Normalized index terms of a text, in order (repeats kept)."""
+    out = []
+    for tok in TOKEN_RE.findall(text.lower().replace("ё", "е")):
+        if tok in STOPWORDS:
+            continue
+        out.append(stem(tok) if CYRILLIC_RE.search(tok) else tok)
+    return out
+
+
+def fnv1a(s):
+    h = 0x811C9DC5
+    for b in s.encode("utf-8"):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+
+
+def _label(text):
+    text = " ".join(text.split())
+    return text if len(text) <= LABEL_CHARS else text[:LABEL_CHARS - 1] + "…"
+
+
+def record_docs(kind, records, label_field):
+    for r in records:
+        yield kind, r["id"], _label(r.get(label_field) or r["id"]), [
+            (" ".join(_strings(r.get(field, ""))), boost) for field, boost in FIELDS[kind]]
+
+
+def course_docs(course):
+    """One document per list item / sub-section of course.json; the first
+    string of a document is its title (boost 3), the rest is body."""
+    def doc(key, value):
+        if isinstance(value, dict):
+            value = {k: v for k, v in value.items() if k != "id"}
+        texts = list(_strings(value))
+        if texts:
+            yield "course", key, _label(texts[0]), [(texts[0], 3), (" ".join(texts[1:]), 1)]
+
+    for section, value in course.items():
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                yield from doc(f"{section}/{item.get('id', i) if isinstance(item, dict) else i}", item)
+        elif isinstance(value, dict):
+            for sub, item in value.items():
+                if isinstance(item, list):
+                    for i, entry in enumerate(item):
+                        yield from doc(f"{section}/{sub}/{i}", entry)
+                else:
+                    yield from doc(f"{section}/{sub}", item)
+        else:
+            yield from doc(section, value)
+
+
+def documents(chars, jokes, locations, course):
+    yield from record_docs("character", chars, "name_ru")
+    yield from record_docs("joke", jokes, "line_a")
+    yield from record_docs("location", locations, "name_ru")
+    yield from course_docs(course)
+
+
+def _shard_count(postings):
+    # rough serialized size: "term":[n,n,…], — packed entries average ~3 chars
+    size = sum(len(t.encode("utf-8")) + 5 + 3 * len(p) for t, p in postings.items())
+    n = 1
+    while size / n > SHARD_BYTES:
+        n *= 2
+    return n
+
+
+def build(docs, source=""):
+    """docs: iterable of (kind, id, label, [(text, boost)]). Returns (meta, shards)."""
+    meta = {"version": 1, "source": source, "kinds": list(KINDS), "doc_kind": [], "doc_id": [], "doc_label": []}
+    postings = {}
+    for d, (kind, doc_id, label, fields) in enumerate(docs):
+        meta["doc_kind"].append(KINDS.index(kind))
+        meta["doc_id"].append(doc_id)
+        meta["doc_label"].append(label)
+        weights = {}
+        for text, boost in fields:
+            for t in terms(text):
+                weights[t] = weights.get(t, 0) + boost
+        for t, w in weights.items():
+            postings.setdefault(t, []).append((d, min(w, MAX_WEIGHT)))
+
+    n = _shard_count(postings)
+    shards = [{} for _ in range(n)]
+    for t in sorted(postings):
+        packed, prev = [], 0
+        for d, w in postings[t]:
+            packed.append((d - prev) << 4 | w)
+            prev = d
+        shards[fnv1a(t) % n][t] = packed
+    meta.update(shards=n, terms=len(postings))
+    return meta, shards
+
+
+def write(out_dir=SEARCH_DIR, chars_path=CHARACTERS_PATH, jokes_path=JOKES_PATH, locations_path=LOCATIONS_PATH,
+          course_path=COURSE_PATH, chars=None):
+    """chars: the roster already in memory (watch mode) instead of chars_path."""
+    sources = [load_json(chars_path) if chars is None else chars] + [
+        load_json(p) for p in (jokes_path, locations_path, course_path)]
+    meta, shards = build(documents(*sources), content_hash(sources)[:16])
+    return dump(meta, shards, out_dir), meta
+
+
+def dump(meta, shards, out_dir=SEARCH_DIR):
+    """Shards first, meta.json last — a reader never sees a meta whose shards are missing."""
+    names = {"meta.json"}
+    for k, shard in enumerate(shards):
+        names.add(f"shard-{k}.json")
+        write_atomic(os.path.join(out_dir, f"shard-{k}.json"),
+                     json.dumps(shard, ensure_ascii=False, separators=(",", ":")))
+    write_atomic(os.path.join(out_dir, "meta.json"), json.dumps(meta, ensure_ascii=False, separators=(",", ":")))
+    for fname in os.listdir(out_dir):
+        if fname.startswith("shard-") and fname not in names:
+            os.remove(os.path.join(out_dir, fname))
+    return out_dir
+
+
+def unpack(packed):
+    """Delta-encoded postings → [(doc, weight)]."""
+    out, d = [], 0
+    for p in packed:
+        d += p >> 4
+        out.append((d, p & 15))
+    return out
+
+
+class SearchIndex:
+    """Reader over app/data/index/search/ — shards are read on first use."""
+
+    def __init__(self, meta, out_dir=SEARCH_DIR):
+        self.meta = meta
+        self.dir = out_dir
+        self._shards = {}
+
+    @classmethod
+    def load(cls, out_dir=SEARCH_DIR):
+        return cls(load_json(os.path.join(out_dir, "meta.json")), out_dir)
+
+    def _shard(self, k):
+        if k not in self._shards:
+            self._shards[k] = load_json(os.path.join(self.dir, f"shard-{k}.json"))
+        return self._shards[k]
+
+    def postings(self, term):
+        return self._shard(fnv1a(term) % self.meta["shards"]).get(term, ())
+
+    def search(self, query, kind=None, limit=20):
+        """[(kind, id, label, score)], best first; every query term must match."""
+        qterms = list(dict.fromkeys(terms(query)))
+        if not qterms:
+            return []
+        lists = sorted((unpack(self.postings(t)) for t in qterms), key=len)
+        scores = dict(lists[0])
+        for plist in lists[1:]:
+            if not scores:
+                break
+            scores = {d: scores[d] + w for d, w in plist if d in scores}
+        if kind is not None:
+            k = KINDS.index(kind)
+            scores = {d: s for d, s in scores.items() if self.meta["doc_kind"][d] == k}
+        best = sorted(scores.items(), key=lambda ds: (-ds[1], ds[0]))[:limit]
+        m = self.meta
+        return [(KINDS[m["doc_kind"][d]], m["doc_id"][d], m["doc_label"][d], s) for d, s in best]
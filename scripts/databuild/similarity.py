@@ -0,0 +1,237 @@
+"""
+Near-duplicate characters: the description fields the face-stability and
+serial-uniqueness goals depend on (prompt_tokens.character_en, appearance_ru,
+identity_anchors) come from small template pools picked by seed % len, so
+different characters can end up with the same face.
+
+Two tiers:
+  exact  one dict pass per field (and over the whole field tuple) — clusters of
+         characters whose text is identical
+  near   MinHash over word-bigram shingles + LSH banding, verified against the
+         MinHash Jaccard estimate; clusters are union-find components
+
+Signatures use one-permutation hashing: each shingle is hashed once (crc32)
+and lands in one of NUM_BINS bins that keep their minimum, empty bins are
+filled from the next non-empty one. Pool values repeat a lot, so the bins of
+every distinct field value are computed once and a character's signature is
+the element-wise min over its fields. Identical signatures collapse to one
+node, and only pairs sharing an LSH bucket are compared. At THRESHOLD 0.8 a
+qualifying pair differs in at most 12 of 64 bins, so it shares at least 4 of
+the 16 bands: the components are exactly those of the all-pairs check (for
+buckets up to MAX_BUCKET), at
+O(N × BANDS + bucket pairs) instead of O(N²).
+
+reseed() moves colliding characters to a new seed (databuild.SALTS, kept in
+reseed.json) and reruns the incremental pipeline until no cluster is left.
+reseed.json is opt-in: it only exists once someone ran find_duplicates.py
+--reseed, and it changes the picks of every salted character, so committing
+it is a data change to review like any other (build_chars.py says when one is
+in use).
+"""
+import json, re, zlib
+
+from . import RESEED_PATH, SALTS, write_atomic
+
+FIELDS = ("character_en", "appearance_ru", "identity_anchors")
+NUM_BINS = 64
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+THRESHOLD = 0.8
+MAX_ROUNDS = 20
+MAX_BUCKET = 512
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_EMPTY = 1 << 32
+_WORD = re.compile(r"\w+")
+
+
+def field_values(c):
+    """(field, text) pairs of one character; identity_anchors is split per anchor."""
+    out = [("character_en", (c.get("prompt_tokens") or {}).get("character_en") or ""),
+           ("appearance_ru", c.get("appearance_ru") or "")]
+    for k, v in sorted((c.get("identity_anchors") or {}).items()):
+        out.append((f"identity_anchors.{k}", " ".join(v) if isinstance(v, list) else str(v)))
+    return out
+
+
+def exact_key(c, field):
+    if field == "character_en":
+        return (c.get("prompt_tokens") or {}).get("character_en") or ""
+    if field == "identity_anchors":
+        return json.dumps(c.get("identity_anchors") or {}, ensure_ascii=False, sort_keys=True)
+    return c.get(field) or ""
+
+
+def exact_clusters(chars, fields=FIELDS):
+    """{field | "all": [[index, ...], ...]} — identical values, clusters of 2+."""
+    out = {}
+    for field in fields + ("all",):
+        seen = {}
+        for i, c in enumerate(chars):
+            key = tuple(exact_key(c, f) for f in fields) if field == "all" else exact_key(c, field)
+            seen.setdefault(key, []).append(i)
+        out[field] = [ids for ids in seen.values() if len(ids) > 1]
+    return out
+
+
+def _value_bins(field, text):
+    words = _WORD.findall(text.lower())
+    shingles = [f"{a} {b}" for a, b in zip(words, words[1:])] or words
+    bins = [_EMPTY] * NUM_BINS
+    mask = NUM_BINS - 1
+    for s in shingles:
+        x = zlib.crc32(f"{field}|{s}".encode())
+        b, v = x & mask, x >> _BIN_BITS
+        if v < bins[b]:
+            bins[b] = v
+    return bins
+
+
+def _densify(bins):
+    """Fill empty bins from the next non-empty one (offset by the distance)."""
+    if _EMPTY not in bins:
+        return tuple(bins)
+    if min(bins) == _EMPTY:
+        return None
+    out = list(bins)
+    for i, v in enumerate(bins):
+        if v == _EMPTY:
+            d = 1
+            while bins[(i + d) % NUM_BINS] == _EMPTY:
+                d += 1
+            out[i] = bins[(i + d) % NUM_BINS] + d * _EMPTY
+    return tuple(out)
+
+
+class Signer:
+    """MinHash signatures with per-value memoisation."""
+
+    def __init__(self):
+        self.memo = {}
+
+    def sign(self, c):
+        parts = []
+        for field, text in field_values(c):
+            key = (field, text)
+            bins = self.memo.get(key)
+            if bins is None:
+                bins = self.memo[key] = _value_bins(field, text)
+            parts.append(bins)
+        return _densify(list(map(min, *parts))) if len(parts) > 1 else _densify(parts[0])
+
+
+def similarity(sa, sb):
+    """MinHash estimate of the Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(sa, sb) if x == y) / NUM_BINS
+
+
+class _Components:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        p = self.parent
+        while p[i] != i:
+            p[i] = p[p[i]]
+            i = p[i]
+        return i
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+    def groups(self):
+        out = {}
+        for i in range(len(self.parent)):
+            out.setdefault(self.find(i), []).append(i)
+        return list(out.values())
+
+
+def _link(members, sigs, comp, threshold):
+    """Join the verified pairs of one LSH bucket, skipping pairs already joined.
+    Buckets over MAX_BUCKET only check each member against one representative
+    per component seen so far, which keeps a degenerate bucket linear."""
+    if len(members) > MAX_BUCKET:
+        reps = []
+        for n in members:
+            root = comp.find(n)
+            for r in reps:
+                if comp.find(r) == root:
+                    break
+                if similarity(sigs[r], sigs[n]) >= threshold:
+                    comp.union(r, n)
+                    break
+            else:
+                reps.append(n)
+        return
+    for k, a in enumerate(members):
+        for b in members[k + 1:]:
+            if comp.find(a) != comp.find(b) and similarity(sigs[a], sigs[b]) >= threshold:
+                comp.union(a, b)
+
+
+def near_clusters(chars, threshold=THRESHOLD, signer=None):
+    """[[index, ...], ...] — components of characters whose estimated Jaccard ≥ threshold."""
+    signer = signer or Signer()
+    by_sig = {}
+    for i, c in enumerate(chars):
+        sig = signer.sign(c)
+        if sig is not None:
+            by_sig.setdefault(sig, []).append(i)
+
+    # identical signatures collapse to one node up front
+    sigs = list(by_sig)
+    comp = _Components(len(sigs))
+    for band in range(BANDS):
+        lo = band * ROWS
+        buckets = {}
+        for n, sig in enumerate(sigs):
+            buckets.setdefault(sig[lo:lo + ROWS], []).append(n)
+        for members in buckets.values():
+            if len(members) > 1:
+                _link(members, sigs, comp, threshold)
+
+    clusters = [sorted(i for n in group for i in by_sig[sigs[n]]) for group in comp.groups()]
+    return sorted(ids for ids in clusters if len(ids) > 1)
+
+
+def find(chars, threshold=THRESHOLD):
+    """{"exact": {...}, "near": [...]} over one roster, as id lists."""
+    ids = [c.get("id") for c in chars]
+    exact = {f: [[ids[i] for i in cl] for cl in cls] for f, cls in exact_clusters(chars).items()}
+    near = [[ids[i] for i in cl] for cl in near_clusters(chars, threshold)]
+    return {"threshold": threshold, "characters": len(chars), "exact": exact, "near": near}
+
+
+def save_salts(path=RESEED_PATH):
+    write_atomic(path, json.dumps(dict(sorted(SALTS.items())), ensure_ascii=False, indent=1) + "\n")
+
+
+def collisions(chars, threshold=THRESHOLD):
+    """Near clusters merged with the exact per-field ones — everything reseed() resolves."""
+    comp = _Components(len(chars))
+    exact = exact_clusters(chars)
+    for cl in near_clusters(chars, threshold) + [cl for f in FIELDS for cl in exact[f]]:
+        for i in cl[1:]:
+            comp.union(cl[0], i)
+    return sorted(ids for ids in comp.groups() if len(ids) > 1)
+
+
+def reseed(run, threshold=THRESHOLD, max_rounds=MAX_ROUNDS, path=RESEED_PATH):
+    """Bump the salt of every colliding character but the first and rebuild,
+    until no collision is left or max_rounds is hit. `run()` returns the roster
+    (pipeline.run with the cache, so a round only rebuilds re-seeded ids).
+    Returns (chars, [(round, clusters, moved), ...])."""
+    rounds = []
+    for rnd in range(max_rounds + 1):
+        chars = run()
+        clusters = collisions(chars, threshold)
+        moved = [chars[i]["id"] for cl in clusters for i in cl[1:]]
+        rounds.append((rnd, len(clusters), len(moved)))
+        if not clusters or rnd == max_rounds:
+            break
+        for cid in moved:
+            SALTS[cid] = SALTS.get(cid, 0) + 1
+    save_salts(path)
+    return chars, rounds
@@ -0,0 +1,73 @@
+"""
+Streaming roster build for synthetic casts far larger than the hand-made one.
+
+Records are produced one at a time by a generator and written as they come,
+either as JSON Lines or as a JSON array laid out byte-for-byte like
+dump_roster(). Nothing holds the whole cast, so memory stays flat at any size.
+"""
+import json, os
+
+from . import add, generate, parallel
+from .pipeline import STAGES
+
+TEMPLATE_ROWS = [(grp, m) for grp, members in generate.G + add.EXTRA for m in members]
+
+
+def synthetic_rows(n):
+    """Yield n (id, (group, member)) rows cycling over the template table.
+
+    The first pass keeps the original ids; later passes get a _<pass> suffix
+    so every id is unique and still matches the schema pattern.
+    """
+    base = len(TEMPLATE_ROWS)
+    for i in range(n):
+        grp, member = TEMPLATE_ROWS[i % base]
+        rnd = i // base
+        if rnd:
+            member = (f"{member[0]}_{rnd}",) + member[1:]
+        yield member[0], (grp, member)
+
+
+_BUILD = STAGES[0].fn
+_TRANSFORMS = [s.fn for s in STAGES if not s.source]
+
+
+def finish(args):
+    """Build one record from its template row and run every transform on it."""
+    c = _BUILD(*args)
+    for fn in _TRANSFORMS:
+        c = fn(c)
+    return c
+
+
+def records(rows, ex=None):
+    """Yield finished records in row order, optionally on a process pool."""
+    return parallel.map_ordered(finish, (args for _, args in rows), ex)
+
+
+def write_jsonl(recs, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for c in recs:
+            f.write(json.dumps(c, ensure_ascii=False))
+            f.write("\n")
+            n += 1
+    return n
+
+
+def write_json_array(recs, path):
+    """Same bytes as json.dump(list(recs), indent=1), without building the list."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for c in recs:
+            f.write(",\n " if n else "\n ")
+            f.write(json.dumps(c, ensure_ascii=False, indent=1).replace("\n", "\n "))
+            n += 1
+        f.write("\n]" if n else "]")
+    return n
+
+
+WRITERS = {"jsonl": write_jsonl, "json": write_json_array}
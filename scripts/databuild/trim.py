@@ -0,0 +1,236 @@
+"""
+Python side of app/engine/auto_trim.js — same four steps, same order, same
+fix strings (checked by scripts/check_estimator.py against node):
+
+  0. drop extra pause markers, then all of them
+  1. drop filler words (ну, вот, типа, …)
+  2. swap long words for short synonyms
+  3. truncate the speaker that is over its window
+
+Plus the batch side: trim the whole jokes.json corpus for every A/B pace
+combination and every character's signature_words_ru at every pace, and keep
+the variants that differ from the original (app/data/index/trimmed.json).
+"""
+import functools, json, os, re
+
+from . import CHARACTERS_PATH, content_hash, load_json, write_atomic
+from .affinity import INDEX_DIR, JOKES_PATH
+from .estimator import (PACE_WPS, SOLO_WINDOW_A, SPEAKER_WINDOW, WINDOW_TOLERANCE,
+                        estimate_dialogue, estimate_line_duration)
+
+# auto_trim.js FILLER_WORDS — order kept, it is the regex alternation order
+FILLER_WORDS = ("ну", "вот", "это", "типа", "короче", "значит", "так", "ладно", "кстати",
+                "вообще", "просто", "даже", "тоже", "ещё", "уже")
+# JS (?<=^|\s) — Python look-behinds must be fixed width
+FILLER_REGEX = re.compile(r"(?:^|(?<=\s))(" + "|".join(FILLER_WORDS) + r")(?=\s|$|[,\.!?])", re.I)
+WORD_LIMITS = {"A": 10, "B": 12}
+SOLO_WORD_LIMIT_A = 30
+DEFAULT_WORD_LIMIT = 8
+MAX_ITERATIONS = 5
+
+SHORT_MAP = {
+    "абсолютно": "точно", "безусловно": "да", "естественно": "ясно",
+    "действительно": "реально", "обязательно": "точно", "практически": "почти",
+    "приблизительно": "примерно", "одновременно": "разом", "исключительно": "только",
+    "непосредственно": "прямо", "соответственно": "значит", "категорически": "нет",
+    "замечательно": "класс", "великолепно": "круто", "потрясающе": "огонь",
+    "удовольствием": "рад", "определённо": "точно", "разумеется": "ясно",
+    "первоначально": "сначала", "впоследствии": "потом", "самостоятельно": "сам",
+}
+
+_PAUSE = re.compile(r"\s*\|\s*")
+_MULTI_SPACE = re.compile(r"\s{2,}")
+_LEADING_PUNCT = re.compile(r"^\s*[,|]\s*")
+_SPACE = re.compile(r"\s+")
+_NOT_CYR = re.compile(r"[^а-яё]")
+
+
+def remove_pauses(text):
+    """Step 0: keep at most one pause marker."""
+    pauses = text.count("|")
+    if pauses <= 1:
+        return text, None
+    kept = iter(range(pauses))
+    result = _PAUSE.sub(lambda m: " | " if next(kept) == 0 else " ", text)
+    return _MULTI_SPACE.sub(" ", result).strip(), f"Убраны лишние паузы (было {pauses}, оставлена 1)"
+
+
+def remove_all_pauses(text):
+    """Step 0b: no pause markers at all."""
+    if "|" not in text:
+        return text, None
+    return _MULTI_SPACE.sub(" ", _PAUSE.sub(" ", text)).strip(), "Убраны все паузы для экономии времени"
+
+
+def remove_fillers(text):
+    """Step 1."""
+    result = _LEADING_PUNCT.sub("", _MULTI_SPACE.sub(" ", FILLER_REGEX.sub("", text)), count=1).strip()
+    if result == text.strip():
+        return text, None
+    return result, "Убраны вводные слова"
+
+
+def shorten_long_words(text):
+    """Step 2."""
+    changed = False
+    out = []
+    for w in _SPACE.split(text):
+        short = SHORT_MAP.get(_NOT_CYR.sub("", w.lower()))
+        if short:
+            changed = True
+            out.append(short)
+        else:
+            out.append(w)
+    return " ".join(out), "Заменены длинные слова на короткие" if changed else None
+
+
+def truncate_to_fit(text, speaker, pace, solo=False, estimate=estimate_line_duration):
+    """Step 3: keep the hook (first words) and the punchline (last words)."""
+    solo_a = solo and speaker == "A"
+    window = SOLO_WINDOW_A if solo_a else SPEAKER_WINDOW.get(speaker, 3.0)
+    max_words = SOLO_WORD_LIMIT_A if solo_a else WORD_LIMITS.get(speaker, DEFAULT_WORD_LIMIT)
+    words = [w for w in _SPACE.split(text.replace("|", "").strip()) if w]
+    if len(words) <= max_words:
+        return text, None
+
+    trimmed = words[:2] + words[-(max_words - 2):]
+    result = " ".join(trimmed)
+    if estimate(result, pace or "normal")["duration"] <= window + WINDOW_TOLERANCE:
+        return result, f"Обрезано с {len(words)} до {len(trimmed)} слов"
+
+    aggressive = words[:1] + words[-(max_words - 2):]
+    return " ".join(aggressive), f"Агрессивная обрезка: {len(words)} → {len(aggressive)} слов"
+
+
+_STEPS = (remove_pauses, remove_all_pauses, remove_fillers, shorten_long_words)
+
+
+def auto_trim(lines, max_iterations=MAX_ITERATIONS, estimate=estimate_line_duration):
+    """autoTrim(lines) → {"lines", "auto_fixes", "estimate", "trimmed"}."""
+    fixes = []
+    current = [dict(l) for l in lines]
+
+    for _ in range(max_iterations):
+        est = estimate_dialogue(current, estimate)
+        if est["risk"] != "high":
+            break
+
+        any_change = False
+        for step in _STEPS:
+            for l in current:
+                text, fix = step(l["text"])
+                if fix:
+                    any_change = True
+                    fixes.append(f"{l['speaker']}: {fix}")
+                l["text"] = text
+            if any_change:
+                break
+        if any_change:
+            continue
+
+        solo = len(current) == 1 and current[0].get("speaker") == "A"
+        for entry in est["per_line"]:
+            if entry["over_window"]:
+                idx = next((i for i, l in enumerate(current) if l.get("speaker") == entry["speaker"]), -1)
+                if idx >= 0:
+                    text, fix = truncate_to_fit(current[idx]["text"], entry["speaker"],
+                                                current[idx].get("pace"), solo, estimate)
+                    if fix:
+                        any_change = True
+                        current[idx] = dict(current[idx], text=text)
+                        fixes.append(f"{entry['speaker']}: {fix}")
+        if any_change:
+            continue
+        break
+
+    return {"lines": current, "auto_fixes": fixes,
+            "estimate": estimate_dialogue(current, estimate), "trimmed": bool(fixes)}
+
+
+def pace_key(pace_a, pace_b):
+    return f"{pace_a}+{pace_b}"
+
+
+def _speaker(c):
+    return "B" if c.get("role_default") == "B" else "A"
+
+
+def build(jokes, chars):
+    """Return (index, stats). One pass over the corpus with every line
+    estimate memoised — a joke line is estimated once per pace however many
+    pace combinations and trim iterations look at it."""
+    estimate = functools.lru_cache(maxsize=None)(estimate_line_duration)
+    paces = list(PACE_WPS)
+    stats = {"dialogues": 0, "high": 0, "trimmed": 0, "rescued": 0, "still_high": 0,
+             "phrases": 0, "phrases_trimmed": 0}
+
+    joke_variants = {}
+    for j in jokes:
+        for pa in paces:
+            for pb in paces:
+                lines = [{"speaker": "A", "text": j["line_a"], "pace": pa},
+                         {"speaker": "B", "text": j["line_b"], "pace": pb}]
+                stats["dialogues"] += 1
+                if estimate_dialogue(lines, estimate)["risk"] != "high":
+                    continue
+                stats["high"] += 1
+                r = auto_trim(lines, estimate=estimate)
+                risk = r["estimate"]["risk"]
+                stats["rescued" if risk != "high" else "still_high"] += 1
+                if r["trimmed"]:
+                    stats["trimmed"] += 1
+                    joke_variants.setdefault(j["id"], {})[pace_key(pa, pb)] = {
+                        "line_a": r["lines"][0]["text"], "line_b": r["lines"][1]["text"],
+                        "risk": risk, "fixes": r["auto_fixes"]}
+
+    word_variants = {}
+    for c in chars:
+        speaker = _speaker(c)
+        for pace in paces:
+            phrases = c.get("signature_words_ru") or []
+            out = [auto_trim([{"speaker": speaker, "text": p, "pace": pace}], estimate=estimate)["lines"][0]["text"]
+                   for p in phrases]
+            stats["phrases"] += len(phrases)
+            changed = sum(1 for a, b in zip(phrases, out) if a != b)
+            if changed:
+                stats["phrases_trimmed"] += changed
+                word_variants.setdefault(c["id"], {})[pace] = out
+
+    info = estimate.cache_info()
+    stats["estimates"], stats["estimate_hits"] = info.misses, info.hits
+    index = {
+        "version": 1,
+        "source": content_hash([jokes, [c.get("signature_words_ru") for c in chars]])[:16],
+        "paces": paces,
+        "jokes": joke_variants,
+        "signature_words": word_variants,
+    }
+    return index, stats
+
+
+def write(out_dir=INDEX_DIR, jokes_path=JOKES_PATH, characters_path=CHARACTERS_PATH, chars=None):
+    """chars: the roster already in memory (watch mode) instead of characters_path."""
+    index, stats = build(load_json(jokes_path), load_json(characters_path) if chars is None else chars)
+    path = os.path.join(out_dir, "trimmed.json")
+    write_atomic(path, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return path, index, stats
+
+
+class TrimIndex:
+    """Reader over trimmed.json — the lines autoTrim would produce, without running it."""
+
+    def __init__(self, index):
+        self.ix = index
+
+    @classmethod
+    def load(cls, path=os.path.join(INDEX_DIR, "trimmed.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def lines(self, joke, pace_a, pace_b):
+        """(line_a, line_b) for this pace pairing — the original when no trim was needed."""
+        v = self.ix["jokes"].get(joke["id"], {}).get(pace_key(pace_a, pace_b))
+        return (v["line_a"], v["line_b"]) if v else (joke["line_a"], joke["line_b"])
+
+    def signature_words(self, char, pace):
+        return self.ix["signature_words"].get(char["id"], {}).get(pace) or char.get("signature_words_ru") or []
@@ -0,0 +1,242 @@
+"""
+Roster validation against app/spec/character_schema.json.
+
+The schema is compiled once into generated Python source — one specialised
+function with type checks, required keys, enum sets, precompiled patterns and
+bounds inlined — so checking a record never re-reads the schema. All errors
+are collected with JSON paths ($[12].identity_anchors.wardrobe_anchor).
+"""
+import os, re
+
+from . import SPEC_DIR, deep_fix, enrich, load_json
+
+SCHEMA_PATH = os.path.join(SPEC_DIR, "character_schema.json")
+
+_TYPES = {
+    "string": str, "array": list, "object": dict, "boolean": bool,
+    "integer": int, "number": (int, float), "null": type(None),
+}
+
+
+def _type_name(v):
+    if isinstance(v, bool):
+        return "boolean"
+    for name, py in _TYPES.items():
+        if isinstance(v, py):
+            return name
+    return type(v).__name__
+
+
+_MISSING = object()
+_CONSTRAINTS = ("type", "enum", "minLength", "pattern", "minimum", "maximum",
+                "minItems", "maxItems", "items", "required", "properties", "$ref")
+
+
+# (types that satisfy the guard, keywords) — the guard is skipped when "type"
+# already checked the value
+_KEYWORDS = (
+    (("string",), ("minLength", "pattern")),
+    (("number", "integer"), ("minimum", "maximum")),
+    (("array",), ("minItems", "maxItems", "items")),
+    (("object",), ("required", "properties")),
+)
+_GUARDS = {
+    "string": "isinstance({var}, str)",
+    "number": "isinstance({var}, (int, float)) and not isinstance({var}, bool)",
+    "array": "isinstance({var}, list)",
+    "object": "isinstance({var}, dict)",
+}
+
+
+class _Source:
+    """Accumulates the generated checker source and the constants it closes over."""
+
+    def __init__(self, root):
+        self.root = root
+        self.lines, self.consts, self.n = [], {}, 0
+
+    def emit(self, depth, line):
+        self.lines.append("    " * depth + line)
+
+    def const(self, value):
+        name = f"K{len(self.consts)}"
+        self.consts[name] = value
+        return name
+
+    def var(self, prefix="v"):
+        self.n += 1
+        return f"{prefix}{self.n}"
+
+
+def _path(segments):
+    """f-string source for a JSON path; ('i', name) segments are loop indices."""
+    out = "$"
+    for kind, val in segments:
+        if kind == "i":
+            out += "[{" + val + "}]"
+        else:
+            out += "." + val.replace("{", "{{").replace("}", "}}")
+    return "f" + repr(out)
+
+
+def _resolve(root, ref):
+    """Local JSON pointer ("#/properties/cast/…") → schema node."""
+    node = root
+    for part in ref.lstrip("#").strip("/").split("/") if ref != "#" else ():
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def _emit(src, node, var, segments, depth):
+    """Emit the checks for one schema node applied to the local `var`."""
+    while "$ref" in node:
+        node = _resolve(src.root, node["$ref"])
+    t = node.get("type")
+    py = _TYPES.get(t)
+    path = _path(segments)
+    d = depth
+    if py is not None:
+        cond = f"not isinstance({var}, {src.const(py)})"
+        if t in ("integer", "number"):
+            cond = f"{cond} or isinstance({var}, bool)"
+        src.emit(d, f"if {cond}:")
+        src.emit(d + 1, f"errors.append(({path}, {src.const('expected ' + t + ', got ')} + _type_name({var})))")
+        src.emit(d, "else:")
+        d += 1
+    mark = len(src.lines)
+
+    if "enum" in node:
+        allowed = src.const(frozenset(node["enum"]))
+        msg = src.const(f" not in {sorted(node['enum'])}")
+        src.emit(d, f"if isinstance({var}, (list, dict)) or {var} not in {allowed}:")
+        src.emit(d + 1, f"errors.append(({path}, repr({var}) + {msg}))")
+    # a keyword only constrains values of its own type; without "type" the
+    # checks are guarded so a wrong value is an error entry, never a TypeError
+    for kind, keys in _KEYWORDS:
+        if not any(k in node for k in keys):
+            continue
+        sub = {k: node[k] for k in keys if k in node}
+        if t in kind:
+            _emit_kind(src, sub, var, segments, d)
+        else:
+            src.emit(d, f"if {_GUARDS[kind[0]].format(var=var)}:")
+            guard = len(src.lines)
+            _emit_kind(src, sub, var, segments, d + 1)
+            if len(src.lines) == guard:
+                src.emit(d + 1, "pass")
+
+    if len(src.lines) == mark and d > depth:
+        src.emit(d, "pass")
+
+
+def _emit_kind(src, node, var, segments, d):
+    """The keyword checks in `node` (one _KEYWORDS group), `var` already of that type."""
+    path = _path(segments)
+    if "minLength" in node:
+        n = node["minLength"]
+        src.emit(d, f"if len({var}) < {n}:")
+        src.emit(d + 1, f"errors.append(({path}, 'shorter than {n} chars (' + str(len({var})) + ')'))")
+    if "pattern" in node:
+        rx = src.const(re.compile(node["pattern"]))
+        src.emit(d, f"if {rx}.search({var}) is None:")
+        src.emit(d + 1, f"errors.append(({path}, {src.const('does not match ' + node['pattern'])}))")
+    if "minimum" in node:
+        lo = node["minimum"]
+        src.emit(d, f"if {var} < {lo!r}:")
+        src.emit(d + 1, f"errors.append(({path}, {src.const(f'below minimum {lo}')}))")
+    if "maximum" in node:
+        hi = node["maximum"]
+        src.emit(d, f"if {var} > {hi!r}:")
+        src.emit(d + 1, f"errors.append(({path}, {src.const(f'above maximum {hi}')}))")
+    if "minItems" in node:
+        n = node["minItems"]
+        src.emit(d, f"if len({var}) < {n}:")
+        src.emit(d + 1, f"errors.append(({path}, 'fewer than {n} items (' + str(len({var})) + ')'))")
+    if "maxItems" in node:
+        n = node["maxItems"]
+        src.emit(d, f"if len({var}) > {n}:")
+        src.emit(d + 1, f"errors.append(({path}, 'more than {n} items (' + str(len({var})) + ')'))")
+    if _has_checks(node.get("items")):
+        j, x = src.var("j"), src.var()
+        src.emit(d, f"for {j}, {x} in enumerate({var}):")
+        _emit(src, node["items"], x, segments + [("i", j)], d + 1)
+    for k in node.get("required", ()):
+        src.emit(d, f"if {k!r} not in {var}:")
+        src.emit(d + 1, f"errors.append(({path}, {src.const(f'missing required {k!r}')}))")
+    for k, sub in node.get("properties", {}).items():
+        if not _has_checks(sub):
+            continue
+        x = src.var()
+        src.emit(d, f"{x} = {var}.get({k!r}, _MISSING)")
+        src.emit(d, f"if {x} is not _MISSING:")
+        _emit(src, sub, x, segments + [("k", k)], d + 1)
+
+
+def _has_checks(node):
+    return isinstance(node, dict) and any(k in node for k in _CONSTRAINTS)
+
+
+def compile_schema(schema=None, name="character_schema"):
+    """Compile the character schema (or any schema given) into
+    check_record(record, index, errors).
+
+    The schema becomes the source of one straight-line Python function with the
+    JSON paths baked in; the generated code is kept on check_record.source.
+    Local $refs are inlined, so a recursive schema is not supported.
+    """
+    schema = schema if schema is not None else load_json(SCHEMA_PATH)
+    src = _Source(schema)
+    src.emit(0, "def check_record(rec, i, errors):")
+    _emit(src, schema, "rec", [("i", "i")], 1)
+    if len(src.lines) == 1:
+        src.emit(1, "pass")
+    code = "\n".join(src.lines)
+    ns = dict(src.consts, _MISSING=_MISSING, _type_name=_type_name)
+    exec(compile(code, f"<{name}>", "exec"), ns)
+    check_record = ns["check_record"]
+    check_record.source = code
+    return check_record
+
+
+def validate_roster(chars, check_record=None):
+    """Validate every record plus roster-level rules. Returns [(path, message), ...]."""
+    check_record = check_record or compile_schema()
+    errors, seen = [], {}
+    for i, c in enumerate(chars):
+        check_record(c, i, errors)
+        cid = c.get("id") if isinstance(c, dict) else None
+        if not isinstance(cid, str):
+            continue  # the schema check already reported it
+        if cid in seen:
+            errors.append((f"$[{i}].id", f"duplicate id '{cid}' (first at $[{seen[cid]}])"))
+        else:
+            seen[cid] = i
+    return errors
+
+
+def checked(recs, errors, check_record=None):
+    """Pass a record stream through, collecting schema errors on the way."""
+    check_record = check_record or compile_schema()
+    for i, c in enumerate(recs):
+        check_record(c, i, errors)
+        yield c
+
+
+def template_gaps(chars):
+    """Groups the stages know nothing about: they silently get DEFAULT_BIO and
+    the default silhouette. Returns {group: count}."""
+    gaps = {}
+    for c in chars:
+        grp = c.get("group")
+        if grp not in deep_fix.GROUP_BIOLOGY or grp not in enrich.SILHOUETTES:
+            gaps[grp] = gaps.get(grp, 0) + 1
+    return gaps
+
+
+def report(errors, limit=20):
+    """Print the first `limit` errors; return True when the roster is clean."""
+    for path, msg in errors[:limit]:
+        print(f"  ✗ {path}: {msg}")
+    if len(errors) > limit:
+        print(f"  … {len(errors) - limit} more")
+    return not errors
@@ -0,0 +1,148 @@
+"""
+Watch mode for build_chars.py: the roster, the stage cache, the compiled
+schema and every record's serialized text stay in memory between rebuilds.
+
+Watched (mtime polling, no extra dependency): the databuild modules and
+reseed.json, app/data/*.json and app/spec/*. A change is mapped to the
+targets that read the file (TARGETS); a changed module is reloaded first, so
+its templates are live without a restart. The stage keys (pipeline.py) then
+rebuild only the characters whose inputs changed. Everything downstream of the
+shipped roster (app/data/characters.json, hand-curated) runs when that file is
+edited — or when the pipeline output is the shipped roster (--out) and changed.
+
+Every output goes through write_atomic (temp file + os.replace), so Vite and
+server/index.js never read a half-written file.
+"""
+import importlib, json, os, sys, time
+
+from . import DATA_DIR, PIPELINE_PATH, ROOT, SPEC_DIR, write_atomic
+
+PKG_DIR = os.path.dirname(os.path.abspath(__file__))
+POLL = 0.25
+SETTLE = 0.1  # editors save in several writes — wait until mtimes stop moving
+
+# dependency order: a module is reloaded after everything it imports names from
+MODULES = ["", "estimator", "generate", "add", "enrich", "deep_fix", "parallel", "metrics", "affinity", "search",
+           "safety", "pipeline", "validate", "similarity", "charindex", "binroster", "pairing", "delta", "stream",
+           "trim", "durations"]
+
+# target → files it reads (relative to the repo root); "shipped" re-runs
+# everything that reads the shipped roster (ROSTER_READERS)
+TARGETS = {
+    "roster": ["scripts/databuild/__init__.py", "scripts/databuild/reseed.json", "scripts/databuild/generate.py",
+               "scripts/databuild/add.py", "scripts/databuild/enrich.py", "scripts/databuild/deep_fix.py",
+               "scripts/databuild/pipeline.py", "scripts/databuild/parallel.py", "scripts/databuild/safety.py",
+               "app/spec/golden_standard.yaml"],
+    "shipped": ["app/data/characters.json"],
+    "emit": ["scripts/databuild/charindex.py", "scripts/databuild/binroster.py", "scripts/databuild/pairing.py",
+             "scripts/databuild/delta.py", "scripts/databuild/estimator.py", "scripts/databuild/safety.py",
+             "app/spec/golden_standard.yaml"],
+    "validate": ["scripts/databuild/validate.py", "app/spec/character_schema.json"],
+    "affinity": ["scripts/databuild/affinity.py", "app/data/jokes.json", "app/data/locations.json"],
+    "durations": ["scripts/databuild/durations.py", "scripts/databuild/estimator.py", "scripts/databuild/trim.py",
+                  "app/data/jokes.json"],
+    "trim": ["scripts/databuild/trim.py", "scripts/databuild/estimator.py", "app/data/jokes.json"],
+    "search": ["scripts/databuild/search.py", "app/data/jokes.json", "app/data/locations.json",
+               "app/data/course.json"],
+    "safety": ["scripts/databuild/safety.py", "scripts/databuild/search.py", "app/spec/golden_standard.yaml",
+               "app/data/jokes.json", "app/data/locations.json"],
+}
+ROSTER_READERS = ("emit", "validate", "trim", "search", "safety")
+# read when a module is imported (safety.SPEC / SCANNER), so an edit needs a reload
+IMPORT_INPUTS = ("app/spec/golden_standard.yaml",)
+
+
+def watched_files(out=PIPELINE_PATH):
+    """Every watched path; the roster output itself is not an input."""
+    paths = [os.path.join(PKG_DIR, f) for f in os.listdir(PKG_DIR) if f.endswith((".py", ".json"))]
+    paths += [os.path.join(DATA_DIR, f) for f in os.listdir(DATA_DIR) if f.endswith(".json")]
+    paths += [os.path.join(SPEC_DIR, f) for f in os.listdir(SPEC_DIR)]
+    skip = os.path.abspath(out)
+    return sorted(p for p in paths if os.path.isfile(p) and os.path.abspath(p) != skip)
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Watcher:
+    """Polls mtimes; changes() blocks until something changed and settled."""
+
+    def __init__(self, list_files):
+        self.list_files = list_files
+        self.seen = self._snapshot()
+
+    def _snapshot(self):
+        return {p: _stat(p) for p in self.list_files()}
+
+    def changes(self, poll=POLL):
+        while True:
+            time.sleep(poll)
+            now = self._snapshot()
+            if now != self.seen:
+                break
+        while True:
+            time.sleep(SETTLE)
+            settled = self._snapshot()
+            if settled == now:
+                break
+            now = settled
+        changed = {p for p in now.keys() | self.seen.keys() if now.get(p) != self.seen.get(p)}
+        self.seen = now
+        return sorted(changed)
+
+
+def targets(changed):
+    """Changed paths → (targets, paths no target reads)."""
+    rel = {os.path.relpath(p, ROOT).replace(os.sep, "/") for p in changed}
+    hit = {t for t, files in TARGETS.items() if rel & set(files)}
+    used = set().union(*(TARGETS[t] for t in hit)) if hit else set()
+    return hit, sorted(r for r in rel if r not in used)
+
+
+def reload_modules(changed):
+    """Re-import the databuild package when one of its modules (or reseed.json)
+    or an IMPORT_INPUTS file changed. Module objects are reloaded in place, so
+    `from databuild import x` references elsewhere see the new code."""
+    inputs = {os.path.abspath(os.path.join(ROOT, f)) for f in IMPORT_INPUTS}
+    if not any(os.path.dirname(os.path.abspath(p)) == PKG_DIR or os.path.abspath(p) in inputs for p in changed):
+        return False
+    pkg = __name__.rpartition(".")[0]
+    for name in MODULES:
+        mod = sys.modules.get(f"{pkg}.{name}" if name else pkg)
+        if mod is not None:
+            importlib.reload(mod)
+    return True
+
+
+class RosterWriter:
+    """Writes the roster exactly like dump_roster (indent=1), re-serializing
+    only the records that changed since the last write."""
+
+    def __init__(self, path):
+        self.path = path
+        self._parts = {}  # id → (record, serialized text)
+
+    def _part(self, c):
+        hit = self._parts.get(c.get("id"))
+        if hit and (hit[0] is c or hit[0] == c):
+            return hit[1], False
+        text = " " + json.dumps(c, ensure_ascii=False, indent=1).replace("\n", "\n ")
+        self._parts[c.get("id")] = (c, text)
+        return text, True
+
+    def write(self, chars):
+        """Returns the number of re-serialized records."""
+        parts, fresh = [], 0
+        for c in chars:
+            text, new = self._part(c)
+            parts.append(text)
+            fresh += new
+        keep = {c.get("id") for c in chars}
+        self._parts = {k: v for k, v in self._parts.items() if k in keep}
+        write_atomic(self.path, "[\n" + ",\n".join(parts) + "\n]" if parts else "[]")
+        return fresh
@@ -0,0 +1,71 @@
+"""
+FERIXDI Studio — Near-duplicate characters
+Clusters of characters with identical or near-identical character_en /
+appearance_ru / identity_anchors (databuild/similarity.py: exact field hashing
++ MinHash/LSH).
+
+  python scripts/find_duplicates.py                        # app roster
+  python scripts/find_duplicates.py --roster cast.jsonl    # streamed synthetic cast
+  python scripts/find_duplicates.py --json dupes.json      # machine-readable report
+  python scripts/find_duplicates.py --reseed               # re-seed the pipeline build until clean
+
+--reseed writes scripts/databuild/reseed.json, which every later build picks
+up; review the rebuilt roster before committing it.
+"""
+import argparse, json
+
+from databuild import CHARACTERS_PATH, RESEED_PATH, load_json, similarity
+from databuild.pipeline import run
+
+
+def load_roster(path):
+    if path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return load_json(path)
+
+
+def show(report, limit):
+    n = report["characters"]
+    for field, clusters in report["exact"].items():
+        size = sum(len(cl) for cl in clusters)
+        print(f"  exact {field:<17} {len(clusters):>5} clusters, {size} of {n} characters")
+    near = report["near"]
+    print(f"  near  J>={report['threshold']:<13} {len(near):>5} clusters, "
+          f"{sum(len(cl) for cl in near)} of {n} characters")
+    for cl in sorted(near, key=len, reverse=True)[:limit]:
+        more = f" … +{len(cl) - 6}" if len(cl) > 6 else ""
+        print(f"    [{len(cl)}] " + ", ".join(cl[:6]) + more)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Report near-identical characters")
+    ap.add_argument("--roster", default=CHARACTERS_PATH, help="roster .json or .jsonl")
+    ap.add_argument("--threshold", type=float, default=similarity.THRESHOLD, help="MinHash Jaccard cut-off")
+    ap.add_argument("--json", metavar="PATH", help="write the full report as JSON")
+    ap.add_argument("--limit", type=int, default=10, help="near clusters to print")
+    ap.add_argument("--reseed", action="store_true",
+                    help=f"re-seed colliding characters of the pipeline build ({RESEED_PATH})")
+    ap.add_argument("--max-rounds", type=int, default=similarity.MAX_ROUNDS)
+    args = ap.parse_args(argv)
+
+    if args.reseed:
+        chars, rounds = similarity.reseed(lambda: run()[0], args.threshold, args.max_rounds)
+        for rnd, clusters, moved in rounds:
+            print(f"  round {rnd:>2}: {clusters} collision clusters, {moved} characters re-seeded")
+        print(f"Salts -> {RESEED_PATH} ({len(similarity.SALTS)} characters); "
+              f"rebuild with scripts/build_chars.py")
+    else:
+        chars = load_roster(args.roster)
+        print(f"Loaded {len(chars)} characters <- {args.roster}")
+
+    report = similarity.find(chars, args.threshold)
+    show(report, args.limit)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"Report -> {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+FERIXDI Studio — Episode Planner
+Plans a content queue ahead (databuild/schedule.py): an A/B pair, a location and a
+joke per episode, under the app/engine/history_cache.js windows — no location
+within 20 episodes, no wardrobe (character) within 10 — for the best viral_score
+and a full cast rotation. A window the roster cannot fill is shrunk and reported.
+Writes JSON Lines, one episode per line, then replays the plan (after --history)
+through the history-cache rules (exit 1 on any violation or an infeasible plan).
+
+  python scripts/plan_episodes.py --episodes 1000
+  python scripts/plan_episodes.py --episodes 5000 --history history.json   # continue a browser session
+  python scripts/plan_episodes.py --greedy                                  # one episode at a time, no lookahead
+"""
+import argparse, os, sys, time
+
+from databuild import CACHE_DIR, CHARACTERS_PATH, load_json, schedule
+from databuild.affinity import JOKES_PATH, LOCATIONS_PATH
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--episodes", type=int, default=1000)
+    ap.add_argument("--out", default=os.path.join(CACHE_DIR, "plan.jsonl"))
+    ap.add_argument("--chars", default=CHARACTERS_PATH)
+    ap.add_argument("--history", help="ferixdi_history_cache JSON (localStorage export) to continue from")
+    ap.add_argument("--window", type=int, default=schedule.WINDOW, help="history_cache MAX_HISTORY")
+    ap.add_argument("--joke-window", type=int, help="episodes before a joke may return (default: half the jokes)")
+    ap.add_argument("--beam", type=int, default=schedule.BEAM)
+    ap.add_argument("--horizon", type=int, default=schedule.HORIZON)
+    ap.add_argument("--greedy", action="store_true", help="same as --beam 1 --horizon 1")
+    args = ap.parse_args(argv)
+    if args.greedy:
+        args.beam = args.horizon = 1
+
+    chars, jokes, locations = load_json(args.chars), load_json(JOKES_PATH), load_json(LOCATIONS_PATH)
+    history = load_json(args.history) if args.history else None
+    t0 = time.perf_counter()
+    try:
+        planner = schedule.Planner(chars, jokes, locations, args.window, args.joke_window, args.beam, args.horizon)
+        for dim, asked, used, why in planner.relaxed:
+            print(f"  ! {dim} window {asked} -> {used} episodes ({why})")
+        if history:
+            planner.seed_history(history)
+        setup = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        plan = list(planner.plan(args.episodes))
+    except schedule.Infeasible as e:
+        sys.exit(f"Plan infeasible: {e}")
+    secs = time.perf_counter() - t0
+    schedule.write_jsonl(plan, args.out)
+
+    s = schedule.summary(plan, chars)
+    print(f"Plan -> {args.out}: {s['episodes']} episodes in {secs:.2f} s ({s['episodes'] / secs:.0f} episodes/s, "
+          f"setup {setup * 1e3:.0f} ms), beam {args.beam} x horizon {args.horizon}")
+    print(f"  viral_score {s['viral']:.2f} avg, score {s['score']:.2f} avg; cast {s['cast']}/{s['roster']}, "
+          f"rest min {s['min_rest']} / avg {s['mean_rest'] or 0:.1f} episodes; "
+          f"{s['jokes']} jokes, {s['locations']} locations")
+    errors = schedule.violations(plan, chars, locations, planner.loc_window, planner.joke_window,
+                                 char_window=planner.char_window, history=history)
+    for e in errors[:10]:
+        print(f"  ✗ {e}")
+    print(f"History-cache replay: {len(errors)} violation(s)")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+from databuild import affinity
+
+JOKES = [
+    {"id": "j1", "best_groups": ["бабушки"], "best_location": "kitchen", "viral_score": 70},
+    {"id": "j2", "best_groups": ["бабки", "деды"], "best_location": "attic", "viral_score": 95},
+    {"id": "j3", "best_groups": ["дочери и сыновья"], "best_location": "attic", "viral_score": 80},
+]
+LOCATIONS = [
+    {"id": "kitchen", "numeric_id": 2, "tags": ["indoor"], "category_hints": ["Бытовой абсурд"]},
+    {"id": "balcony", "numeric_id": 1, "tags": ["indoor"], "category_hints": ["Бытовой абсурд"]},
+]
+
+
+def test_postings_are_ranked_and_aliased():
+    index, _ = affinity.build(JOKES, LOCATIONS)
+    ix = affinity.AffinityIndex(index)
+    assert ix.jokes_for_group("бабки") == ["j2", "j1"]
+    assert ix.jokes_for_group("сыновья") == ["j3"]
+    assert ix.locations_for_category("Бытовой абсурд") == ["balcony", "kitchen"]
+    assert ix.jokes_for_pair("бабки", "дочери") == ["j2", "j3", "j1"]
+
+
+def test_unknown_best_locations_are_one_summary_line():
+    _, warnings = affinity.build(JOKES, LOCATIONS)
+    assert warnings == ["2 jokes name a best_location missing from locations.json (1 distinct, most common: attic x2)"]
@@ -0,0 +1,38 @@
+import pytest
+
+from databuild import CHARACTERS_PATH, binroster, load_json
+
+CHARS = load_json(CHARACTERS_PATH)
+
+
+def test_round_trip(tmp_path):
+    path, size = binroster.write(CHARS, tmp_path)
+    ro = binroster.BinRoster.open(path)
+    assert len(ro) == len(CHARS) and size == (tmp_path / "roster.bin").stat().st_size
+    assert list(ro) == CHARS
+    last = CHARS[-1]
+    assert ro.by_id(last["id"]) == last
+    assert ro.field(0, "identity_anchors.wardrobe_anchor") == CHARS[0]["identity_anchors"]["wardrobe_anchor"]
+
+
+def test_mixed_shapes_and_missing_fields():
+    chars = [
+        {"id": "a", "n": 3, "tags": ["x", "ё"], "meta": {}, "deep": {"k": {"v": None}}},
+        {"id": "b", "deep": {"k": {"v": "строка"}}, "extra": True},
+    ]
+    ro = binroster.BinRoster(binroster.encode(chars))
+    assert list(ro) == chars
+    assert ro.field(1, "n", "absent") == "absent" and ro.field(0, "nope") is None
+    assert ro.by_id("zzz") is None
+
+
+def test_repeated_values_are_stored_once():
+    shared = {"id": "x", "hook": "одинаковая длинная строка шаблона " * 4}
+    one = len(binroster.encode([shared]))
+    many = len(binroster.encode([dict(shared, id=f"x{i}") for i in range(50)]))
+    assert many - one < 50 * len(shared["hook"])
+
+
+def test_rejects_foreign_bytes():
+    with pytest.raises(ValueError):
+        binroster.BinRoster(b"JSON" + bytes(16))
@@ -0,0 +1,31 @@
+import json, os
+
+from databuild import CHARACTERS_PATH, charindex, load_json
+
+CHARS = load_json(CHARACTERS_PATH)
+
+
+def test_rows_carry_the_card_fields_in_roster_order():
+    index = json.loads(charindex.build(CHARS))
+    assert index["version"] == 2 and index["fields"] == charindex.INDEX_FIELDS
+    rows = [dict(zip(index["fields"], row)) for row in index["characters"]]
+    assert [r["id"] for r in rows] == [c["id"] for c in CHARS]
+    assert rows[0] == {k: CHARS[0].get(k) for k in charindex.INDEX_FIELDS}
+
+
+def test_output_is_deterministic_and_compact():
+    data = charindex.build(CHARS)
+    assert data == charindex.build(json.loads(json.dumps(CHARS)))
+    assert b", " not in data[:200] and b": " not in data[:200]
+
+
+def test_write_skips_unchanged_and_drops_old_shards(tmp_path):
+    stale = ["babki.0123456789ab.json", "babki.0123456789ab.json.gz", "babki.0123456789ab.json.br"]
+    for name in stale + ["pairs.json"]:
+        (tmp_path / name).write_bytes(b"{}")
+    path, size = charindex.write(CHARS, tmp_path)
+    assert os.path.getsize(path) == size
+    assert sorted(os.listdir(tmp_path)) == ["index.json", "pairs.json"]
+    os.utime(path, ns=(1, 1))
+    charindex.write(CHARS, tmp_path)
+    assert os.stat(path).st_mtime_ns == 1
@@ -0,0 +1,49 @@
+import copy, json
+
+import pytest
+
+from databuild import CHARACTERS_PATH, delta, load_json
+
+CHARS = load_json(CHARACTERS_PATH)[:40]
+
+
+def edited(chars):
+    new = copy.deepcopy(chars[1:]) + [dict(copy.deepcopy(chars[0]), id="new_char")]
+    new[0]["tagline_ru"] = "новый слоган"
+    del new[1]["identity_anchors"]["micro_gesture"]
+    new[2], new[3] = new[3], new[2]
+    return new
+
+
+def test_diff_apply_round_trip():
+    new = edited(CHARS)
+    patch = delta.diff(CHARS, new)
+    assert patch["remove"] == [CHARS[0]["id"]] and [c["id"] for c in patch["add"]] == ["new_char"]
+    assert patch["patch"][new[1]["id"]] == {"identity_anchors": {"micro_gesture": None}}
+    assert "order" in patch
+    assert delta.apply(copy.deepcopy(CHARS), json.loads(json.dumps(patch))) == new
+    with pytest.raises(ValueError):
+        delta.apply(CHARS, dict(patch, count=len(new) + 1))
+
+
+def test_write_emits_patches_from_kept_versions(tmp_path):
+    versions, out = tmp_path / "versions", tmp_path / "delta"
+    delta.write(CHARS, out, versions, full_path=CHARACTERS_PATH)
+    new = edited(CHARS)
+    manifest = delta.write(new, out, versions, full_path=CHARACTERS_PATH)
+    old = delta.version_of(CHARS)
+    assert manifest["current"] == delta.version_of(new) and list(manifest["patches"]) == [old]
+    patch = json.loads((out / manifest["patches"][old]["file"]).read_text(encoding="utf-8"))
+    assert delta.apply(CHARS, patch) == new
+    assert sorted(p.name for p in out.iterdir()) == sorted(["manifest.json", manifest["patches"][old]["file"]])
+
+
+def test_mass_removal_is_refused_until_allowed(tmp_path):
+    versions, out = tmp_path / "versions", tmp_path / "delta"
+    first = delta.write(CHARS, out, versions, full_path=CHARACTERS_PATH)
+    with pytest.raises(delta.RemovalError):
+        delta.write(CHARS[:30], out, versions, full_path=CHARACTERS_PATH)
+    assert json.loads((out / "manifest.json").read_text()) == first
+    manifest = delta.write(CHARS[:30], out, versions, full_path=CHARACTERS_PATH, allow_removals=True)
+    assert manifest["patches"] == {}
+    delta.write(CHARS[:29], out, versions, full_path=CHARACTERS_PATH)
@@ -0,0 +1,35 @@
+from databuild import durations, load_json, trim
+from databuild.affinity import JOKES_PATH
+from databuild.estimator import SPEAKER_WINDOW, WINDOW_TOLERANCE
+
+JOKES = load_json(JOKES_PATH)
+INDEX = durations.build(JOKES)
+LONG = " ".join(["слово"] * 30)
+
+
+def test_classify_flags():
+    assert durations.classify("Опять ты?", "A", "slow")[1] == durations.FITS
+    assert durations.classify(LONG, "A", "fast")[1] == durations.NEEDS_TRIM
+    assert durations.classify(LONG, "A", "slow")[1] == durations.IMPOSSIBLE
+
+
+def test_impossible_lines_stay_over_after_auto_trim():
+    for j in JOKES[:60]:
+        for field, speaker in durations.LINES:
+            for pace in INDEX["paces"]:
+                if durations.classify(j[field], speaker, pace)[1] != durations.IMPOSSIBLE:
+                    continue
+                line = trim.auto_trim([{"speaker": speaker, "text": j[field], "pace": pace}])
+                assert line["estimate"]["per_line"][0]["duration"] > SPEAKER_WINDOW[speaker] + WINDOW_TOLERANCE
+
+
+def test_reader_matches_the_columns():
+    ix = durations.DurationIndex(INDEX)
+    joke = JOKES[0]
+    assert ix.line(joke["id"], "line_a", "normal")[0] == durations.classify(joke["line_a"], "A", "normal")[0]
+    fits = ix.candidates("normal")
+    assert set(fits) <= set(ix.candidates("normal", allow_trim=True))
+    assert all(ix.flag(jid, "normal") == "fits" for jid in fits)
+    summary = durations.summary(INDEX)
+    assert summary["normal"]["fits"] == len(fits)
+    assert sum(summary["slow"].values()) == len(JOKES)
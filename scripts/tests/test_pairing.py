@@ -0,0 +1,37 @@
+import pytest
+
+from databuild import CHARACTERS_PATH, load_json, pairing
+
+CHARS = load_json(CHARACTERS_PATH)
+INDEX = pairing.build(CHARS, 4)
+PAIRS = pairing.PairIndex(INDEX)
+
+
+def test_rows_mark_only_a_characters():
+    for c, row in zip(CHARS, INDEX["rows"]):
+        assert (row >= 0) == (c["role_default"] in pairing.A_ROLES)
+    assert len(INDEX["partners"]) == len(INDEX["scores"]) == 4 * sum(r >= 0 for r in INDEX["rows"])
+
+
+def test_top_matches_the_best_brute_force_scores():
+    by_id = {c["id"]: c for c in CHARS}
+    for a in CHARS[:40]:
+        top = PAIRS.top(a["id"])
+        if a["role_default"] not in pairing.A_ROLES:
+            assert top == []
+            continue
+        assert all(b != a["id"] and by_id[b]["role_default"] in pairing.B_ROLES for b, _ in top)
+        assert all(s == pairing.pair_score(a, by_id[b]) for b, s in top)
+        best = sorted((pairing.pair_score(a, b) for b in CHARS
+                       if b is not a and b["role_default"] in pairing.B_ROLES), reverse=True)
+        assert [s for _, s in top] == best[:len(top)]
+
+
+def test_build_is_deterministic():
+    assert pairing.build(CHARS, 4) == INDEX
+
+
+def test_unknown_id_and_bad_k():
+    assert PAIRS.top("nobody") == []
+    with pytest.raises(ValueError):
+        pairing.build(CHARS, 0)
@@ -0,0 +1,79 @@
+import json, os, shutil, subprocess, sys
+
+from conftest import SCRIPTS
+
+RUN = """
+import json, os
+from databuild import pipeline
+chars, stats = pipeline.run(cache_path=os.path.abspath("cache.json"))
+print(json.dumps({"stats": stats, "chars": chars}, ensure_ascii=False))
+"""
+
+
+def copy_tree(tmp_path):
+    """scripts/databuild in a scratch tree (ROOT = tmp_path, app/ linked in)."""
+    shutil.copytree(os.path.join(SCRIPTS, "databuild"), tmp_path / "scripts" / "databuild",
+                    ignore=shutil.ignore_patterns("__pycache__", "reseed.json"))
+    os.symlink(os.path.join(os.path.dirname(SCRIPTS), "app"), tmp_path / "app")
+    return tmp_path / "scripts"
+
+
+def run(cwd):
+    out = subprocess.run([sys.executable, "-c", RUN], cwd=cwd, capture_output=True, text=True, check=True).stdout
+    res = json.loads(out)
+    return {name: built for name, built, _ in res["stats"]}, res["chars"]
+
+
+def test_cached_rebuild_is_a_no_op(tmp_path):
+    cwd = copy_tree(tmp_path)
+    built, chars = run(cwd)
+    assert all(built.values())
+    built, again = run(cwd)
+    assert set(built.values()) == {0}
+    assert again == chars
+
+
+def edit(path, old, new):
+    src = path.read_text(encoding="utf-8")
+    assert src.count(old) == 1
+    path.write_text(src.replace(old, new), encoding="utf-8")
+
+
+def test_template_edit_rebuilds_only_that_group(tmp_path):
+    cwd = copy_tree(tmp_path)
+    _, before = run(cwd)
+    edit(cwd / "databuild" / "deep_fix.py", '"receding hairline, salt-and-pepper"', '"receding hairline, grey"')
+
+    built, after = run(cwd)
+    papy = {c["id"] for c in after if c["group"] == "папы"}
+    assert built["generate"] == built["add"] == built["enrich"] == 0
+    assert built["deep-fix"] == built["safety"] == len(papy)
+    assert {c["id"] for c, d in zip(before, after) if c != d} <= papy
+
+
+def test_constant_read_through_deps_rebuilds_its_group(tmp_path):
+    cwd = copy_tree(tmp_path)
+    run(cwd)
+    edit(cwd / "databuild" / "deep_fix.py", 'NO_OVERRIDE_GROUPS = ("бабки", "деды", "пенсионеры")',
+         'NO_OVERRIDE_GROUPS = ("бабки", "деды")')
+
+    built, after = run(cwd)
+    pens = [c for c in after if c["group"] == "пенсионеры"]
+    assert built["deep-fix"] == len(pens)
+    assert all("biology_override" in c for c in pens)
+
+
+def test_code_edit_rebuilds_the_stage(tmp_path):
+    cwd = copy_tree(tmp_path)
+    run(cwd)
+    edit(cwd / "databuild" / "deep_fix.py", "    d = deps(c)\n    bio = d[\"bio\"]\n",
+         "    d = deps(c)\n    bio = d[\"bio\"]  # edited\n")
+
+    built, after = run(cwd)
+    assert built["enrich"] == 0
+    assert built["deep-fix"] == built["safety"] == len(after)
+
+
+def test_numeric_id_is_roster_position(tmp_path):
+    _, chars = run(copy_tree(tmp_path))
+    assert [c["numeric_id"] for c in chars] == list(range(1, len(chars) + 1))
@@ -0,0 +1,72 @@
+import json, os, random, shutil, subprocess
+
+import pytest
+
+from conftest import SCRIPTS
+from databuild import safety
+
+ROOT = os.path.dirname(SCRIPTS)
+TEXTS = ["a sexy coat", "Sexy, NAKED and nude", "sexyish unnude", "porn-star NSFW_tag", "nsfw!", "",
+         "watermark logo, phone in hand", "Сексуальный sexy вайб"]
+
+needs_node = pytest.mark.skipif(not shutil.which("node"), reason="node is required for the validators.js side")
+
+
+def node(script):
+    out = subprocess.run(["node", "--input-type=module", "-e", script], cwd=ROOT, capture_output=True, text=True,
+                         check=True)
+    return json.loads(out.stdout)
+
+
+@needs_node
+def test_spec_tag_matches_validators_js():
+    tag = node("import { SAFETY_SPEC } from './app/engine/validators.js';"
+               "console.log(JSON.stringify(SAFETY_SPEC));")
+    assert tag == safety.SCANNER.tag == safety.spec_tag(safety.load_spec())
+
+
+@needs_node
+def test_banned_word_rewrites_match_validators_js():
+    js = node("import { scanBannedWords } from './app/engine/validators.js';"
+              f"console.log(JSON.stringify({json.dumps(TEXTS)}.map(t => scanBannedWords(t).text)));")
+    assert [safety.SCANNER.text(t)[0] for t in TEXTS] == js
+
+
+def test_automaton_finds_every_occurrence():
+    patterns = [(w.lower(), kind) for kind in safety.LISTS for w in safety.SPEC[kind]]
+    automaton = safety.Automaton(patterns)
+    rng = random.Random(7)
+    words = [w for w, _ in patterns] + ["x", " ", "-", "ab", "phone"]
+    for _ in range(200):
+        text = "".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        brute = sorted((i, i + len(w), w, kind) for w, kind in patterns
+                       for i in range(len(text)) if text.lower().startswith(w, i))
+        assert sorted(automaton.scan(text)) == brute
+
+
+def test_stamp_only_without_overlay_or_device_hits():
+    clean = safety.apply({"id": "x", "appearance_ru": "sexy coat"})
+    assert clean["appearance_ru"] == "magnetic coat"
+    assert clean["safety"] == safety.SCANNER.tag
+    flagged = safety.apply({"id": "y", "prompt": "holding phone, watermark", "safety": "stale"})
+    assert "safety" not in flagged
+
+
+def test_scan_lists_clean_ids_and_findings():
+    index = safety.scan({"joke": [{"id": "ok", "line_a": "fine"}, {"id": "bad", "line_b": "a logo here"}]})
+    assert index["spec"] == safety.SCANNER.tag
+    assert index["cleared"] == {"joke": ["ok"]}
+    assert index["findings"] == [{"kind": "joke", "id": "bad", "path": "line_b", "list": "overlay_words",
+                                  "word": "logo"}]
+
+
+def test_stamped_roster_is_what_the_client_loads(tmp_path):
+    current = {"id": "a", "appearance_ru": "sexy coat", "safety": safety.SCANNER.tag}
+    roster = safety.stamp([current, {"id": "b", "appearance_ru": "nude scarf", "safety": "stale"},
+                           {"id": "c", "prompt": "phone in hand"}])
+    assert roster[0] is current
+    assert roster[1] == {"id": "b", "appearance_ru": "bare-skinned scarf", "safety": safety.SCANNER.tag}
+    assert "safety" not in roster[2]
+    path, size = safety.write_roster(roster, tmp_path)
+    assert path == os.path.join(tmp_path, "characters.json") and os.path.getsize(path) == size
+    assert json.loads(open(path, encoding="utf-8").read()) == roster
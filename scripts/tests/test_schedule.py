@@ -0,0 +1,60 @@
+import pytest
+
+from databuild import CHARACTERS_PATH, load_json, schedule
+from databuild.affinity import JOKES_PATH, LOCATIONS_PATH
+
+CHARS, JOKES, LOCATIONS = load_json(CHARACTERS_PATH), load_json(JOKES_PATH), load_json(LOCATIONS_PATH)
+
+
+def replay(planner, plan, history=None):
+    return schedule.violations(plan, planner.chars, LOCATIONS, planner.loc_window, planner.joke_window,
+                               len(JOKES), char_window=planner.char_window, history=history)
+
+
+def history_of(plan, chars):
+    by_id = {c["id"]: c for c in chars}
+    scenes = {loc["id"]: loc["scene_en"] for loc in LOCATIONS}
+    return {"locations": [scenes[ep["location"]] for ep in plan],
+            "wardrobes": [schedule.wardrobe(by_id[ep[r]]) for ep in plan for r in ("a", "b")]}
+
+
+def test_plan_keeps_every_window():
+    planner = schedule.Planner(CHARS, JOKES, LOCATIONS)
+    plan = list(planner.plan(300))
+    assert [ep["n"] for ep in plan] == list(range(1, 301))
+    assert replay(planner, plan) == []
+
+
+def test_windows_the_cast_cannot_fill_are_relaxed():
+    cast = [c for c in CHARS if c["role_default"] == "A"][:6] + [c for c in CHARS if c["role_default"] == "B"][:6]
+    planner = schedule.Planner(cast, JOKES, LOCATIONS)
+    assert [dim for dim, *_ in planner.relaxed] == ["wardrobes"]
+    (_, asked, used, _), = planner.relaxed
+    assert asked == schedule.WINDOW // 2 and used == planner.char_window < asked
+    assert replay(planner, list(planner.plan(60))) == []
+
+
+def test_no_b_side_is_infeasible():
+    with pytest.raises(schedule.Infeasible, match="0 B wardrobes"):
+        schedule.Planner([c for c in CHARS if c["role_default"] == "A"], JOKES, LOCATIONS)
+
+
+def test_replay_starts_from_the_seeded_history():
+    first = schedule.Planner(CHARS, JOKES, LOCATIONS)
+    history = history_of(list(first.plan(15)), CHARS)
+
+    seeded = schedule.Planner(CHARS, JOKES, LOCATIONS)
+    seeded.seed_history(history)
+    assert replay(seeded, list(seeded.plan(40)), history) == []
+
+    # the same episodes again: clean on their own, repeats after that history
+    fresh = schedule.Planner(CHARS, JOKES, LOCATIONS)
+    plan = list(fresh.plan(15))
+    assert replay(fresh, plan) == []
+    assert any(err.startswith("episode 1: location") for err in replay(fresh, plan, history))
+
+
+def test_tail():
+    assert schedule._tail([1, 2, 3], 2) == [2, 3]
+    assert schedule._tail([1, 2, 3], 5) == [1, 2, 3]
+    assert schedule._tail([1, 2, 3], 0) == []
@@ -0,0 +1,41 @@
+from databuild import search
+
+DOCS = [
+    ("character", "buh", "Бухгалтер", [("Бухгалтер Зина", 3), ("считает всё до копейки", 1)]),
+    ("joke", "j1", "про бухгалтера", [("бухгалтера уволили", 3), ("бухгалтером быть тяжело", 1)]),
+    ("location", "office", "Офис", [("офис на пятом этаже", 2)]),
+    ("joke", "j2", "про ёлку", [("Ёлки-палки и ещё ёлки", 1)]),
+]
+
+
+def test_terms_normalize_like_the_client():
+    assert search.terms("Ёлки-палки, БАБУШКИ и бухгалтерами VEO3!") == ["елк", "палк", "бабушк", "бухгалтер", "veo3"]
+    assert search.stem("бухгалтера") == search.stem("бухгалтером") == "бухгалтер"
+    assert search.stem("вк") == "вк"
+
+
+def test_postings_are_delta_packed_with_capped_weights():
+    meta, shards = search.build(DOCS)
+    merged = {t: p for shard in shards for t, p in shard.items()}
+    assert meta["terms"] == len(merged)
+    assert search.unpack(merged["бухгалтер"]) == [(0, 3), (1, 4)]
+    assert search.unpack(merged["елк"]) == [(3, 2)]
+    heavy = search.build([("joke", "x", "x", [("слово " * 40, 1)])])[1]
+    assert search.unpack(heavy[0]["слов"]) == [(0, search.MAX_WEIGHT)]
+
+
+def test_search_ands_terms_and_ranks_by_weight(tmp_path):
+    search.dump(*search.build(DOCS), tmp_path)
+    ix = search.SearchIndex.load(tmp_path)
+    assert [r[1] for r in ix.search("бухгалтерами")] == ["j1", "buh"]
+    assert [r[1] for r in ix.search("бухгалтер уволили")] == ["j1"]
+    assert ix.search("бухгалтер", kind="character") == [("character", "buh", "Бухгалтер", 3)]
+    assert ix.search("и на") == [] and ix.search("нет такого") == []
+
+
+def test_small_shards_split_by_term_hash(monkeypatch):
+    monkeypatch.setattr(search, "SHARD_BYTES", 16)
+    meta, shards = search.build(DOCS)
+    assert meta["shards"] == len(shards) > 1
+    for k, shard in enumerate(shards):
+        assert all(search.fnv1a(t) % meta["shards"] == k for t in shard)
@@ -0,0 +1,48 @@
+import copy, json
+
+from bench_similarity import brute
+from databuild import CHARACTERS_PATH, SALTS, load_json, similarity
+
+CHARS = load_json(CHARACTERS_PATH)[:60]
+
+
+def twin(c, cid, **changes):
+    out = copy.deepcopy(c)
+    out.update(id=cid, **changes)
+    return out
+
+
+def test_near_clusters_match_all_pairs():
+    chars = CHARS + [twin(CHARS[0], "copy_0"), twin(CHARS[5], "copy_5", appearance_ru=CHARS[5]["appearance_ru"] + " и шарф")]
+    near = similarity.near_clusters(chars)
+    assert near == brute(chars, similarity.THRESHOLD)
+    assert [0, 60] in near and any({5, 61} <= set(cl) for cl in near)
+
+
+def test_exact_clusters_per_field():
+    chars = CHARS[:3] + [twin(CHARS[1], "copy_1", appearance_ru="другое описание")]
+    exact = similarity.exact_clusters(chars)
+    assert exact["character_en"] == [[1, 3]] and exact["identity_anchors"] == [[1, 3]]
+    assert exact["appearance_ru"] == [] and exact["all"] == []
+
+
+def test_reseed_stops_when_collisions_are_gone(tmp_path):
+    base = [CHARS[0], twin(CHARS[0], "copy_0")]
+
+    def run():
+        # a salted character gets a different face, like a new seed would give it
+        return [twin(c, c["id"], appearance_ru=f"{c['appearance_ru']} salt {SALTS.get(c['id'], 0)}",
+                     prompt_tokens={"character_en": f"face {c['id']} {SALTS.get(c['id'], 0)}"},
+                     identity_anchors={"k": c["id"] + str(SALTS.get(c["id"], 0))})
+                if SALTS.get(c["id"]) else c for c in base]
+
+    saved = dict(SALTS)
+    SALTS.clear()
+    try:
+        chars, rounds = similarity.reseed(run, path=tmp_path / "reseed.json")
+        assert rounds == [(0, 1, 1), (1, 0, 0)]
+        assert similarity.collisions(chars) == []
+        assert json.loads((tmp_path / "reseed.json").read_text()) == {"copy_0": 1}
+    finally:
+        SALTS.clear()
+        SALTS.update(saved)
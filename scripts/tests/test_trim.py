@@ -0,0 +1,43 @@
+from databuild import CHARACTERS_PATH, load_json, trim
+from databuild.affinity import JOKES_PATH
+
+JOKES = load_json(JOKES_PATH)[:40]
+CHARS = load_json(CHARACTERS_PATH)[:20]
+
+
+def test_steps():
+    assert trim.remove_pauses("раз | два | три") == ("раз | два три", "Убраны лишние паузы (было 2, оставлена 1)")
+    assert trim.remove_all_pauses("раз | два")[0] == "раз два"
+    assert trim.remove_fillers("Ну вот я пришла")[0] == "я пришла"
+    assert trim.shorten_long_words("Абсолютно согласна")[0] == "точно согласна"
+    assert trim.remove_fillers("я пришла") == ("я пришла", None)
+
+
+def test_truncate_keeps_hook_and_punchline():
+    words = [f"w{i}" for i in range(20)]
+    text, fix = trim.truncate_to_fit(" ".join(words), "A", "normal")
+    kept = text.split()
+    assert len(kept) <= trim.WORD_LIMITS["A"] and fix
+    assert kept[0] == "w0" and kept[-1] == "w19"
+
+
+def test_auto_trim_brings_a_long_line_down():
+    lines = [{"speaker": "A", "text": "Ну вот, короче, " + " ".join(["слово"] * 14), "pace": "slow"},
+             {"speaker": "B", "text": "Ага.", "pace": "slow"}]
+    r = trim.auto_trim(lines)
+    assert r["trimmed"] and r["auto_fixes"][0] == "A: Убраны вводные слова"
+    assert len(r["lines"][0]["text"].split()) <= trim.WORD_LIMITS["A"]
+    assert lines[0]["text"].startswith("Ну вот")
+
+
+def test_index_keeps_only_changed_variants():
+    index, stats = trim.build(JOKES, CHARS)
+    assert stats["dialogues"] == len(JOKES) * len(index["paces"]) ** 2
+    assert stats["estimates"] + stats["estimate_hits"] > stats["estimates"]
+    ix = trim.TrimIndex(index)
+    for j in JOKES:
+        for key, v in index["jokes"].get(j["id"], {}).items():
+            pa, pb = key.split("+")
+            assert ix.lines(j, pa, pb) == (v["line_a"], v["line_b"]) != (j["line_a"], j["line_b"])
+    plain = next(j for j in JOKES if j["id"] not in index["jokes"])
+    assert ix.lines(plain, "normal", "normal") == (plain["line_a"], plain["line_b"])
@@ -0,0 +1,60 @@
+import copy
+
+import pytest
+
+from databuild import CHARACTERS_PATH, load_json, validate
+
+CHECK = validate.compile_schema()
+RECORD = load_json(CHARACTERS_PATH)[0]
+
+
+def errors_of(record, check=CHECK):
+    errors = []
+    check(record, 3, errors)
+    return errors
+
+
+def test_shipped_roster_reports_its_short_skin_tokens():
+    errors = validate.validate_roster(load_json(CHARACTERS_PATH), CHECK)
+    assert errors
+    assert {(path.split(".", 1)[1], msg) for path, msg in errors} == {
+        ("biology_override.skin_tokens", "fewer than 2 items (1)")}
+
+
+@pytest.mark.parametrize("field, value, error", [
+    ("name_ru", 5, ("$[3].name_ru", "expected string, got integer")),
+    ("id", "Bad-Id", ("$[3].id", "does not match ^[a-z0-9_]+$")),
+    ("tags", "x", ("$[3].tags", "expected array, got string")),
+    ("tags", [1], ("$[3].tags[0]", "expected string, got integer")),
+    ("swear_level", 9, ("$[3].swear_level", "above maximum 3")),
+    ("swear_level", "2", ("$[3].swear_level", "expected integer, got string")),
+    ("modifiers", None, ("$[3].modifiers", "expected object, got null")),
+    ("appearance_ru", "short", ("$[3].appearance_ru", "shorter than 20 chars (5)")),
+])
+def test_field_errors(field, value, error):
+    assert errors_of(dict(copy.deepcopy(RECORD), **{field: value})) == [error]
+
+
+def test_missing_required_and_non_object():
+    record = copy.deepcopy(RECORD)
+    del record["group"]
+    assert errors_of(record) == [("$[3]", "missing required 'group'")]
+    assert errors_of("babka") == [("$[3]", "expected object, got string")]
+
+
+def test_keywords_without_a_type_are_guarded():
+    check = validate.compile_schema({"type": "object", "properties": {"x": {
+        "minLength": 2, "minimum": 1, "maxItems": 1, "required": ["y"]}}}, "untyped")
+    assert errors_of({"x": "a"}, check) == [("$[3].x", "shorter than 2 chars (1)")]
+    assert errors_of({"x": 0}, check) == [("$[3].x", "below minimum 1")]
+    assert errors_of({"x": [1, 2]}, check) == [("$[3].x", "more than 1 items (2)")]
+    assert errors_of({"x": {}}, check) == [("$[3].x", "missing required 'y'")]
+    assert errors_of({"x": None}, check) == []
+
+
+def test_roster_rules():
+    other = dict(RECORD, id=7)
+    assert validate.validate_roster([RECORD, RECORD, other], CHECK) == [
+        ("$[1].id", f"duplicate id '{RECORD['id']}' (first at $[0])"),
+        ("$[2].id", "expected string, got integer"),
+    ]
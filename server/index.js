@@ -590,7 +590,7 @@ function buildAIPrompt(ctx) {
   const { charA, charB, category, topic_ru, scene_hint, input_mode, video_meta,
     product_info, location, wardrobeA, wardrobeB, propAnchor, lightingMood,
     hookAction, releaseAction, aesthetic, script_ru, cinematography,
-    remake_mode, remake_instruction, thread_memory, soloMode, enableLaughter } = ctx;
+    remake_mode, remake_instruction, thread_memory, soloMode, enableLaughter, reference_jokes } = ctx;
 
   // Video mode with placeholder: Gemini must analyze original video for characters
   const isVideoPlaceholder = input_mode === 'video' && (charA?.id === 'video_original' || !charA?.prompt_tokens?.character_en);
@@ -602,6 +602,13 @@ function buildAIPrompt(ctx) {
     threadBlock = `\n══════════ ПРЕДЫДУЩИЕ ГЕНЕРАЦИИ (НЕ ПОВТОРЯЙ!) ══════════\nПользователь уже генерировал следующие диалоги. ПРИДУМАЙ НОВЫЙ, НЕПОХОЖИЙ диалог с другой темой, другими словами, другим углом юмора:\n${items}\n`;
   }
 
+  // ── REFERENCE JOKES (jokes.json via affinity index — tone only) ──
+  let jokesBlock = '';
+  if (Array.isArray(reference_jokes) && reference_jokes.length > 0) {
+    const items = reference_jokes.map((j, i) => `  ${i + 1}. A: "${j.A}" | B: "${j.B}"`).join('\n');
+    jokesBlock = `\n══════════ РЕФЕРЕНСЫ ЮМОРА ДЛЯ ЭТИХ ПЕРСОНАЖЕЙ ══════════\nЛучшие шутки из базы для групп этих персонажей. Ориентир по тону и ритму — НЕ КОПИРУЙ их:\n${items}\n`;
+  }
+
   // ── MODE-SPECIFIC TASK BLOCK ──
   let taskBlock = '';
 
@@ -928,7 +935,7 @@ ${soloMode
   ? 'Формат: СОЛО — один русский персонаж говорит прямо в камеру (selfie POV, вертикальное 9:16). Монолог, без второго персонажа.'
   : 'Формат: два русских персонажа спорят перед камерой (selfie POV, вертикальное 9:16).'}
 Результат: готовый к копированию промпт + уникальный диалог + вирусная упаковка.
-${threadBlock}${taskBlock}
+${threadBlock}${jokesBlock}${taskBlock}
 ${productBlock}
 
 ════════════════════════════════════════════════════════════════
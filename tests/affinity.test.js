@@ -0,0 +1,42 @@
+import { describe, it, expect } from 'vitest';
+import { AffinityIndex } from '../app/engine/affinity.js';
+
+const INDEX = {
+  version: 1,
+  jokes: ['j1', 'j2', 'j3', 'j4'],
+  viral: [70, 95, 80, 95],
+  locations: ['kitchen', 'balcony', 'bazaar'],
+  group_jokes: { бабки: [1, 2, 0], деды: [3, 2] },
+  theme_jokes: { семья: [1, 0] },
+  location_jokes: { kitchen: [2] },
+  tag_locations: { indoor: [0, 1] },
+  category_locations: { 'Бытовой абсурд': [0, 1], 'Цены и инфляция': [2] },
+};
+const JOKES = [{ id: 'j2', line_a: 'A2', line_b: 'B2' }];
+
+describe('AffinityIndex', () => {
+  const ix = new AffinityIndex(INDEX, JOKES);
+
+  it('reads postings by one lookup, in build order', () => {
+    expect(ix.jokesForGroup('бабки')).toEqual(['j2', 'j3', 'j1']);
+    expect(ix.jokesForGroup('бабки', 2)).toEqual(['j2', 'j3']);
+    expect(ix.jokesForLocation('kitchen')).toEqual(['j3']);
+    expect(ix.locationsForCategory('Бытовой абсурд')).toEqual(['kitchen', 'balcony']);
+    expect(ix.locationsForTag('outdoor')).toEqual([]);
+  });
+
+  it('merges two groups by viral_score without duplicates', () => {
+    expect(ix.jokesForPair('бабки', 'деды')).toEqual(['j2', 'j4', 'j3', 'j1']);
+    expect(ix.jokesForPair('бабки', 'деды', 2)).toEqual(['j2', 'j4']);
+    expect(ix.jokesForPair('деды', 'деды')).toEqual(['j4', 'j3']);
+  });
+
+  it('resolves joke records it was given', () => {
+    expect(ix.joke('j2').line_b).toBe('B2');
+    expect(ix.joke('j1')).toBeNull();
+  });
+
+  it('rejects an unknown index version', () => {
+    expect(() => new AffinityIndex({ ...INDEX, version: 2 })).toThrow();
+  });
+});
@@ -0,0 +1,74 @@
+import { describe, it, expect } from 'vitest';
+import { parseRoster } from '../app/engine/roster_bin.js';
+
+// Собирает roster.bin так же, как scripts/databuild/binroster.py
+function build(columns, rows, values) {
+  const enc = new TextEncoder();
+  const pad = (n) => (4 - (n % 4)) % 4;
+  const blobs = values.map(([, text]) => enc.encode(text));
+  const offsets = [0];
+  for (const b of blobs) offsets.push(offsets[offsets.length - 1] + b.length);
+  const sections = [
+    ['cells', new Uint8Array(new Uint32Array(rows.flat()).buffer)],
+    ['offsets', new Uint8Array(new Uint32Array(offsets).buffer)],
+    ['kinds', new Uint8Array(values.map(([kind]) => kind))],
+    ['blob', new Uint8Array(blobs.reduce((acc, b) => [...acc, ...b], []))],
+  ];
+  const header = { version: 1, records: rows.length, columns, values: values.length, layout: {} };
+  let head;
+  for (let round = 0; round < 3; round++) {
+    const text = JSON.stringify(header);
+    head = enc.encode(text + ' '.repeat(pad(enc.encode(text).length)));
+    let pos = 8 + head.length;
+    for (const [name, data] of sections) {
+      header.layout[name] = pos;
+      pos += data.length + pad(data.length);
+    }
+  }
+  const parts = [enc.encode('FXRB'), new Uint8Array(new Uint32Array([head.length]).buffer), head];
+  for (const [, data] of sections) parts.push(data, new Uint8Array(pad(data.length)));
+  const out = new Uint8Array(parts.reduce((n, p) => n + p.length, 0));
+  let pos = 0;
+  for (const p of parts) { out.set(p, pos); pos += p.length; }
+  return out.buffer;
+}
+
+const NONE = 0xFFFFFFFF;
+const roster = () => parseRoster(build(
+  ['id', 'name_ru', 'identity_anchors.wardrobe_anchor', 'signature_words_ru'],
+  [[0, 1, 2, 3], [4, 5, 2, NONE]],
+  [[0, 'babka_zina'], [0, 'Бабка Зина'], [0, 'цветастый халат'], [1, '["ну","ёлки"]'], [0, 'ded_petya'], [0, 'Дед Петя']],
+));
+
+describe('parseRoster', () => {
+  it('rejects a foreign file', () => {
+    expect(() => parseRoster(new Uint8Array(16).buffer)).toThrow('bad magic');
+  });
+
+  it('reads single fields without materializing records', () => {
+    const r = roster();
+    expect(r.length).toBe(2);
+    expect(r.field(0, 'name_ru')).toBe('Бабка Зина');
+    expect(r.field(1, 'identity_anchors.wardrobe_anchor')).toBe('цветастый халат');
+    expect(r.field(0, 'signature_words_ru')).toEqual(['ну', 'ёлки']);
+  });
+
+  it('returns undefined for absent fields and unknown columns', () => {
+    const r = roster();
+    expect(r.field(1, 'signature_words_ru')).toBeUndefined();
+    expect(r.field(0, 'no_such_field')).toBeUndefined();
+  });
+
+  it('rebuilds nested records and looks them up by id', () => {
+    const r = roster();
+    expect(r.record(0)).toEqual({
+      id: 'babka_zina',
+      name_ru: 'Бабка Зина',
+      identity_anchors: { wardrobe_anchor: 'цветастый халат' },
+      signature_words_ru: ['ну', 'ёлки'],
+    });
+    expect(r.byId('ded_petya').name_ru).toBe('Дед Петя');
+    expect(r.byId('nobody')).toBeNull();
+    expect(r.toArray()).toHaveLength(2);
+  });
+});
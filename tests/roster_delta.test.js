@@ -0,0 +1,47 @@
+import { describe, it, expect } from 'vitest';
+import { applyPatch, mergeApply } from '../app/engine/roster_delta.js';
+
+const OLD = [
+  { id: 'babka_zina', name_ru: 'Бабка Зина', tags: ['бабка'], identity_anchors: { face_silhouette: 'круглое', wardrobe_anchor: 'халат' } },
+  { id: 'ded_petya', name_ru: 'Дед Петя', tags: ['дед'] },
+  { id: 'mama_lena', name_ru: 'Мама Лена', tags: ['мама'] },
+];
+
+describe('mergeApply', () => {
+  it('replaces, adds and removes fields (null = removed)', () => {
+    const r = mergeApply({ a: 1, b: { c: 2, d: 3 }, e: [1] }, { a: 5, b: { d: null, f: 4 }, e: [2, 3] });
+    expect(r).toEqual({ a: 5, b: { c: 2, f: 4 }, e: [2, 3] });
+  });
+
+  it('does not mutate the target', () => {
+    const target = { a: { b: 1 } };
+    mergeApply(target, { a: { b: 2 } });
+    expect(target.a.b).toBe(1);
+  });
+});
+
+describe('applyPatch', () => {
+  it('patches fields, removes and appends characters', () => {
+    const patch = {
+      version: 1, from: 'aaaaaaaaaaaa', to: 'bbbbbbbbbbbb', count: 3,
+      remove: ['ded_petya'],
+      add: [{ id: 'dyadya_vova', name_ru: 'Дядя Вова', tags: [] }],
+      patch: { babka_zina: { identity_anchors: { wardrobe_anchor: 'пальто' } }, mama_lena: { tags: null } },
+    };
+    const r = applyPatch(OLD, patch);
+    expect(r.map(c => c.id)).toEqual(['babka_zina', 'mama_lena', 'dyadya_vova']);
+    expect(r[0].identity_anchors).toEqual({ face_silhouette: 'круглое', wardrobe_anchor: 'пальто' });
+    expect('tags' in r[1]).toBe(false);
+    expect(OLD[0].identity_anchors.wardrobe_anchor).toBe('халат');
+  });
+
+  it('reorders when the patch carries an order', () => {
+    const patch = { version: 1, count: 3, remove: [], add: [], patch: {}, order: ['mama_lena', 'babka_zina', 'ded_petya'] };
+    expect(applyPatch(OLD, patch).map(c => c.id)).toEqual(['mama_lena', 'babka_zina', 'ded_petya']);
+  });
+
+  it('rejects a patch for another roster', () => {
+    const patch = { version: 1, from: 'x', to: 'y', count: 5, remove: [], add: [], patch: {} };
+    expect(() => applyPatch(OLD, patch)).toThrow('expected 5');
+  });
+});
@@ -0,0 +1,31 @@
+import { describe, it, expect } from 'vitest';
+import { stem, terms, fnv1a, unpack } from '../app/engine/search.js';
+
+describe('search normalization', () => {
+  it('folds case and ё, drops stopwords, stems Russian words', () => {
+    expect(terms('Ёлки-палки, БАБУШКИ и бухгалтерами VEO3!')).toEqual(['елк', 'палк', 'бабушк', 'бухгалтер', 'veo3']);
+  });
+
+  it('maps word forms to one stem', () => {
+    expect(stem('бухгалтера')).toBe('бухгалтер');
+    expect(stem('бухгалтером')).toBe('бухгалтер');
+    expect(stem('бабушка')).toBe(stem('бабушки'));
+    expect(stem('красивейший')).toBe('красив');
+  });
+
+  it('leaves words without a vowel alone', () => {
+    expect(stem('вк')).toBe('вк');
+  });
+});
+
+describe('search index encoding', () => {
+  it('hashes terms like search.py (fnv1a over UTF-8)', () => {
+    expect(fnv1a('a')).toBe(3826002220);
+    expect(fnv1a('бабк')).toBe(732168935);
+  });
+
+  it('unpacks delta-encoded postings', () => {
+    expect(unpack([(1 << 4) | 3, (2 << 4) | 1])).toEqual([[1, 3], [3, 1]]);
+    expect(unpack([])).toEqual([]);
+  });
+});
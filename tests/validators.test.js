@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { scanBannedWords, validateTimingGrid, validateTwoSpeakers, validateNoOverlays, validateDeviceInvisible, validateWordCount, validateIdentityAnchors } from '../app/engine/validators.js';
+import { scanBannedWords, validateTimingGrid, validateTwoSpeakers, validateNoOverlays, validateDeviceInvisible, validateWordCount, validateIdentityAnchors, SAFETY_SPEC, isPreCleared, clearRecord, runAllValidations } from '../app/engine/validators.js';
 
 describe('scanBannedWords', () => {
   it('replaces banned words', () => {
@@ -168,3 +168,46 @@ describe('validateDeviceInvisible', () => {
     expect(r.valid).toBe(true);
   });
 });
+
+describe('clearRecord', () => {
+  it('matches the build-time spec tag of golden_standard.yaml', () => {
+    // scripts/databuild/safety.py spec_tag() over the same lists
+    expect(SAFETY_SPEC).toBe('92fffcb7');
+  });
+
+  it('skips records cleared at build time', () => {
+    const rec = { id: 'x', safety: SAFETY_SPEC, prompt_tokens: { character_en: 'sexy' } };
+    const r = clearRecord(rec);
+    expect(r.skipped).toBe(true);
+    expect(r.record).toBe(rec);
+    expect(isPreCleared({ id: 'loc' }, new Set(['loc']))).toBe(true);
+  });
+
+  it('scans every string of an uncleared record', () => {
+    const rec = { id: 'x', safety: 'deadbeef', tags: ['Nude lipstick'], anchors: { face: 'no logo, sexy' }, n: 3 };
+    const r = clearRecord(rec);
+    expect(r.skipped).toBe(false);
+    expect(r.record.tags).toEqual(['bare-skinned lipstick']);
+    expect(r.record.anchors.face).toBe('no logo, magnetic');
+    expect(r.fixes).toHaveLength(2);
+    expect(r.warnings).toContain('Overlay reference found: "logo"');
+  });
+
+  it('returns a clean record unchanged', () => {
+    const rec = { id: 'y', name_ru: 'Бабка Зина' };
+    expect(clearRecord(rec).record).toBe(rec);
+  });
+});
+
+describe('runAllValidations', () => {
+  const output = { video_prompt_en_json: { character: 'nude lipstick' }, photo_prompt_en_json: { scene: 'kitchen' } };
+
+  it('scans the whole prompt by default', () => {
+    expect(runAllValidations(output).warnings).toContain('Banned word "nude" found');
+  });
+
+  it('scans only the free text when the records are pre-cleared', () => {
+    expect(runAllValidations(output, null, { freeText: ['про цены', null] }).warnings).toEqual([]);
+    expect(runAllValidations(output, null, { freeText: ['sexy тема'] }).auto_fixes).toEqual(['Replaced "sexy" → "magnetic"']);
+  });
+});
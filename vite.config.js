@@ -1,8 +1,28 @@
 import { defineConfig } from 'vite';
+import { cpSync, existsSync } from 'fs';
 import { resolve } from 'path';
 
+// app/data/chars/ and app/data/index/ are built by scripts/build_chars.py and
+// build_index.py (gitignored) and fetched by path at runtime; the delta manifest
+// falls back to data/characters.json by path too. Copy them into dist as they are.
+const BUILD_DATA = ['data/chars', 'data/index', 'data/characters.json'];
+
+function copyBuildData() {
+  return {
+    name: 'copy-build-data',
+    apply: 'build',
+    closeBundle() {
+      for (const path of BUILD_DATA) {
+        const src = resolve(__dirname, 'app', path);
+        if (existsSync(src)) cpSync(src, resolve(__dirname, 'dist', path), { recursive: true });
+      }
+    },
+  };
+}
+
 export default defineConfig({
   root: 'app',
+  plugins: [copyBuildData()],
   base: '/ferixdi_studio/',
   build: {
     outDir: '../dist',